@@ -0,0 +1,202 @@
+"""
+Load test for the /api/v1 service reporting latency percentiles.
+
+Without --url, fills a database with synthetic scored articles and serves
+it with uvicorn in a separate process, so the client does not compete with
+the server for the interpreter. Each scenario then sends --requests requests
+from --concurrency concurrent keep-alive connections, spread over --clients
+client processes (a single Python HTTP client saturates well before the
+server does), and reports throughput and p50/p90/p99 latency:
+
+    uncached     distinct (symbol, days) per request, so every request
+                 queries the database and scores articles
+    cached       a handful of hot symbols served from the response cache
+    revalidate   If-None-Match with the current ETag (304, no body)
+    batch        POST /sentiment/batch with --batch-size symbols
+
+Usage:
+    python benchmarks/bench_api.py [--rows 200000] [--symbols 500]
+        [--requests 2000] [--concurrency 64] [--clients 4] [--workers 1]
+        [--url http://host:8000 --key KEY]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+import httpx
+import numpy as np
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from src.database.database import Database  # noqa: E402
+
+WORDS = ('shares surge rally gains beat record strong growth upgrade '
+         'fall drop loss miss weak lawsuit downgrade probe recall cut').split()
+
+
+def fill(path: str, rows: int, symbols: int):
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    db = Database({'db_path': path})
+    batch = []
+    for i in range(rows):
+        words = ' '.join(rng.choices(WORDS, k=12))
+        compound = rng.uniform(-1, 1)
+        batch.append({
+            'symbol': f'SYM{i % symbols}',
+            'title': words[:60],
+            'content': words,
+            'source': rng.choice(('Reuters', 'Bloomberg', 'Yahoo Finance')),
+            'url': f'https://example.com/{i}',
+            'published_at': (now - timedelta(minutes=rng.randrange(60 * 24 * 30))).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'sentiment': {'compound': compound},
+        })
+        if len(batch) == 10000:
+            db.save_news(batch)
+            batch = []
+    db.save_news(batch)
+    db.close()
+
+
+def serve(path: str, key: str, workers: int) -> tuple:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    env = dict(os.environ, DB_PATH=path, API_KEYS=f'{key}:enterprise', LOG_LEVEL='WARNING')
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', '--factory', 'src.api.server:create_app',
+         '--host', '127.0.0.1', '--port', str(port), '--workers', str(workers),
+         '--log-level', 'warning', '--no-access-log'],
+        cwd=ROOT, env=env)
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return f'http://127.0.0.1:{port}', process
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("Server did not start")
+
+
+def make_request(scenario: str, i: int, ctx: dict) -> tuple:
+    symbols, hot = ctx['symbols'], ctx['hot']
+    if scenario == 'uncached':
+        return 'GET', f'/api/v1/sentiment/{symbols[i % len(symbols)]}', \
+            {'params': {'days': 1 + (i // len(symbols)) % 365}}
+    if scenario == 'cached':
+        return 'GET', f'/api/v1/sentiment/{hot[i % len(hot)]}', {}
+    if scenario == 'revalidate':
+        symbol = hot[i % len(hot)]
+        return 'GET', f'/api/v1/sentiment/{symbol}', \
+            {'headers': {'If-None-Match': ctx['etags'][symbol]}}
+    return 'POST', '/api/v1/sentiment/batch', \
+        {'json': {'symbols': random.Random(i).sample(symbols, ctx['batch_size']), 'days': 7}}
+
+
+async def drive(url: str, key: str, scenario: str, indices: range, concurrency: int,
+                ctx: dict) -> tuple:
+    latencies = []
+    statuses = {}
+    counter = iter(indices)
+
+    async def worker(client: httpx.AsyncClient):
+        for i in counter:
+            method, path, kwargs = make_request(scenario, i, ctx)
+            start = time.perf_counter()
+            response = await client.request(method, path, **kwargs)
+            latencies.append(time.perf_counter() - start)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=120,
+                                 headers={'Authorization': f'Bearer {key}'}) as client:
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+    return latencies, statuses
+
+
+def client_process(*args) -> tuple:
+    return asyncio.run(drive(*args))
+
+
+def run_scenario(pool: ProcessPoolExecutor, url: str, key: str, scenario: str,
+                 args, ctx: dict) -> dict:
+    clients = args.clients
+    start = time.perf_counter()
+    parts = list(pool.map(client_process, [url] * clients, [key] * clients, [scenario] * clients,
+                          [range(c, args.requests, clients) for c in range(clients)],
+                          [max(1, args.concurrency // clients)] * clients, [ctx] * clients))
+    elapsed = time.perf_counter() - start
+
+    ms = np.array([latency for latencies, _ in parts for latency in latencies]) * 1000
+    statuses = {}
+    for _, part in parts:
+        for status, count in part.items():
+            statuses[status] = statuses.get(status, 0) + count
+    return {'rps': len(ms) / elapsed, 'p50': np.percentile(ms, 50),
+            'p90': np.percentile(ms, 90), 'p99': np.percentile(ms, 99), 'statuses': statuses}
+
+
+def benchmark(url: str, key: str, args) -> dict:
+    symbols = [f'SYM{i}' for i in range(args.symbols)]
+    ctx = {'symbols': symbols, 'hot': symbols[:8], 'batch_size': args.batch_size}
+
+    # Warm the hot keys and collect their ETags
+    with httpx.Client(base_url=url, headers={'Authorization': f'Bearer {key}'}) as client:
+        ctx['etags'] = {symbol: client.get(f'/api/v1/sentiment/{symbol}').headers['etag']
+                        for symbol in ctx['hot']}
+
+    with ProcessPoolExecutor(args.clients) as pool:
+        # Start the client processes before timing anything
+        list(pool.map(time.sleep, [0.1] * args.clients))
+        return {scenario: run_scenario(pool, url, key, scenario, args, ctx)
+                for scenario in ('uncached', 'cached', 'revalidate', 'batch')}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--symbols', type=int, default=500)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--batch-size', type=int, default=10)
+    parser.add_argument('--clients', type=int, default=4, help='Client processes')
+    parser.add_argument('--workers', type=int, default=1, help='uvicorn worker processes')
+    parser.add_argument('--url', help='Benchmark a running server instead')
+    parser.add_argument('--key', default='bench', help='API key for --url (enterprise plan)')
+    args = parser.parse_args()
+
+    if args.url:
+        results = benchmark(args.url, args.key, args)
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'bench.db')
+            start = time.perf_counter()
+            fill(path, args.rows, args.symbols)
+            print(f"filled {args.rows} rows in {time.perf_counter() - start:.1f}s")
+
+            url, process = serve(path, args.key, args.workers)
+            try:
+                results = benchmark(url, args.key, args)
+            finally:
+                process.terminate()
+                process.wait()
+
+    print(f"requests={args.requests} concurrency={args.concurrency} clients={args.clients} "
+          f"symbols={args.symbols} workers={args.workers}")
+    for name, result in results.items():
+        print(f"{name:12s} {result['rps']:8.0f} req/s  p50={result['p50']:7.1f}ms  "
+              f"p90={result['p90']:7.1f}ms  p99={result['p99']:7.1f}ms  status={result['statuses']}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark for query latency before and after the indexed schema.
+
+Fills a database at schema version 1 (no indexes), times the queries
+behind Database.query_news and Database.clean_data, applies the pending
+migrations and times them again.
+
+Usage:
+    python benchmarks/bench_query_news.py [--rows 1000000] [--symbols 2000]
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.database.migrations import SCHEMA_VERSION, migrate  # noqa: E402
+
+QUERIES = {
+    'query_news (symbol, 30 days)': ("""
+        SELECT n.*, s.compound, s.positive, s.neutral, s.negative
+        FROM news n
+        LEFT JOIN sentiment s ON n.id = s.news_id
+        WHERE n.symbol = ? AND n.published_at >= date('now', '-30 days')
+        """, ('SYM7',)),
+    'clean_data sentiment scan': ("""
+        SELECT COUNT(*) FROM sentiment
+        WHERE news_id IN (SELECT id FROM news WHERE published_at < date('now', '-365 days'))
+        """, ()),
+    'clean_data news scan': ("""
+        SELECT COUNT(*) FROM news WHERE published_at < date('now', '-365 days')
+        """, ()),
+}
+
+
+def fill(conn: sqlite3.Connection, rows: int, symbols: int, batch: int = 100000):
+    now = datetime.utcnow()
+    for start in range(0, rows, batch):
+        ids = range(start + 1, min(rows, start + batch) + 1)
+        conn.executemany(
+            "INSERT INTO news (id, symbol, title, content, source, url, published_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(i, f'SYM{i % symbols}', f'Headline {i}', 'Body text', 'Reuters',
+              f'https://example.com/{i}',
+              (now - timedelta(minutes=i % (60 * 24 * 730))).strftime('%Y-%m-%dT%H:%M:%SZ'))
+             for i in ids])
+        conn.executemany("INSERT INTO sentiment (news_id, compound) VALUES (?, ?)",
+                         [(i, 0.1) for i in ids])
+        conn.commit()
+
+
+def time_queries(conn: sqlite3.Connection, repeat: int) -> dict:
+    timings = {}
+    for name, (sql, params) in QUERIES.items():
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            conn.execute(sql, params).fetchall()
+            best = min(best, time.perf_counter() - start)
+        timings[name] = best
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--symbols', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(os.path.join(tmp, 'bench.db'))
+        migrate(conn, target=1)
+        fill(conn, args.rows, args.symbols)
+        before = time_queries(conn, args.repeat)
+
+        start = time.perf_counter()
+        migrate(conn)
+        migration_time = time.perf_counter() - start
+        after = time_queries(conn, args.repeat)
+        conn.close()
+
+    print(f"rows={args.rows} symbols={args.symbols} "
+          f"migration to v{SCHEMA_VERSION}: {migration_time:.1f}s")
+    for name in QUERIES:
+        print(f"{name:32s} before={before[name] * 1000:9.1f}ms  after={after[name] * 1000:9.1f}ms  "
+              f"speedup={before[name] / after[name]:.0f}x")
+
+
+if __name__ == '__main__':
+    main()
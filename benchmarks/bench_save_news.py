@@ -0,0 +1,86 @@
+"""
+Benchmark for Database.save_news.
+
+Compares the previous row-at-a-time insert loop with the batched
+executemany path on a fresh SQLite file.
+
+Usage:
+    python benchmarks/bench_save_news.py [--articles 100000] [--batch-size 5000]
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.database.database import Database  # noqa: E402
+
+
+def make_articles(count: int):
+    return [{
+        'symbol': f'SYM{i % 500}',
+        'title': f'Headline {i}',
+        'content': 'Lorem ipsum dolor sit amet ' * 4,
+        'source': 'Reuters',
+        'url': f'https://example.com/news/{i}',
+        'published_at': '2024-01-01T00:00:00Z',
+        'sentiment': {'compound': 0.5, 'pos': 0.3, 'neu': 0.6, 'neg': 0.1}
+    } for i in range(count)]
+
+
+def save_row_by_row(db_path: str, news):
+    """The previous save_news implementation"""
+    with sqlite3.connect(db_path) as conn:
+        cursor = conn.cursor()
+        for article in news:
+            cursor.execute("""
+            INSERT INTO news (symbol, title, content, source, url, published_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """, (article['symbol'], article['title'], article.get('content'),
+                  article.get('source'), article.get('url'), article.get('published_at')))
+            news_id = cursor.lastrowid
+            cursor.execute("""
+            INSERT INTO sentiment (news_id, compound, positive, neutral, negative)
+            VALUES (?, ?, ?, ?, ?)
+            """, (news_id, article['sentiment'].get('compound'), article['sentiment'].get('pos'),
+                  article['sentiment'].get('neu'), article['sentiment'].get('neg')))
+        conn.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--articles', type=int, default=100000)
+    parser.add_argument('--batch-size', type=int, default=5000)
+    args = parser.parse_args()
+
+    news = make_articles(args.articles)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        before = Database({'db_path': os.path.join(tmp, 'before.db')})
+        start = time.perf_counter()
+        save_row_by_row(before.db_path, news)
+        before_time = time.perf_counter() - start
+
+        after = Database({'db_path': os.path.join(tmp, 'after.db')})
+        start = time.perf_counter()
+        assert after.save_news(news, batch_size=args.batch_size)
+        after_time = time.perf_counter() - start
+
+        with sqlite3.connect(after.db_path) as conn:
+            linked = conn.execute("""
+            SELECT COUNT(*) FROM sentiment s JOIN news n ON n.id = s.news_id
+            """).fetchone()[0]
+        assert linked == args.articles
+
+    print(f"articles={args.articles} batch_size={args.batch_size}")
+    print(f"row-by-row: {args.articles / before_time:10.0f} rows/sec")
+    print(f"bulk:       {args.articles / after_time:10.0f} rows/sec  "
+          f"speedup={before_time / after_time:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
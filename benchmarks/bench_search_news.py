@@ -0,0 +1,127 @@
+"""
+Benchmark for keyword search with LIKE scans versus the FTS5 index.
+
+Fills a database with synthetic articles drawn from a fixed vocabulary,
+times LIKE queries over title and content (first matches and all
+matches), builds the full-text index by migrating to the current schema,
+and times the equivalent BM25-ranked Database.search_news queries.
+
+Usage:
+    python benchmarks/bench_search_news.py [--rows 1000000] [--symbols 2000]
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.database.database import Database  # noqa: E402
+from src.database.migrations import migrate  # noqa: E402
+
+VOCABULARY = (
+    'shares stock market investors quarter revenue profit guidance analysts rating '
+    'upgrade downgrade growth margin outlook board dividend earnings forecast sales '
+    'demand supply chain costs inflation rates federal reserve bond yields trading '
+    'volume price target acquisition deal regulators lawsuit settlement executive '
+    'chief officer strategy expansion product launch customers cloud software chips '
+    'energy oil retail consumer spending banks lending credit debt cash flow'
+).split()
+
+# Rare terms and phrases planted in a known fraction of articles
+PLANTED = ['merger', 'share buyback', 'product recall', 'accounting probe']
+
+# name: (LIKE condition and parameters, FTS5 query, symbol filter)
+QUERIES = {
+    'rare term': ("(title LIKE ? OR content LIKE ?)", ('%merger%',) * 2, 'merger', None),
+    'phrase': ("(title LIKE ? OR content LIKE ?)", ('%share buyback%',) * 2,
+               '"share buyback"', None),
+    'two terms': ("(title LIKE ? OR content LIKE ?) AND (title LIKE ? OR content LIKE ?)",
+                  ('%recall%',) * 2 + ('%probe%',) * 2, 'recall AND probe', None),
+    'rare term, one symbol': ("symbol = ? AND (title LIKE ? OR content LIKE ?)",
+                              ('SYM7', '%merger%', '%merger%'), 'merger', 'SYM7'),
+}
+
+
+def fill(conn: sqlite3.Connection, rows: int, symbols: int, batch: int = 100000):
+    rng = random.Random(42)
+    now = datetime.utcnow()
+
+    def text(words: int) -> str:
+        chosen = rng.choices(VOCABULARY, k=words)
+        if rng.random() < 0.01:
+            chosen.insert(rng.randrange(words), rng.choice(PLANTED))
+        return ' '.join(chosen)
+
+    for start in range(0, rows, batch):
+        ids = range(start + 1, min(rows, start + batch) + 1)
+        conn.executemany(
+            "INSERT INTO news (id, symbol, title, content, source, url, published_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(i, f'SYM{i % symbols}', text(8), text(60), 'Reuters', f'https://example.com/{i}',
+              (now - timedelta(minutes=i % (60 * 24 * 730))).strftime('%Y-%m-%dT%H:%M:%SZ'))
+             for i in ids])
+        conn.commit()
+
+
+def best_of(repeat: int, call) -> tuple:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = call()
+        best = min(best, time.perf_counter() - start)
+    return best, count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--symbols', type=int, default=2000)
+    parser.add_argument('--limit', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.db')
+        conn = sqlite3.connect(path)
+        migrate(conn, target=3)
+        fill(conn, args.rows, args.symbols)
+
+        first, every = {}, {}
+        for name, (condition, params, _, _) in QUERIES.items():
+            # A LIKE scan can stop at the first matches, but finding the best
+            # ones means visiting every match
+            sql = f"SELECT id FROM news WHERE {condition}"
+            first[name] = best_of(args.repeat, lambda: len(
+                conn.execute(f"{sql} LIMIT {args.limit}", params).fetchall()))
+            every[name] = best_of(args.repeat, lambda: len(
+                conn.execute(sql, params).fetchall()))
+
+        start = time.perf_counter()
+        migrate(conn)
+        index_time = time.perf_counter() - start
+        conn.close()
+
+        db = Database({'db_path': path})
+        fts = {}
+        for name, (_, _, query, symbol) in QUERIES.items():
+            fts[name] = best_of(args.repeat,
+                                lambda: len(db.search_news(query, symbol, limit=args.limit)))
+        db.close()
+
+    print(f"rows={args.rows} symbols={args.symbols} limit={args.limit} "
+          f"index build: {index_time:.1f}s")
+    for name in QUERIES:
+        (first_time, _), (every_time, matches), (fts_time, hits) = \
+            first[name], every[name], fts[name]
+        print(f"{name:22s} matches={matches:6d}  LIKE first {args.limit}={first_time * 1000:7.1f}ms  "
+              f"LIKE all={every_time * 1000:7.1f}ms  FTS5 top {hits}={fts_time * 1000:6.1f}ms  "
+              f"speedup vs all={every_time / fts_time:.1f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark for batched VADER scoring.
+
+Compares SentimentAnalyzer.analyze_sentiment (per-article loop) with
+SentimentAnalyzer.analyze_batch on synthetic articles, where a share of
+titles and contents are syndicated copies.
+
+Usage:
+    python benchmarks/bench_sentiment_batch.py [--articles 5000] [--duplicate-ratio 0.3]
+"""
+
+import argparse
+import copy
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.sentiment_analyzer.sentiment_analyzer import SentimentAnalyzer  # noqa: E402
+
+WORDS = ('stock shares rally surge plunge beat miss record strong weak growth loss '
+         'profit guidance upgrade downgrade investors market quarter revenue earnings '
+         'great terrible good bad outlook concern risk gain').split()
+
+
+def sentence(rng: random.Random, length: int) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(length))
+
+
+def make_articles(count: int, duplicate_ratio: float, seed: int = 7):
+    rng = random.Random(seed)
+    originals = []
+    articles = []
+    for _ in range(count):
+        if originals and rng.random() < duplicate_ratio:
+            articles.append(copy.deepcopy(rng.choice(originals)))
+            continue
+        article = {
+            'title': sentence(rng, 10),
+            'content': ' '.join(sentence(rng, 20) + '.' for _ in range(8)),
+            'comments': [sentence(rng, 12) for _ in range(rng.randint(0, 5))]
+        }
+        originals.append(article)
+        articles.append(article)
+    return articles
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--articles', type=int, default=5000)
+    parser.add_argument('--duplicate-ratio', type=float, default=0.3)
+    args = parser.parse_args()
+
+    analyzer = SentimentAnalyzer()
+    articles = make_articles(args.articles, args.duplicate_ratio)
+
+    looped = copy.deepcopy(articles)
+    start = time.perf_counter()
+    analyzer.analyze_sentiment(looped)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    frame = analyzer.analyze_batch(articles)
+    batch_time = time.perf_counter() - start
+
+    expected = np.array([a['sentiment']['compound'] for a in looped])
+    assert np.allclose(frame['compound'].to_numpy(), expected)
+
+    print(f"articles={args.articles} duplicate_ratio={args.duplicate_ratio}")
+    print(f"analyze_sentiment: {args.articles / loop_time:10.0f} articles/sec")
+    print(f"analyze_batch:     {args.articles / batch_time:10.0f} articles/sec  "
+          f"speedup={loop_time / batch_time:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
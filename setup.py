@@ -1,7 +1,12 @@
-from setuptools import setup, find_packages
+import codecs
 
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
+from setuptools import setup, find_namespace_packages
+
+with open("README.md", "rb") as fh:
+    readme = fh.read()
+# README.md is saved as UTF-16 with a byte order mark
+long_description = readme.decode("utf-16" if readme[:2] in (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+                                 else "utf-8")
 
 with open("requirements.txt", "r", encoding="utf-8") as fh:
     requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
@@ -15,7 +20,9 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/Stock_News_Sentiment_Analyzer",
-    packages=find_packages(),
+    # src and most of its subpackages have no __init__.py
+    packages=find_namespace_packages(include=["stock_news_analyzer", "stock_news_analyzer.*",
+                                              "src", "src.*"]),
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Financial and Insurance Industry",
@@ -10,6 +10,8 @@ from email.mime.multipart import MIMEMultipart
 import requests
 import logging
 
+from ..database.backend import fts_phrase
+
 class AlertSystem:
     """Alert System Class"""
     
@@ -18,7 +20,8 @@ class AlertSystem:
         Initialize alert system
         
         Args:
-            config: Configuration dictionary
+            config: Configuration dictionary ('database' is an optional
+                Database searched by keyword alerts)
         """
         self.config = config or {}
         self.logger = logging.getLogger(__name__)
@@ -129,8 +132,33 @@ class AlertSystem:
         pass
     
     def _check_keywords(self, data: Dict) -> bool:
-        """Check keywords"""
-        pass
+        """
+        Check keywords
+        
+        Any of conditions['keywords'] matching as a phrase triggers the
+        alert. With config['database'] set and data['symbol'] given, stored
+        news from the last conditions['keyword_days'] days (default 1) is
+        searched through the full-text index; otherwise the titles and
+        contents in data['news'] are scanned.
+        """
+        conditions = getattr(self, 'conditions', {})
+        keywords = conditions.get('keywords')
+        if not keywords:
+            return False
+        
+        database = self.config.get('database')
+        if database is not None and data.get('symbol'):
+            query = ' OR '.join(fts_phrase(keyword) for keyword in keywords)
+            matches = database.search_news(query, data['symbol'],
+                                           conditions.get('keyword_days', 1), limit=1)
+            return not matches.empty
+        
+        keywords = [keyword.lower() for keyword in keywords]
+        for article in data.get('news', []):
+            text = f"{article.get('title', '')} {article.get('content', '')}".lower()
+            if any(keyword in text for keyword in keywords):
+                return True
+        return False
     
     def _send_email(self, alert: Dict):
         """Send email"""
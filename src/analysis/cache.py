@@ -0,0 +1,262 @@
+"""
+Content-addressed caches for sentiment scores and translations.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Milliseconds a connection waits for another process's write lock
+BUSY_TIMEOUT_MS = 30000
+
+# Connections inherited by forked children; never used or closed there, as
+# closing would act on the parent's database state
+_inherited = []
+
+class ContentCache:
+    """Two-tier (in-memory LRU + optional SQLite) cache keyed by content hash.
+
+    Subclasses name the SQLite table in TABLE, so different kinds of values
+    can share a file without sharing a table.
+
+    The SQLite file may be shared by several processes: it is opened in WAL
+    mode with a busy timeout, and copies in worker processes (unpickled or
+    inherited through fork) open their own connection and commit every
+    write, so none of them holds the write lock for long. A
+    failing persistent tier only costs cache hits; lookups then miss and
+    values are still kept in memory.
+    """
+
+    # SQLite table of the persistent tier
+    TABLE = 'content_cache'
+
+    def __init__(self, max_size: int = 100000, db_path: Optional[str] = None,
+                 commit_every: int = 1000):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size (int): Maximum number of entries kept in memory
+            db_path (str, optional): SQLite file for the persistent tier;
+                memory only when omitted
+            commit_every (int): Number of new disk entries per commit; call
+                flush() or close() to persist the rest
+        """
+        self.max_size = max_size
+        self.db_path = db_path
+        self.commit_every = commit_every
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._pending_writes = 0
+        self._counters = {'hits': 0, 'disk_hits': 0, 'misses': 0}
+        self._conn = None
+        self._pid = os.getpid()
+
+        if db_path:
+            self._conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the persistent tier, creating its table if needed."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                               timeout=BUSY_TIMEOUT_MS / 1000)
+        conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {self.TABLE} (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        )
+        """)
+        conn.commit()
+        return conn
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """Get the persistent tier connection, reopening it in a forked child."""
+        if self._conn is not None and self._pid != os.getpid():
+            _inherited.append(self._conn)
+            self._pid = os.getpid()
+            self.commit_every = 1
+            self._pending_writes = 0
+            self._conn = self._connect()
+        return self._conn
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Worker processes get an empty memory tier and their own connection,
+        # committing each write so they do not lock each other out
+        return {'max_size': self.max_size, 'db_path': self.db_path,
+                'commit_every': 1}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__(**state)
+
+    @staticmethod
+    def make_key(text: str, analyzer: str, version: str) -> str:
+        """
+        Build the cache key for a text.
+
+        Whitespace is normalized; case and punctuation are kept because
+        lexicon analyzers such as VADER score them.
+
+        Args:
+            text (str): Source text
+            analyzer (str): Name of what the value was computed with
+            version (str): Version of it
+
+        Returns:
+            str: Hex digest key
+        """
+        normalized = ' '.join((text or '').split())
+        digest = hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+        return f"{analyzer}:{version}:{digest}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached value.
+
+        Args:
+            key (str): Cache key from make_key
+
+        Returns:
+            Any: Copy of the cached value, or None on a miss
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self._counters['hits'] += 1
+                return copy.deepcopy(self._memory[key])
+
+            conn = self._connection()
+            if conn is not None:
+                try:
+                    row = conn.execute(
+                        f"SELECT value FROM {self.TABLE} WHERE key = ?", (key,)
+                    ).fetchone()
+                except sqlite3.Error as e:
+                    logger.warning(f"{self.TABLE} lookup failed: {str(e)}")
+                    row = None
+                if row is not None:
+                    value = json.loads(row[0])
+                    self._remember(key, copy.deepcopy(value))
+                    self._counters['disk_hits'] += 1
+                    return value
+
+            self._counters['misses'] += 1
+            return None
+
+    def put(self, key: str, value: Any):
+        """
+        Store a value.
+
+        Args:
+            key (str): Cache key from make_key
+            value (Any): JSON-serialisable value
+        """
+        with self._lock:
+            self._remember(key, copy.deepcopy(value))
+            conn = self._connection()
+            if conn is not None:
+                try:
+                    conn.execute(
+                        f"INSERT OR REPLACE INTO {self.TABLE} (key, value) VALUES (?, ?)",
+                        (key, json.dumps(value))
+                    )
+                    self._pending_writes += 1
+                    if self._pending_writes >= self.commit_every:
+                        conn.commit()
+                        self._pending_writes = 0
+                except sqlite3.Error as e:
+                    # Keep the value in memory; the pending batch is dropped
+                    logger.warning(f"{self.TABLE} write failed: {str(e)}")
+                    self._rollback()
+
+    def get_or_compute(self, text: str, analyzer: str, version: str,
+                       compute: Callable[[str], Any]) -> Any:
+        """
+        Return the cached value for a text, computing and storing it on a miss.
+
+        Args:
+            text (str): Source text
+            analyzer (str): Name of what the value is computed with
+            version (str): Version of it
+            compute (Callable): Function called with the text on a miss
+
+        Returns:
+            Any: Value
+        """
+        key = self.make_key(text, analyzer, version)
+        value = self.get(key)
+        if value is None:
+            value = compute(text)
+            self.put(key, value)
+        return value
+
+    def _remember(self, key: str, value: Any):
+        """Insert into the memory tier, evicting the least recently used entry."""
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict[str, Any]: Hit/miss counters, hit rate and memory size
+        """
+        with self._lock:
+            stats = dict(self._counters)
+            stats['size'] = len(self._memory)
+        lookups = stats['hits'] + stats['disk_hits'] + stats['misses']
+        stats['hit_rate'] = (stats['hits'] + stats['disk_hits']) / lookups if lookups else 0.0
+        return stats
+
+    def _rollback(self):
+        """Abandon the open write transaction after an error."""
+        try:
+            self._conn.rollback()
+        except sqlite3.Error:
+            pass
+        self._pending_writes = 0
+
+    def flush(self):
+        """Commit pending writes to the persistent tier."""
+        with self._lock:
+            conn = self._connection()
+            if conn is not None:
+                try:
+                    conn.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"{self.TABLE} commit failed: {str(e)}")
+                    self._rollback()
+                self._pending_writes = 0
+
+    def close(self):
+        """Flush and close the persistent tier."""
+        self.flush()
+        with self._lock:
+            conn = self._connection()
+            if conn is not None:
+                conn.close()
+                self._conn = None
+
+
+class SentimentCache(ContentCache):
+    """Cache of per-text sentiment scores."""
+
+    TABLE = 'sentiment_cache'
+
+
+class TranslationCache(ContentCache):
+    """Cache of translated texts."""
+
+    TABLE = 'translation_cache'
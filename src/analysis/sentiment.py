@@ -2,22 +2,37 @@
 Sentiment analysis module for analyzing news article sentiment.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import logging
 from textblob import TextBlob
 import numpy as np
+import pandas as pd
 from datetime import datetime
+from ..utils.parallel import iter_process_map
+from .cache import SentimentCache
 
 logger = logging.getLogger(__name__)
 
 class SentimentAnalyzer:
     """Sentiment analyzer for news articles."""
     
-    def __init__(self):
-        """Initialize the sentiment analyzer with default parameters."""
+    # Bump when the scoring of a text changes, to invalidate cached scores
+    ANALYZER_VERSION = '1'
+    
+    # Sentiment categories, indexed by _classify_scores
+    CATEGORIES = ('positive', 'neutral', 'negative')
+    
+    def __init__(self, cache: Optional[SentimentCache] = None):
+        """
+        Initialize the sentiment analyzer with default parameters.
+        
+        Args:
+            cache (SentimentCache, optional): Cache for per-text polarity scores
+        """
         self.sentiment_threshold = 0.1
         self.time_weight = False
         self.source_weight = {}
+        self.cache = cache
         
     def set_parameters(self, sentiment_threshold: float = 0.1,
                       time_weight: bool = False,
@@ -49,23 +64,10 @@ class SentimentAnalyzer:
                 logger.warning("No news data provided for analysis")
                 return self._empty_result()
                 
-            sentiments = []
-            for article in news_data:
-                sentiment = self._analyze_article(article)
-                sentiments.append(sentiment)
-                
-            # Calculate aggregate metrics
-            avg_sentiment = np.mean([s['sentiment_score'] for s in sentiments])
-            std_sentiment = np.std([s['sentiment_score'] for s in sentiments])
-            
-            result = {
-                'overall_sentiment': self._classify_sentiment(avg_sentiment),
-                'sentiment_score': float(avg_sentiment),
-                'sentiment_std': float(std_sentiment),
-                'article_count': len(sentiments),
-                'sentiment_distribution': self._get_sentiment_distribution(sentiments),
-                'detailed_sentiments': sentiments
-            }
+            polarity = np.fromiter(
+                (self._polarity(self._article_text(article)) for article in news_data),
+                dtype=np.float64, count=len(news_data))
+            result = self._summarize(news_data, polarity)
             
             logger.info(f"Completed sentiment analysis for {len(news_data)} articles")
             return result
@@ -74,43 +76,113 @@ class SentimentAnalyzer:
             logger.error(f"Error in sentiment analysis: {str(e)}")
             return self._empty_result()
             
-    def _analyze_article(self, article: Dict[str, Any]) -> Dict[str, Any]:
+    def analyze_parallel(self, news_data: List[Dict[str, Any]], workers: int = None,
+                         chunk_size: int = 500) -> Dict[str, Any]:
         """
-        Analyze sentiment of a single article.
+        Analyze sentiment of news articles on a pool of worker processes.
+        
+        Gives the same result as analyze(), with text scoring spread over
+        one analyzer per process.
         
         Args:
-            article (Dict): News article data
+            news_data (List[Dict]): List of news articles
+            workers (int, optional): Number of processes, defaults to CPU count
+            chunk_size (int): Articles per task
             
         Returns:
-            Dict: Article sentiment analysis
+            Dict: Sentiment analysis results
         """
-        # Combine title and content for analysis
-        text = f"{article['title']} {article['content']}"
-        blob = TextBlob(text)
-        
-        # Calculate base sentiment
-        sentiment_score = blob.sentiment.polarity
+        try:
+            if not news_data:
+                logger.warning("No news data provided for analysis")
+                return self._empty_result()
+                
+            texts = [self._article_text(article) for article in news_data]
+            if self.cache is not None:
+                # Release the write lock before workers share the cache file
+                self.cache.flush()
+            polarity = np.fromiter(
+                (score for _, score in iter_process_map(
+                    SentimentAnalyzer, '_polarity', texts, workers, chunk_size,
+                    factory_kwargs={'cache': self.cache})),
+                dtype=np.float64, count=len(texts))
+            result = self._summarize(news_data, polarity)
+            
+            logger.info(f"Completed parallel sentiment analysis for {len(news_data)} articles")
+            return result
+            
+        except Exception as e:
+            logger.error(f"Error in parallel sentiment analysis: {str(e)}")
+            return self._empty_result()
+            
+    def _summarize(self, news_data: List[Dict[str, Any]], polarity: np.ndarray) -> Dict[str, Any]:
+        """
+        Weight, classify and aggregate per-article polarities.
         
-        # Apply source weighting if configured
-        source = article['source'].lower()
-        if self.source_weight and source in self.source_weight:
-            sentiment_score *= self.source_weight[source]
+        Args:
+            news_data (List[Dict]): News articles
+            polarity (np.ndarray): Polarity of each article's text
             
-        # Apply time weighting if enabled
+        Returns:
+            Dict: Sentiment analysis results
+        """
+        sources = np.array([article['source'] for article in news_data], dtype=object)
+        published = [article['published_at'] for article in news_data]
+        
+        scores = polarity * self._source_weights(sources)
         if self.time_weight:
-            pub_date = datetime.strptime(article['published_at'], 
-                                       '%Y-%m-%dT%H:%M:%SZ')
-            time_factor = self._calculate_time_weight(pub_date)
-            sentiment_score *= time_factor
+            scores = scores * self._time_weights(published)
             
+        categories = self._classify_scores(scores)
+        counts = np.bincount(categories, minlength=len(self.CATEGORIES))
+        avg_sentiment = scores.mean()
+        
+        keys = ('title', 'sentiment_score', 'sentiment', 'source', 'url', 'published_at')
+        detailed_sentiments = [dict(zip(keys, row)) for row in zip(
+            [article['title'] for article in news_data],
+            scores.tolist(),
+            [self.CATEGORIES[category] for category in categories.tolist()],
+            sources.tolist(),
+            [article['url'] for article in news_data],
+            published
+        )]
+        
         return {
-            'title': article['title'],
-            'sentiment_score': sentiment_score,
-            'sentiment': self._classify_sentiment(sentiment_score),
-            'source': article['source'],
-            'url': article['url'],
-            'published_at': article['published_at']
+            'overall_sentiment': self._classify_sentiment(avg_sentiment),
+            'sentiment_score': float(avg_sentiment),
+            'sentiment_std': float(scores.std()),
+            'article_count': len(news_data),
+            'sentiment_distribution': dict(zip(self.CATEGORIES, map(int, counts))),
+            'detailed_sentiments': detailed_sentiments
         }
+            
+    def _article_text(self, article: Dict[str, Any]) -> str:
+        """
+        Build the text scored for an article.
+        
+        Args:
+            article (Dict): News article data
+            
+        Returns:
+            str: Title and content
+        """
+        return f"{article['title']} {article['content']}"
+        
+    def _polarity(self, text: str) -> float:
+        """
+        Calculate TextBlob polarity of a text, using the cache if configured.
+        
+        Args:
+            text (str): Text to score
+            
+        Returns:
+            float: Polarity in [-1, 1]
+        """
+        if self.cache is not None:
+            return self.cache.get_or_compute(
+                text, 'textblob', self.ANALYZER_VERSION,
+                lambda value: TextBlob(value).sentiment.polarity)
+        return TextBlob(text).sentiment.polarity
         
     def _classify_sentiment(self, score: float) -> str:
         """
@@ -128,36 +200,51 @@ class SentimentAnalyzer:
             return 'negative'
         return 'neutral'
         
-    def _calculate_time_weight(self, pub_date: datetime) -> float:
+    def _classify_scores(self, scores: np.ndarray) -> np.ndarray:
         """
-        Calculate time-based weight for sentiment.
+        Classify an array of scores, as _classify_sentiment does one.
         
         Args:
-            pub_date (datetime): Article publication date
+            scores (np.ndarray): Sentiment scores
             
         Returns:
-            float: Time weight factor
+            np.ndarray: Index into CATEGORIES for each score
         """
-        time_diff = datetime.now() - pub_date
-        days_old = time_diff.days
+        return np.select([scores > self.sentiment_threshold,
+                          scores < -self.sentiment_threshold], [0, 2], default=1)
         
-        # Exponential decay with half-life of 7 days
-        return np.exp(-days_old * np.log(2) / 7)
+    def _source_weights(self, sources: np.ndarray) -> np.ndarray:
+        """
+        Look up the configured weight of each article's source.
+        
+        Args:
+            sources (np.ndarray): Source names
+            
+        Returns:
+            np.ndarray: Weight per article (1.0 for unlisted sources)
+        """
+        if not self.source_weight:
+            return np.ones(len(sources))
+        # Weight each distinct source once, then broadcast back
+        names, inverse = np.unique(np.char.lower(sources.astype(str)), return_inverse=True)
+        table = np.array([self.source_weight.get(name, 1.0) for name in names], dtype=np.float64)
+        return table[inverse]
         
-    def _get_sentiment_distribution(self, sentiments: List[Dict]) -> Dict[str, int]:
+    def _time_weights(self, published: List[str]) -> np.ndarray:
         """
-        Calculate distribution of sentiment categories.
+        Calculate time-based weights for sentiment.
         
         Args:
-            sentiments (List[Dict]): List of sentiment results
+            published (List[str]): Publication times ('%Y-%m-%dT%H:%M:%SZ')
             
         Returns:
-            Dict[str, int]: Count of sentiments by category
+            np.ndarray: Time weight factor per article
         """
-        distribution = {'positive': 0, 'neutral': 0, 'negative': 0}
-        for sentiment in sentiments:
-            distribution[sentiment['sentiment']] += 1
-        return distribution
+        pub_dates = pd.to_datetime(published, format='%Y-%m-%dT%H:%M:%SZ').to_numpy()
+        days_old = (np.datetime64(datetime.now()) - pub_dates) // np.timedelta64(1, 'D')
+        
+        # Exponential decay with half-life of 7 days
+        return np.exp(-days_old * np.log(2) / 7)
         
     def _empty_result(self) -> Dict[str, Any]:
         """
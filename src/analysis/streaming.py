@@ -0,0 +1,263 @@
+"""
+Incremental rolling sentiment metrics per symbol.
+"""
+
+import logging
+import math
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Union
+
+from ..database.watermarks import parse_timestamp
+
+logger = logging.getLogger(__name__)
+
+# Default rolling windows, in seconds
+DEFAULT_WINDOWS = {'1h': 3600, '4h': 4 * 3600, '1d': 24 * 3600}
+
+# Half-life of the decayed score, matching SentimentAnalyzer's time weighting
+DEFAULT_HALF_LIFE = 7 * 24 * 3600
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+class _SymbolState:
+    """Rolling, decayed and lifetime statistics of one symbol."""
+
+    def __init__(self, buckets: int, windows: Dict[str, int]):
+        # Per-bucket count, sum and sum of squares; bucket b holds slot b % buckets
+        self.counts = [0] * buckets
+        self.sums = [0.0] * buckets
+        self.squares = [0.0] * buckets
+        # Newest bucket included in the window totals
+        self.head = None
+        # Running totals per window: [count, sum, sum of squares]
+        self.totals = {name: [0, 0.0, 0.0] for name in windows}
+        # Time-decayed weighted sum and weight, as of decay_time
+        self.decayed_sum = 0.0
+        self.decayed_weight = 0.0
+        self.decay_time = None
+        # Welford lifetime mean and sum of squared deviations
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+
+class StreamingSentimentAggregator:
+    """
+    Rolling, time-decayed and z-scored sentiment per symbol, updated in
+    constant time per article.
+
+    Scores are added to fixed-width time buckets in a ring covering the
+    longest window, and every window keeps running totals that buckets
+    join on arrival and leave as the clock moves past them. Articles may
+    arrive in any order; those older than the longest window only update
+    the decayed score and lifetime statistics.
+
+    The clock is the newest publication time seen for any symbol, so
+    windows of quiet symbols still expire.
+    """
+
+    def __init__(self, windows: Optional[Dict[str, int]] = None,
+                 half_life: float = DEFAULT_HALF_LIFE, resolution: int = 60):
+        """
+        Initialize the aggregator.
+
+        Args:
+            windows (Dict[str, int], optional): Window name to length in
+                seconds, defaults to 1h, 4h and 1d
+            half_life (float): Half-life of the decayed score in seconds,
+                defaults to 7 days
+            resolution (int): Bucket width in seconds; window edges are
+                exact to one bucket
+        """
+        self.windows = dict(windows or DEFAULT_WINDOWS)
+        self.half_life = half_life
+        self.resolution = resolution
+        # Window lengths in buckets
+        self._spans = {name: max(1, math.ceil(length / resolution))
+                       for name, length in self.windows.items()}
+        self._buckets = max(self._spans.values())
+        self._states: Dict[str, _SymbolState] = {}
+        self._clock = None
+        self._lock = threading.Lock()
+
+    def update(self, symbol: str, score: float,
+               timestamp: Union[datetime, str, float]) -> Dict[str, Any]:
+        """
+        Add one article score.
+
+        Args:
+            symbol (str): Stock symbol
+            score (float): Sentiment score
+            timestamp (datetime | str | float): Publication time as a
+                datetime, ISO 8601 string or epoch seconds (UTC)
+
+        Returns:
+            Dict: Snapshot of the symbol after the update
+        """
+        seconds = self._seconds(timestamp)
+        with self._lock:
+            if self._clock is None or seconds > self._clock:
+                self._clock = seconds
+            state = self._states.get(symbol)
+            if state is None:
+                state = self._states[symbol] = _SymbolState(self._buckets, self._spans)
+
+            self._add_bucketed(state, score, int(seconds // self.resolution))
+            self._add_decayed(state, score, seconds)
+
+            state.count += 1
+            delta = score - state.mean
+            state.mean += delta / state.count
+            state.m2 += delta * (score - state.mean)
+
+            return self._snapshot(symbol, state)
+
+    def update_article(self, article: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Add a scored article.
+
+        Args:
+            article (Dict): Article with symbol, published_at and
+                sentiment['compound']
+
+        Returns:
+            Dict: Snapshot of the symbol, or None if the article has no
+            score or timestamp
+        """
+        sentiment = article.get('sentiment') or {}
+        timestamp = parse_timestamp(article.get('published_at'))
+        if sentiment.get('compound') is None or timestamp is None:
+            return None
+        return self.update(article['symbol'], sentiment['compound'], timestamp)
+
+    def snapshot(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the current metrics of a symbol.
+
+        Args:
+            symbol (str): Stock symbol
+
+        Returns:
+            Dict: Snapshot with lifetime count, mean and std, the decayed
+            score, and count, mean, std and z-score per window; None for
+            an unseen symbol
+        """
+        with self._lock:
+            state = self._states.get(symbol)
+            return self._snapshot(symbol, state) if state else None
+
+    def snapshots(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the current metrics of every symbol.
+
+        Returns:
+            Dict[str, Dict]: Snapshot per symbol
+        """
+        with self._lock:
+            return {symbol: self._snapshot(symbol, state)
+                    for symbol, state in self._states.items()}
+
+    def _seconds(self, timestamp: Union[datetime, str, float]) -> float:
+        """Convert a timestamp to epoch seconds."""
+        if isinstance(timestamp, (int, float)):
+            return float(timestamp)
+        parsed = parse_timestamp(timestamp)
+        if parsed is None:
+            raise ValueError(f"Invalid timestamp: {timestamp!r}")
+        return (parsed - _EPOCH).total_seconds()
+
+    def _advance(self, state: _SymbolState, head: int):
+        """Move a symbol's window totals forward to the bucket at head."""
+        if state.head is None:
+            state.head = head
+            return
+        if head <= state.head:
+            return
+
+        if head - state.head >= self._buckets:
+            # Everything has expired
+            for totals in state.totals.values():
+                totals[:] = [0, 0.0, 0.0]
+            state.counts = [0] * self._buckets
+            state.sums = [0.0] * self._buckets
+            state.squares = [0.0] * self._buckets
+            state.head = head
+            return
+
+        for bucket in range(state.head + 1, head + 1):
+            # Drop the bucket leaving each window, then recycle the ring slot
+            for name, span in self._spans.items():
+                slot = (bucket - span) % self._buckets
+                totals = state.totals[name]
+                totals[0] -= state.counts[slot]
+                totals[1] -= state.sums[slot]
+                totals[2] -= state.squares[slot]
+            slot = bucket % self._buckets
+            state.counts[slot] = 0
+            state.sums[slot] = 0.0
+            state.squares[slot] = 0.0
+        state.head = head
+
+    def _add_bucketed(self, state: _SymbolState, score: float, bucket: int):
+        """Add a score to its bucket and to the windows containing it."""
+        self._advance(state, max(bucket, int(self._clock // self.resolution)))
+        age = state.head - bucket
+        if age >= self._buckets:
+            return
+
+        slot = bucket % self._buckets
+        state.counts[slot] += 1
+        state.sums[slot] += score
+        state.squares[slot] += score * score
+        for name, span in self._spans.items():
+            if age < span:
+                totals = state.totals[name]
+                totals[0] += 1
+                totals[1] += score
+                totals[2] += score * score
+
+    def _add_decayed(self, state: _SymbolState, score: float, seconds: float):
+        """Add a score to the exponentially time-decayed average."""
+        if state.decay_time is None:
+            state.decay_time = seconds
+        if seconds >= state.decay_time:
+            decay = 0.5 ** ((seconds - state.decay_time) / self.half_life)
+            state.decayed_sum = state.decayed_sum * decay + score
+            state.decayed_weight = state.decayed_weight * decay + 1.0
+            state.decay_time = seconds
+        else:
+            # A late article enters with the weight it would have today
+            weight = 0.5 ** ((state.decay_time - seconds) / self.half_life)
+            state.decayed_sum += score * weight
+            state.decayed_weight += weight
+
+    def _snapshot(self, symbol: str, state: _SymbolState) -> Dict[str, Any]:
+        """Build the metrics of a symbol, expiring windows up to the clock."""
+        self._advance(state, int(self._clock // self.resolution))
+        std = math.sqrt(state.m2 / state.count) if state.count else 0.0
+
+        windows = {}
+        for name, (count, total, squares) in state.totals.items():
+            if count <= 0:
+                windows[name] = {'count': 0, 'mean': 0.0, 'std': 0.0, 'zscore': 0.0}
+                continue
+            mean = total / count
+            windows[name] = {
+                'count': count,
+                'mean': mean,
+                'std': math.sqrt(max(squares / count - mean * mean, 0.0)),
+                'zscore': (mean - state.mean) / std if std > 0 else 0.0
+            }
+
+        return {
+            'symbol': symbol,
+            'count': state.count,
+            'mean': state.mean,
+            'std': std,
+            'decayed_score': (state.decayed_sum / state.decayed_weight
+                              if state.decayed_weight else 0.0),
+            'as_of': _EPOCH + timedelta(seconds=self._clock),
+            'windows': windows
+        }
@@ -0,0 +1,208 @@
+"""
+Batched, cached translation of news summaries.
+"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+
+from .cache import TranslationCache
+
+logger = logging.getLogger(__name__)
+
+# DeepL accepts at most 50 texts per translate_text request
+MAX_BATCH_SIZE = 50
+
+_CLOSE = object()
+
+
+class SummaryTranslator:
+    """Translator that sends texts in batches and caches results by source-text hash."""
+
+    # Bump when the output for a text changes, to invalidate cached translations
+    TRANSLATOR_VERSION = '1'
+
+    def __init__(self, translator: Any, target_lang: str = 'ZH',
+                 cache: Optional[TranslationCache] = None,
+                 convert: Optional[Callable[[str], str]] = None,
+                 convert_name: str = '', batch_size: int = MAX_BATCH_SIZE):
+        """
+        Initialize the translator.
+
+        Args:
+            translator (Any): Object with a deepl.Translator-style
+                translate_text(texts, target_lang=...) returning results
+                with a .text attribute, e.g. deepl.Translator or a local fake
+            target_lang (str): Target language code
+            cache (TranslationCache, optional): Content-addressed cache for
+                translated texts; pass one with a db_path to keep
+                translations across runs
+            convert (Callable, optional): Post-processing applied to each
+                new translation before caching, e.g. OpenCC s2hk
+            convert_name (str): Name of convert, part of the cache key
+            batch_size (int): Texts per translate_text request
+        """
+        self.translator = translator
+        self.target_lang = target_lang
+        self.cache = cache
+        self.convert = convert
+        self.batch_size = min(batch_size, MAX_BATCH_SIZE)
+        self._cache_name = f"translate:{target_lang}:{convert_name}"
+        self._counters = {'texts': 0, 'requests': 0, 'translated': 0}
+        self._lock = threading.Lock()
+
+    def translate_batch(self, texts: List[str]) -> List[str]:
+        """
+        Translate texts, requesting only those not already cached.
+
+        Repeated and empty texts are not sent.
+
+        Args:
+            texts (List[str]): Source texts
+
+        Returns:
+            List[str]: Translations in the order of texts
+        """
+        results: List[Optional[str]] = [None] * len(texts)
+        missing: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                results[i] = ''
+                continue
+            cached = self._lookup(text)
+            if cached is not None:
+                results[i] = cached
+            else:
+                missing.setdefault(text, []).append(i)
+
+        pending = list(missing)
+        for start in range(0, len(pending), self.batch_size):
+            chunk = pending[start:start + self.batch_size]
+            for text, translated in zip(chunk, self._request(chunk)):
+                self._store(text, translated)
+                for i in missing[text]:
+                    results[i] = translated
+
+        with self._lock:
+            self._counters['texts'] += len(texts)
+        return results
+
+    def translate(self, text: str) -> str:
+        """
+        Translate a single text.
+
+        Args:
+            text (str): Source text
+
+        Returns:
+            str: Translation
+        """
+        return self.translate_batch([text])[0]
+
+    def _request(self, texts: List[str]) -> List[str]:
+        """Send one translate_text request and post-process the results."""
+        results = self.translator.translate_text(texts, target_lang=self.target_lang)
+        translated = [result.text for result in results]
+        if self.convert is not None:
+            translated = [self.convert(text) for text in translated]
+        with self._lock:
+            self._counters['requests'] += 1
+            self._counters['translated'] += len(texts)
+        return translated
+
+    def _lookup(self, text: str) -> Optional[str]:
+        if self.cache is None:
+            return None
+        return self.cache.get(self.cache.make_key(text, self._cache_name, self.TRANSLATOR_VERSION))
+
+    def _store(self, text: str, translated: str):
+        if self.cache is not None:
+            self.cache.put(self.cache.make_key(text, self._cache_name, self.TRANSLATOR_VERSION),
+                           translated)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get translation counters.
+
+        Returns:
+            Dict[str, int]: Texts seen, requests sent and texts translated
+        """
+        with self._lock:
+            return dict(self._counters)
+
+
+class TranslationStage:
+    """
+    Background translation worker that batches texts as they arrive.
+
+    submit() returns immediately with a future. The worker sends whatever
+    has queued up since its previous request as one batch, so batches grow
+    while requests are in flight and translation overlaps with the stages
+    producing the texts.
+    """
+
+    def __init__(self, translator: SummaryTranslator):
+        """
+        Initialize and start the stage.
+
+        Args:
+            translator (SummaryTranslator): Translator used for each batch
+        """
+        self.translator = translator
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='translation-stage', daemon=True)
+        self._thread.start()
+
+    def submit(self, text: str) -> Future:
+        """
+        Queue a text for translation.
+
+        Args:
+            text (str): Source text
+
+        Returns:
+            Future: Resolves to the translation
+        """
+        future = Future()
+        self._queue.put((text, future))
+        return future
+
+    def _run(self):
+        closing = False
+        while not closing:
+            item = self._queue.get()
+            if item is _CLOSE:
+                break
+            batch = [item]
+            while len(batch) < self.translator.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _CLOSE:
+                    closing = True
+                    break
+                batch.append(item)
+
+            try:
+                results = self.translator.translate_batch([text for text, _ in batch])
+            except Exception as e:
+                logger.error(f"Error translating batch of {len(batch)} texts: {str(e)}")
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+
+    def close(self):
+        """Translate everything queued, then stop the worker."""
+        self._queue.put(_CLOSE)
+        self._thread.join()
+
+    def __enter__(self) -> 'TranslationStage':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
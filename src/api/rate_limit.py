@@ -0,0 +1,100 @@
+"""
+Rate Limit Module
+Responsible for per-key request limits with in-process token buckets
+"""
+
+from typing import Dict, Optional, Tuple
+import threading
+import time
+
+# Requests per hour per account plan; None is unlimited
+PLAN_LIMITS = {
+    'free': 60,
+    'pro': 1000,
+    'enterprise': None,
+}
+
+
+class TokenBucket:
+    """Token Bucket Class
+
+    Holds up to capacity tokens and refills continuously at rate tokens per
+    second, so a client may burst its whole allowance and then continues at
+    the sustained rate.
+    """
+
+    def __init__(self, capacity: float, rate: float):
+        """
+        Initialize bucket, full
+
+        Args:
+            capacity: Maximum tokens
+            rate: Tokens added per second
+        """
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def take(self, now: float) -> Tuple[bool, float]:
+        """
+        Take one token if available
+
+        Args:
+            now: Current time.monotonic()
+
+        Returns:
+            Whether a token was taken, and seconds until the next one if not
+        """
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True, 0.0
+        return False, (1 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """Rate Limiter Class
+
+    One token bucket per API key, sized by the key's plan. All state is in
+    process memory; run one limiter per worker process and divide the limits
+    accordingly if the service runs several.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, Optional[int]]] = None):
+        """
+        Initialize limiter
+
+        Args:
+            limits: Requests per hour per plan (default PLAN_LIMITS)
+        """
+        self.limits = dict(PLAN_LIMITS if limits is None else limits)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def check(self, key: str, plan: str) -> Dict[str, Optional[float]]:
+        """
+        Count one request for a key
+
+        Args:
+            key: API key
+            plan: Account plan of the key
+
+        Returns:
+            'allowed', the hourly 'limit' (None if unlimited), 'remaining'
+            whole requests and 'retry_after' seconds when refused
+        """
+        limit = self.limits.get(plan, self.limits['free'])
+        if limit is None:
+            return {'allowed': True, 'limit': None, 'remaining': None, 'retry_after': 0.0}
+
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None or bucket.capacity != limit:
+                bucket = self._buckets[key] = TokenBucket(limit, limit / 3600.0)
+            allowed, retry_after = bucket.take(time.monotonic())
+            remaining = int(bucket.tokens)
+
+        return {'allowed': allowed, 'limit': limit, 'remaining': remaining,
+                'retry_after': retry_after}
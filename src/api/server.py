@@ -0,0 +1,365 @@
+"""
+API Server Module
+Responsible for serving the /api/v1 REST endpoints
+
+Run with:
+    uvicorn --factory src.api.server:create_app
+"""
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta, timezone
+import asyncio
+import hashlib
+import json
+import logging
+import re
+
+import pandas as pd
+from fastapi import Depends, FastAPI, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, Field
+from starlette.exceptions import HTTPException as StarletteHTTPException
+
+from ..alert_system.alert_system import AlertSystem
+from ..analysis.cache import SentimentCache
+from ..analysis.sentiment import SentimentAnalyzer
+from ..database.database import Database
+from ..utils.config import get_api_config
+from .rate_limit import RateLimiter
+
+# Columns needed to score articles; the sentiment join is not
+ANALYSIS_COLUMNS = ('title', 'content', 'source', 'url', 'published_at')
+
+# Columns of exported reports
+REPORT_COLUMNS = ('symbol', 'title', 'source', 'url', 'published_at',
+                  'compound', 'positive', 'neutral', 'negative')
+
+SYMBOL_PATTERN = re.compile(r'^[A-Z0-9.\-^=]{1,15}$')
+
+
+class ApiError(Exception):
+    """Error returned to the client in the documented error format"""
+
+    def __init__(self, status_code: int, code: str, message: str,
+                 headers: Optional[Dict[str, str]] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.code = code
+        self.message = message
+        self.headers = headers
+
+
+class BatchRequest(BaseModel):
+    symbols: List[str] = Field(min_length=1)
+    days: int = Field(7, ge=1, le=365)
+
+
+class AlertRequest(BaseModel):
+    stock_symbol: str
+    conditions: Dict[str, Any]
+    notification: Dict[str, Any] = Field(default_factory=dict)
+
+
+class ResponseCache:
+    """Response Cache Class
+
+    Keeps serialized response bodies with their ETags for ttl seconds.
+    Concurrent misses for the same key share one computation, so a burst
+    of identical requests costs one query. If the request computing an
+    entry is cancelled (e.g. its client disconnected), a waiting request
+    takes over the computation.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 10000):
+        """
+        Initialize cache
+
+        Args:
+            ttl: Seconds an entry is served without recomputation
+            max_entries: Entries kept, least recently stored dropped first
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._inflight: Dict[Any, asyncio.Future] = {}
+
+    async def get(self, key: Any, compute: Callable[[], Awaitable[bytes]]) -> Tuple[bytes, str]:
+        """
+        Get a cached body, computing it on a miss
+
+        Args:
+            key: Cache key
+            compute: Coroutine function producing the body
+
+        Returns:
+            Body and its ETag
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > loop.time():
+                return entry[1], entry[2]
+
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # The request computing it was cancelled: take over, unless
+                # this one was cancelled too
+                if not inflight.cancelled():
+                    raise
+
+        future = loop.create_future()
+        self._inflight[key] = future
+        try:
+            body = await compute()
+            etag = f'"{hashlib.sha1(body).hexdigest()}"'
+            self._entries[key] = (loop.time() + self.ttl, body, etag)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            future.set_result((body, etag))
+            return body, etag
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved; waiters, if any, still receive it
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+            # Cancelled: wake the waiters so one of them computes instead
+            if not future.done():
+                future.cancel()
+
+
+class ApiService:
+    """API Service Class
+
+    Holds the state shared by all requests. Database and analysis calls
+    are blocking, so they run on a bounded thread pool; the SQLite backend
+    gives each thread its own read connection, so requests read in
+    parallel while the event loop keeps serving.
+    """
+
+    def __init__(self, config: Dict = None):
+        """
+        Initialize service
+
+        Args:
+            config: Overrides for get_api_config(). 'database' may hold an
+                existing Database
+        """
+        self.config = get_api_config()
+        self.config.update(config or {})
+        self.logger = logging.getLogger(__name__)
+        self.api_keys: Dict[str, str] = self.config['api_keys']
+        self.database = self.config.get('database') or Database({'db_path': self.config['db_path']})
+        self.analyzer = SentimentAnalyzer(SentimentCache())
+        self.executor = ThreadPoolExecutor(max_workers=self.config['db_workers'],
+                                           thread_name_prefix='api-db')
+        self.cache = ResponseCache(self.config['cache_ttl'])
+        self.limiter = RateLimiter(self.config.get('rate_limits'))
+        self.alerts: Dict[str, List[Dict]] = {}
+
+    async def run(self, func: Callable, *args) -> Any:
+        """Run a blocking call on the service thread pool"""
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    async def sentiment(self, symbol: str, days: int) -> Tuple[bytes, str]:
+        """Get the serialized sentiment summary of a symbol"""
+        async def compute() -> bytes:
+            result = await self.run(self._analyze, symbol, days)
+            return json.dumps(result, separators=(',', ':')).encode('utf-8')
+
+        return await self.cache.get(('sentiment', symbol, days), compute)
+
+    def _analyze(self, symbol: str, days: int) -> Dict:
+        news = self.database.query_news(symbol, days, ANALYSIS_COLUMNS)
+        result = self.analyzer.analyze(news)
+        result.pop('detailed_sentiments', None)
+        return result
+
+    async def report(self, symbol: str, start: Optional[date],
+                     end: Optional[date]) -> Tuple[bytes, str]:
+        """Get the CSV report of a symbol's news between two dates"""
+        async def compute() -> bytes:
+            return await self.run(self._report, symbol, start, end)
+
+        return await self.cache.get(('report', symbol, start, end), compute)
+
+    def _report(self, symbol: str, start: Optional[date], end: Optional[date]) -> bytes:
+        days = (date.today() - start).days + 1 if start else None
+        frame = self.database.query_news_frame(symbol, days, REPORT_COLUMNS)
+        if not frame.empty and (start or end):
+            # Stored timestamps are naive UTC
+            published = pd.to_datetime(frame['published_at'], utc=True)
+            keep = pd.Series(True, index=frame.index)
+            if start:
+                keep &= published >= pd.Timestamp(start, tz='UTC')
+            if end:
+                keep &= published < pd.Timestamp(end + timedelta(days=1), tz='UTC')
+            frame = frame[keep]
+        return frame.to_csv(index=False).encode('utf-8')
+
+    def close(self):
+        """Release the thread pool and database"""
+        self.executor.shutdown(wait=True)
+        if 'database' not in self.config:
+            self.database.close()
+
+
+def _symbol(value: str) -> str:
+    """Normalize and validate a stock symbol"""
+    symbol = value.strip().upper()
+    if not SYMBOL_PATTERN.match(symbol):
+        raise ApiError(400, 'invalid_symbol', f"Invalid stock symbol: {value!r}")
+    return symbol
+
+
+def _error(status_code: int, code: str, message: str,
+           headers: Optional[Dict[str, str]] = None) -> Response:
+    body = json.dumps({'status': 'error', 'code': code, 'message': message})
+    return Response(body, status_code=status_code, media_type='application/json',
+                    headers=headers)
+
+
+def _cached_response(request: Request, body: bytes, etag: str, ttl: float,
+                     media_type: str = 'application/json') -> Response:
+    """Build a response, or 304 if the client already has this ETag"""
+    headers = {'ETag': etag, 'Cache-Control': f'private, max-age={int(ttl)}'}
+    # Returned responses bypass the headers set on the dependency's response
+    headers.update(getattr(request.state, 'rate_limit', {}))
+    matches = [tag.strip()[2:] if tag.strip().startswith('W/') else tag.strip()
+               for tag in request.headers.get('if-none-match', '').split(',')]
+    if etag in matches or '*' in matches:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type=media_type, headers=headers)
+
+
+def create_app(config: Dict = None) -> FastAPI:
+    """
+    Build the API application
+
+    Args:
+        config: Overrides for get_api_config(); see ApiService
+
+    Returns:
+        FastAPI application
+    """
+    service = ApiService(config)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        yield
+        service.close()
+
+    app = FastAPI(title='Stock News Sentiment Analyzer API', version='1.0.0', lifespan=lifespan)
+    app.state.service = service
+
+    @app.exception_handler(ApiError)
+    async def api_error(request: Request, exc: ApiError):
+        return _error(exc.status_code, exc.code, exc.message, exc.headers)
+
+    @app.exception_handler(RequestValidationError)
+    async def validation_error(request: Request, exc: RequestValidationError):
+        errors = '; '.join(f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in exc.errors())
+        return _error(400, 'bad_request', errors)
+
+    @app.exception_handler(StarletteHTTPException)
+    async def http_error(request: Request, exc: StarletteHTTPException):
+        code = {404: 'not_found', 405: 'method_not_allowed'}.get(exc.status_code, 'error')
+        return _error(exc.status_code, code, str(exc.detail))
+
+    @app.exception_handler(Exception)
+    async def server_error(request: Request, exc: Exception):
+        service.logger.error(f"Error handling {request.url.path}: {exc}")
+        return _error(500, 'server_error', 'Internal server error')
+
+    async def authorize(request: Request, response: Response) -> str:
+        """Check the bearer key and take one token from its rate limit bucket"""
+        scheme, _, key = request.headers.get('authorization', '').partition(' ')
+        if scheme.lower() != 'bearer' or not key:
+            raise ApiError(401, 'unauthorized', 'Missing API key')
+        plan = service.api_keys.get(key.strip())
+        if plan is None:
+            raise ApiError(401, 'unauthorized', 'Invalid API key')
+
+        quota = service.limiter.check(key.strip(), plan)
+        if quota['limit'] is not None:
+            headers = {'X-RateLimit-Limit': str(quota['limit']),
+                       'X-RateLimit-Remaining': str(quota['remaining'])}
+            if not quota['allowed']:
+                headers['Retry-After'] = str(int(quota['retry_after']) + 1)
+                raise ApiError(429, 'rate_limited',
+                               f"Rate limit of {quota['limit']} requests/hour exceeded",
+                               headers)
+            response.headers.update(headers)
+            request.state.rate_limit = headers
+        return key.strip()
+
+    @app.get('/api/v1/sentiment/{stock_symbol}')
+    async def get_sentiment(request: Request, stock_symbol: str,
+                            days: int = Query(7, ge=1, le=365), language: str = 'en',
+                            key: str = Depends(authorize)):
+        # Only English news is collected; language is accepted for compatibility
+        data, etag = await service.sentiment(_symbol(stock_symbol), days)
+        return _cached_response(request, b'{"status":"success","data":' + data + b'}',
+                                etag, service.cache.ttl)
+
+    @app.post('/api/v1/sentiment/batch')
+    async def batch_sentiment(request: Request, batch: BatchRequest,
+                              key: str = Depends(authorize)):
+        symbols = list(dict.fromkeys(_symbol(symbol) for symbol in batch.symbols))
+        if len(symbols) > service.config['max_batch_symbols']:
+            raise ApiError(400, 'too_many_symbols',
+                           f"At most {service.config['max_batch_symbols']} symbols per batch")
+
+        results = await asyncio.gather(*(service.sentiment(symbol, batch.days)
+                                         for symbol in symbols))
+        body = (b'{"status":"success","data":{'
+                + b','.join(json.dumps(symbol).encode('utf-8') + b':' + data
+                            for symbol, (data, _) in zip(symbols, results))
+                + b'}}')
+        etag = f'"{hashlib.sha1("".join(etag for _, etag in results).encode()).hexdigest()}"'
+        return _cached_response(request, body, etag, service.cache.ttl)
+
+    @app.post('/api/v1/alerts')
+    async def create_alert(alert: AlertRequest, key: str = Depends(authorize)):
+        alert_system = AlertSystem({'database': service.database})
+        if not alert_system.set_alert(alert.conditions):
+            raise ApiError(400, 'invalid_conditions', 'Invalid alert conditions')
+
+        alerts = service.alerts.setdefault(key, [])
+        record = {
+            'id': len(alerts) + 1,
+            'stock_symbol': _symbol(alert.stock_symbol),
+            'conditions': alert.conditions,
+            'notification': alert.notification,
+            'created_at': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        }
+        alerts.append(record)
+        return {'status': 'success', 'data': record}
+
+    @app.get('/api/v1/alerts')
+    async def list_alerts(key: str = Depends(authorize)):
+        return {'status': 'success', 'data': service.alerts.get(key, [])}
+
+    @app.get('/api/v1/reports/{stock_symbol}')
+    async def get_report(request: Request, stock_symbol: str,
+                         format: str = 'csv', start_date: Optional[date] = None,
+                         end_date: Optional[date] = None,
+                         key: str = Depends(authorize)):
+        if format != 'csv':
+            raise ApiError(400, 'unsupported_format', f"Unsupported report format: {format!r}")
+        symbol = _symbol(stock_symbol)
+        body, etag = await service.report(symbol, start_date, end_date)
+        response = _cached_response(request, body, etag, service.cache.ttl, 'text/csv')
+        response.headers['Content-Disposition'] = f'attachment; filename="{symbol}.csv"'
+        return response
+
+    return app
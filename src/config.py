@@ -1,4 +1,5 @@
 
 my_tickers = ['AAPL', 'TSLA', 'AMZN']
 my_headers = {'user-agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/103.0.0.0 Safari/537.36'}
-my_deepl_API = 'your_deepl_api_key'
\ No newline at end of file
+my_deepl_API = 'your_deepl_api_key'
+my_translation_cache = 'translation_cache.db'
@@ -2,21 +2,44 @@
 News crawler module for fetching stock-related news from various sources.
 """
 
+import re
 import requests
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Tuple
 import logging
+from ..database.watermarks import PendingWatermarks, WatermarkStore
 from ..utils.config import get_api_key
+from ..utils.http import HttpClient, get_http_client
 
 logger = logging.getLogger(__name__)
 
 class NewsCrawler:
     """News crawler for fetching stock-related news articles."""
     
-    def __init__(self):
-        """Initialize the news crawler with API configurations."""
+    # NewsAPI rejects 'q' values longer than this
+    MAX_QUERY_LENGTH = 500
+    # Largest page NewsAPI will return
+    PAGE_SIZE = 100
+    # Source name used for fetch watermarks
+    SOURCE = 'newsapi'
+    
+    def __init__(self, http_client: HttpClient = None,
+                 watermarks: WatermarkStore = None):
+        """
+        Initialize the news crawler with API configurations.
+        
+        Args:
+            http_client (HttpClient, optional): Transport to use; defaults to
+                the shared pooled client
+            watermarks (WatermarkStore, optional): When given, only articles
+                newer than the previous fetch are requested and returned;
+                the watermarks advance when the articles are passed to commit()
+        """
         self.news_api_key = get_api_key('NEWS_API_KEY')
         self.alpha_vantage_key = get_api_key('ALPHA_VANTAGE_API_KEY')
+        self.http = http_client or get_http_client()
+        self.watermarks = watermarks
+        self.pending = PendingWatermarks(watermarks) if watermarks else None
         
     def fetch_news(self, symbol: str, days: int = 7) -> List[Dict[Any, Any]]:
         """
@@ -30,11 +53,10 @@ class NewsCrawler:
             List[Dict]: List of news articles with metadata
         """
         try:
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=days)
+            end_date = datetime.now(timezone.utc)
             
             # Format dates for API
-            from_date = start_date.strftime('%Y-%m-%d')
+            from_date = self._from_date([symbol], days)
             to_date = end_date.strftime('%Y-%m-%d')
             
             # News API endpoint
@@ -49,13 +71,14 @@ class NewsCrawler:
                 'apiKey': self.news_api_key
             }
             
-            response = requests.get(url, params=params)
+            response = self.http.get(url, params=params)
             response.raise_for_status()
             
             news_data = response.json()
             
             # Process and clean the news data
             processed_news = self._process_news_data(news_data.get('articles', []))
+            processed_news = self._take_new(symbol, processed_news)
             
             logger.info(f"Successfully fetched {len(processed_news)} news articles for {symbol}")
             return processed_news
@@ -64,6 +87,206 @@ class NewsCrawler:
             logger.error(f"Error fetching news for {symbol}: {str(e)}")
             return []
             
+    def fetch_news_batch(self, symbols: List[str], days: int = 7,
+                         max_pages: int = 5) -> Dict[str, List[Dict[Any, Any]]]:
+        """
+        Fetch news articles for many stock symbols with as few requests as possible.
+        
+        Symbols are packed into OR-combined queries up to MAX_QUERY_LENGTH,
+        each query is paginated, and the articles are split back out to the
+        symbols whose ticker appears in their title, description or content.
+        An article mentioning several tickers is returned for each of them.
+        
+        Args:
+            symbols (List[str]): Stock symbols (e.g., ['AAPL', 'MSFT'])
+            days (int): Number of days to look back
+            max_pages (int): Maximum pages to request per query
+            
+        Returns:
+            Dict[str, List[Dict]]: Processed news articles keyed by symbol
+        """
+        results = {symbol: [] for symbol in symbols}
+        end_date = datetime.now(timezone.utc)
+        request_count = 0
+        
+        for group in self._coalesce_symbols(symbols):
+            params = {
+                'q': self._batch_query(group),
+                'from': self._from_date(group, days),
+                'to': end_date.strftime('%Y-%m-%d'),
+                'language': 'en',
+                'sortBy': 'publishedAt',
+                'pageSize': self.PAGE_SIZE,
+                'apiKey': self.news_api_key
+            }
+            
+            articles, pages = self._fetch_pages(params, max_pages)
+            request_count += pages
+            
+            for symbol, matched in self._split_by_symbol(
+                    self._process_news_data(articles), group).items():
+                results[symbol].extend(self._take_new(symbol, matched))
+                
+        logger.info(f"Fetched {sum(len(v) for v in results.values())} news articles "
+                    f"for {len(symbols)} symbols in {request_count} requests")
+        return results
+        
+    def _from_date(self, symbols: List[str], days: int) -> str:
+        """
+        Get the 'from' parameter for a query covering the given symbols.
+        
+        Without watermarks this is the start of the look-back window. With
+        watermarks it is the oldest watermark among the symbols, so the
+        query only asks for the delta since the last run.
+        
+        Args:
+            symbols (List[str]): Symbols covered by the query
+            days (int): Number of days to look back
+            
+        Returns:
+            str: Date or timestamp accepted by NewsAPI
+        """
+        earliest = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=days)
+        window_start = earliest.strftime('%Y-%m-%d')
+        if not self.watermarks:
+            return window_start
+            
+        since = min(self.watermarks.since(symbol, self.SOURCE, earliest) for symbol in symbols)
+        if since == earliest:
+            return window_start
+        return since.strftime('%Y-%m-%dT%H:%M:%S')
+        
+    def _take_new(self, symbol: str, articles: List[Dict]) -> List[Dict]:
+        """
+        Drop articles already seen for a symbol and track them for commit().
+        
+        Args:
+            symbol (str): Stock symbol
+            articles (List[Dict]): Processed news articles
+            
+        Returns:
+            List[Dict]: Articles newer than the symbol's watermark
+        """
+        if not self.watermarks:
+            return articles
+        articles = self.watermarks.filter_new(symbol, self.SOURCE, articles)
+        self.pending.track(symbol, self.SOURCE, articles)
+        return articles
+    
+    def commit(self, articles: List[Dict]):
+        """
+        Record articles as stored, advancing their watermarks.
+        
+        Args:
+            articles (List[Dict]): Articles saved by the caller
+        """
+        if self.pending:
+            self.pending.commit(articles)
+    
+    def release(self, articles: List[Dict]):
+        """
+        Record articles as not stored, so later fetches return them again.
+        
+        Args:
+            articles (List[Dict]): Articles whose save failed
+        """
+        if self.pending:
+            self.pending.release(articles)
+        
+    def _batch_query(self, symbols: List[str]) -> str:
+        """
+        Build an OR-combined NewsAPI query for a group of symbols.
+        
+        Args:
+            symbols (List[str]): Stock symbols
+            
+        Returns:
+            str: Query string
+        """
+        return f"stock AND ({' OR '.join(symbols)})"
+        
+    def _coalesce_symbols(self, symbols: List[str]) -> List[List[str]]:
+        """
+        Greedily pack symbols into groups whose query fits MAX_QUERY_LENGTH.
+        
+        Args:
+            symbols (List[str]): Stock symbols
+            
+        Returns:
+            List[List[str]]: Symbol groups, one per query
+        """
+        groups = []
+        current = []
+        for symbol in dict.fromkeys(symbols):
+            if current and len(self._batch_query(current + [symbol])) > self.MAX_QUERY_LENGTH:
+                groups.append(current)
+                current = []
+            current.append(symbol)
+        if current:
+            groups.append(current)
+        return groups
+        
+    def _fetch_pages(self, params: Dict[str, Any], max_pages: int) -> Tuple[List[Dict], int]:
+        """
+        Request successive result pages for a query.
+        
+        Pagination stops at max_pages, at the last page reported by
+        totalResults, or at the first failed page (keeping earlier pages).
+        
+        Args:
+            params (Dict[str, Any]): NewsAPI query parameters
+            max_pages (int): Maximum pages to request
+            
+        Returns:
+            Tuple[List[Dict], int]: Raw articles and number of requests made
+        """
+        url = "https://newsapi.org/v2/everything"
+        articles = []
+        pages = 0
+        
+        for page in range(1, max_pages + 1):
+            try:
+                pages += 1
+                response = self.http.get(url, params={**params, 'page': page})
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Error fetching page {page} for query {params['q']!r}: {str(e)}")
+                break
+                
+            news_data = response.json()
+            page_articles = news_data.get('articles', [])
+            articles.extend(page_articles)
+            
+            if not page_articles or page * self.PAGE_SIZE >= news_data.get('totalResults', 0):
+                break
+                
+        return articles, pages
+        
+    def _split_by_symbol(self, articles: List[Dict], symbols: List[str]) -> Dict[str, List[Dict]]:
+        """
+        Assign articles to the symbols they mention.
+        
+        Tickers are matched case-sensitively as whole words, so 'AAPL' or
+        '$AAPL' match but 'AAPLX' does not.
+        
+        Args:
+            articles (List[Dict]): Processed news articles
+            symbols (List[str]): Symbols the articles were queried for
+            
+        Returns:
+            Dict[str, List[Dict]]: Articles keyed by symbol, each tagged with 'symbol'
+        """
+        alternatives = '|'.join(re.escape(s) for s in sorted(symbols, key=len, reverse=True))
+        pattern = re.compile(rf'(?<![A-Za-z0-9])({alternatives})(?![A-Za-z0-9])')
+        
+        matched = {symbol: [] for symbol in symbols}
+        for article in articles:
+            text = ' '.join(filter(None, (article['title'], article['description'],
+                                          article['content'])))
+            for symbol in set(pattern.findall(text)):
+                matched[symbol].append({**article, 'symbol': symbol})
+        return matched
+        
     def _process_news_data(self, articles: List[Dict]) -> List[Dict]:
         """
         Process and clean the raw news data.
@@ -0,0 +1,195 @@
+"""
+Archive Module
+Responsible for writing expired news to compressed Parquet files
+"""
+
+from typing import Dict, List, Optional
+from datetime import datetime
+import logging
+import os
+import uuid
+
+import pandas as pd
+
+from .backend import NEWS_COLUMNS, SENTIMENT_COLUMNS
+
+
+class ParquetArchive:
+    """Parquet Archive Class
+
+    Appends chunks of news, joined with their sentiment, to one Parquet
+    file as consecutive row groups. Timestamps are kept as the text stored
+    in the database so archived rows round-trip unchanged.
+
+    The file is only readable once close() has written its footer, so
+    retention, which deletes each chunk as it goes, uses
+    ParquetDatasetArchive instead.
+    """
+
+    def __init__(self, path: str, compression: str = 'zstd', keep_empty: bool = False):
+        """
+        Initialize archive
+
+        The file is created on the first write; an existing file at path
+        is never replaced.
+
+        Args:
+            path: Parquet file to write
+            compression: Parquet codec (default zstd)
+            keep_empty: Write a file with no rows if nothing was written
+
+        Raises:
+            ImportError: If pyarrow is not installed
+            FileExistsError: If path already exists
+        """
+        self._prepare(path)
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Archiving to Parquet requires pyarrow (pip install pyarrow)") from e
+
+        self.path = path
+        self.logger = logging.getLogger(__name__)
+        self._pa = pa
+        self._pq = pq
+        self.compression = compression
+        self.keep_empty = keep_empty
+        self.schema = pa.schema(
+            [('id', pa.int64())]
+            + [(name, pa.string()) for name in NEWS_COLUMNS if name != 'id']
+            + [(name, pa.float64()) for name in SENTIMENT_COLUMNS]
+        )
+        self._writer: Optional['pq.ParquetWriter'] = None
+        self._file = None
+        self.rows = 0
+
+    @staticmethod
+    def _prepare(path: str):
+        """Check that path can be written without replacing a file"""
+        if os.path.exists(path):
+            raise FileExistsError(f"Refusing to overwrite existing archive {path}")
+
+    def write(self, frame: pd.DataFrame):
+        """
+        Append a chunk of rows
+
+        Args:
+            frame: Rows with the columns of NEWS_COLUMNS and SENTIMENT_COLUMNS
+        """
+        if frame.empty:
+            return
+        table = self._table(frame)
+        if self._writer is None:
+            self._file = open(self.path, 'xb')
+            self._writer = self._pq.ParquetWriter(self._file, self.schema,
+                                                  compression=self.compression)
+        self._writer.write_table(table)
+        self.rows += len(frame)
+
+    def _table(self, frame: pd.DataFrame):
+        """Convert rows to an Arrow table of the archive schema"""
+        frame = frame[list(self.schema.names)].copy()
+        for name in NEWS_COLUMNS:
+            if name != 'id':
+                frame[name] = frame[name].map(lambda v: None if v is None or v != v else str(v))
+        return self._pa.Table.from_pandas(frame, schema=self.schema, preserve_index=False)
+
+    def save_news(self, news: List[Dict], batch_size: Optional[int] = None) -> bool:
+        """
+        Append scored articles, as Database.save_news would store them
+
+        Lets an archive stand in for the database as a pipeline sink.
+
+        Args:
+            news: List of news articles
+            batch_size: Unused; accepted for Database compatibility
+
+        Returns:
+            Success status
+        """
+        created_at = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+        rows = []
+        for article in news:
+            sentiment = article.get('sentiment') or {}
+            row = {name: article.get(name) for name in NEWS_COLUMNS}
+            row['created_at'] = row['created_at'] or created_at
+            row.update(compound=sentiment.get('compound'), positive=sentiment.get('pos'),
+                       neutral=sentiment.get('neu'), negative=sentiment.get('neg'))
+            rows.append(row)
+        self.write(pd.DataFrame(rows, columns=list(self.schema.names)))
+        return True
+
+    def close(self):
+        """Finish the file"""
+        if self._writer is None and self.keep_empty:
+            with open(self.path, 'xb') as fh:
+                self._pq.write_table(self.schema.empty_table(), fh,
+                                     compression=self.compression)
+            self.logger.info(f"No news rows to write, created empty {self.path}")
+        if self._writer is not None:
+            self._writer.close()
+            self._file.close()
+            self._writer = None
+            self._file = None
+            self.logger.info(f"Archived {self.rows} news rows to {self.path}")
+
+
+class ParquetDatasetArchive(ParquetArchive):
+    """Parquet Dataset Archive Class
+
+    Writes each chunk to its own new file in a dataset directory. The file
+    is written under a hidden temporary name, synced and then renamed, so
+    by the time write() returns, and the caller deletes the chunk, its
+    rows are in a complete file. Files are never overwritten, so repeated
+    runs add to the dataset, which reads back with
+    pd.read_parquet(directory). A chunk whose deletion fails after it was
+    archived is archived again by the next run.
+    """
+
+    def __init__(self, path: str, compression: str = 'zstd'):
+        """
+        Initialize archive
+
+        Args:
+            path: Dataset directory, created if needed
+            compression: Parquet codec (default zstd)
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        super().__init__(path, compression)
+        self.files: List[str] = []
+
+    @staticmethod
+    def _prepare(path: str):
+        """Create the dataset directory"""
+        os.makedirs(path, exist_ok=True)
+
+    def write(self, frame: pd.DataFrame):
+        """
+        Write a chunk of rows to a new file
+
+        Args:
+            frame: Rows with the columns of NEWS_COLUMNS and SENTIMENT_COLUMNS
+        """
+        if frame.empty:
+            return
+        table = self._table(frame)
+        stamp = datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')
+        name = f"archive-{stamp}-{uuid.uuid4().hex[:8]}.parquet"
+        # Leading '.': readers of the dataset skip unfinished files
+        temp = os.path.join(self.path, f".{name}.tmp")
+        with open(temp, 'xb') as fh:
+            self._pq.write_table(table, fh, compression=self.compression)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.rename(temp, os.path.join(self.path, name))
+        self.files.append(name)
+        self.rows += len(frame)
+
+    def close(self):
+        """Report what was archived"""
+        if self.files:
+            self.logger.info(f"Archived {self.rows} news rows to {len(self.files)} files "
+                             f"in {self.path}")
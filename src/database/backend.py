@@ -0,0 +1,200 @@
+"""
+Storage Backend Module
+Responsible for the interface shared by all storage engines
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Dict, Iterator, Optional, Sequence, Tuple
+import pandas as pd
+
+# Columns query_news can return, in default order
+NEWS_COLUMNS = ('id', 'symbol', 'title', 'content', 'source', 'url', 'published_at', 'created_at')
+SENTIMENT_COLUMNS = ('compound', 'positive', 'neutral', 'negative')
+DATE_COLUMNS = ('published_at', 'created_at')
+
+
+class StorageBackend(ABC):
+    """Storage Backend Base Class
+
+    Backends raise on failure; Database turns errors into logged status
+    values for its callers.
+    """
+
+    @abstractmethod
+    def save_news(self, news: List[Dict], batch_size: int):
+        """
+        Upsert news and their sentiment scores
+
+        Args:
+            news: List of news articles
+            batch_size: Articles per transaction
+        """
+
+    @abstractmethod
+    def query_news(self, symbol: str, days: Optional[int] = None,
+                   columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Query news data joined with sentiment
+
+        Args:
+            symbol: Stock symbol
+            days: Number of days
+            columns: Columns to load (default: all of NEWS_COLUMNS and
+                SENTIMENT_COLUMNS)
+
+        Returns:
+            DataFrame of news articles
+        """
+
+    @abstractmethod
+    def iter_news(self, symbol: str, days: Optional[int] = None,
+                  columns: Optional[Sequence[str]] = None,
+                  chunk_size: int = 10000) -> Iterator[pd.DataFrame]:
+        """
+        Query news data in chunks
+
+        Args:
+            symbol: Stock symbol
+            days: Number of days
+            columns: Columns to load, as for query_news
+            chunk_size: Rows per DataFrame
+
+        Yields:
+            DataFrames of up to chunk_size articles
+        """
+
+    @staticmethod
+    def _projection(columns: Optional[Sequence[str]] = None) -> Tuple[str, bool, List[str]]:
+        """
+        Build the select list for a column projection
+
+        Args:
+            columns: Requested columns (default: all)
+
+        Returns:
+            Select list, whether the sentiment join is needed, and the date
+            columns to parse
+
+        Raises:
+            ValueError: If a column is unknown
+        """
+        columns = list(columns or NEWS_COLUMNS + SENTIMENT_COLUMNS)
+        unknown = [c for c in columns if c not in NEWS_COLUMNS + SENTIMENT_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown news columns: {unknown}")
+
+        select = ', '.join(f"{'s' if c in SENTIMENT_COLUMNS else 'n'}.{c}" for c in columns)
+        needs_sentiment = any(c in SENTIMENT_COLUMNS for c in columns)
+        return select, needs_sentiment, [c for c in columns if c in DATE_COLUMNS]
+
+    @abstractmethod
+    def query_daily(self, symbol: str, days: Optional[int] = None,
+                    by_source: bool = False) -> pd.DataFrame:
+        """
+        Query the daily sentiment rollup
+
+        Args:
+            symbol: Stock symbol
+            days: Number of days
+            by_source: Keep one row per source instead of per day
+
+        Returns:
+            DataFrame with day, source (if by_source), count, score_sum,
+            score_sumsq, pos_count, neu_count and neg_count
+        """
+
+    @staticmethod
+    def _daily_stats(frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add mean and (population) std columns to rollup rows
+
+        Args:
+            frame: Rows with count, score_sum and score_sumsq
+
+        Returns:
+            The same frame with mean and std columns
+        """
+        frame['day'] = pd.to_datetime(frame['day'])
+        frame['mean'] = frame['score_sum'] / frame['count']
+        variance = frame['score_sumsq'] / frame['count'] - frame['mean'] ** 2
+        frame['std'] = variance.clip(lower=0) ** 0.5
+        return frame
+
+    def search_news(self, query: str, symbol: Optional[str] = None, days: Optional[int] = None,
+                    limit: int = 50) -> pd.DataFrame:
+        """
+        Full-text search over news titles and content, best match first
+
+        Args:
+            query: FTS5 query, e.g. 'merger AND "share buyback"'. Quote
+                user input with fts_phrase
+            symbol: Only match this stock symbol
+            days: Only match articles from the last days
+            limit: Maximum number of results
+
+        Returns:
+            DataFrame of matching articles with rank and snippet columns
+
+        Raises:
+            NotImplementedError: If the backend has no full-text index
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support full-text search")
+
+    @abstractmethod
+    def clean_data(self, days: int, chunk_size: int = 5000, archive=None) -> int:
+        """
+        Delete news and sentiment older than the given number of days
+
+        Rows are deleted in chunks of consecutive ids, one short
+        transaction per chunk, so ingestion can interleave with retention.
+
+        Args:
+            days: Days to keep
+            chunk_size: Expired articles deleted per transaction
+            archive: Optional ParquetArchive receiving each chunk before
+                it is deleted
+
+        Returns:
+            Number of news rows deleted
+        """
+
+    @abstractmethod
+    def close(self):
+        """Release connections"""
+
+
+def fts_phrase(text: str) -> str:
+    """
+    Quote text as an FTS5 phrase so it matches literally
+
+    Args:
+        text: Words to match in sequence
+
+    Returns:
+        Phrase usable in a search_news query
+    """
+    return '"' + text.replace('"', '""') + '"'
+
+
+def create_backend(config: Dict) -> StorageBackend:
+    """
+    Build the storage backend selected by config['backend']
+
+    Args:
+        config: Database configuration dictionary. 'backend' is 'sqlite'
+            (default) or 'sqlalchemy'
+
+    Returns:
+        Storage backend
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    name = config.get('backend', 'sqlite')
+    if name == 'sqlite':
+        from .sqlite_backend import SQLiteBackend
+        return SQLiteBackend(config)
+    if name == 'sqlalchemy':
+        from .sqlalchemy_backend import SQLAlchemyBackend
+        return SQLAlchemyBackend(config)
+    raise ValueError(f"Unknown storage backend: {name}")
@@ -0,0 +1,122 @@
+"""
+Connection Manager Module
+Responsible for sharing tuned SQLite connections between threads
+"""
+
+from typing import Dict, Iterator, List
+from contextlib import contextmanager
+import sqlite3
+import threading
+import logging
+
+
+class ConnectionManager:
+    """Connection Manager Class
+
+    Keeps one persistent writer connection, serialised by a lock, and one
+    persistent read-only connection per thread. The database runs in WAL
+    journal mode, so readers see the last committed state and never block
+    the writer (or each other) while ingestion is running.
+    """
+
+    def __init__(self, db_path: str, config: Dict = None):
+        """
+        Initialize connection manager
+
+        Args:
+            db_path: SQLite database file
+            config: Configuration dictionary. Recognised keys:
+                synchronous: OFF, NORMAL (default) or FULL
+                mmap_size: Bytes of the file to memory-map (default 256 MiB)
+                cache_size: Page cache size as for PRAGMA cache_size
+                    (default -65536, i.e. 64 MiB)
+                busy_timeout: Milliseconds to wait on a locked database
+                    (default 5000)
+                auto_vacuum: NONE, FULL or INCREMENTAL (default). Only
+                    takes effect when the database file is created
+        """
+        self.db_path = db_path
+        self.config = config or {}
+        self.logger = logging.getLogger(__name__)
+        self._write_lock = threading.RLock()
+        self._local = threading.local()
+        self._readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        self._writer = self._connect()
+        auto_vacuum = str(self.config.get('auto_vacuum', 'INCREMENTAL')).upper()
+        if auto_vacuum not in ('NONE', 'FULL', 'INCREMENTAL'):
+            raise ValueError(f"Invalid auto_vacuum mode: {auto_vacuum}")
+        # Must precede the first table; ignored by existing files until VACUUM
+        self._writer.execute(f"PRAGMA auto_vacuum = {auto_vacuum}")
+        self._writer.execute("PRAGMA journal_mode = WAL")
+
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """Open a connection with the configured pragmas"""
+        synchronous = str(self.config.get('synchronous', 'NORMAL')).upper()
+        if synchronous not in ('OFF', 'NORMAL', 'FULL', 'EXTRA'):
+            raise ValueError(f"Invalid synchronous level: {synchronous}")
+
+        conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                               timeout=self.config.get('busy_timeout', 5000) / 1000)
+        conn.execute(f"PRAGMA synchronous = {synchronous}")
+        conn.execute(f"PRAGMA mmap_size = {int(self.config.get('mmap_size', 256 * 1024 * 1024))}")
+        conn.execute(f"PRAGMA cache_size = {int(self.config.get('cache_size', -65536))}")
+        conn.execute(f"PRAGMA busy_timeout = {int(self.config.get('busy_timeout', 5000))}")
+        if read_only:
+            conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow the writer connection inside a write transaction
+
+        The transaction is committed when the block exits normally and
+        rolled back if it raises. Nested use from the same thread joins the
+        outer transaction.
+
+        Yields:
+            Writer connection
+        """
+        with self._write_lock:
+            if self._writer.in_transaction:
+                yield self._writer
+                return
+
+            self._writer.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._writer
+                self._writer.commit()
+            except Exception:
+                self._writer.rollback()
+                raise
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow this thread's read-only connection
+
+        Yields:
+            Reader connection
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._connect(read_only=True)
+            self._local.conn = conn
+            with self._readers_lock:
+                self._readers.append(conn)
+        try:
+            yield conn
+        finally:
+            # End the implicit read transaction so the WAL can be checkpointed
+            if conn.in_transaction:
+                conn.rollback()
+
+    def close(self):
+        """Close all connections"""
+        with self._readers_lock:
+            for conn in self._readers:
+                conn.close()
+            self._readers.clear()
+        with self._write_lock:
+            self._writer.close()
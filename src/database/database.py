@@ -3,11 +3,13 @@ Database Module
 Responsible for data storage and retrieval
 """
 
-from typing import List, Dict, Optional
-import sqlite3
-import pandas as pd
+from typing import List, Dict, Iterator, Optional, Sequence
 import logging
-from datetime import datetime
+
+import pandas as pd
+
+from .archive import ParquetDatasetArchive
+from .backend import StorageBackend, create_backend
 
 class Database:
     """Database Class"""
@@ -17,175 +19,255 @@ class Database:
         Initialize database
         
         Args:
-            config: Configuration dictionary
+            config: Configuration dictionary. 'backend' selects the storage
+                engine: 'sqlite' (default, see SQLiteBackend) or
+                'sqlalchemy' (PostgreSQL, see SQLAlchemyBackend)
         """
         self.config = config or {}
         self.db_path = self.config.get('db_path', 'stock_news.db')
         self.logger = logging.getLogger(__name__)
-        self._init_db()
+        self.backend = self._init_db()
         
-    def _init_db(self):
-        """Initialize database tables"""
+    def _init_db(self) -> StorageBackend:
+        """Initialize the storage backend and its schema"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Create news table
-                cursor.execute("""
-                CREATE TABLE IF NOT EXISTS news (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    symbol TEXT NOT NULL,
-                    title TEXT NOT NULL,
-                    content TEXT,
-                    source TEXT,
-                    url TEXT,
-                    published_at DATETIME,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-                """)
-                
-                # Create sentiment table
-                cursor.execute("""
-                CREATE TABLE IF NOT EXISTS sentiment (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    news_id INTEGER,
-                    compound REAL,
-                    positive REAL,
-                    neutral REAL,
-                    negative REAL,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (news_id) REFERENCES news (id)
-                )
-                """)
-                
-                conn.commit()
+            return create_backend(self.config)
                 
         except Exception as e:
             self.logger.error(f"Error initializing database: {e}")
             raise
     
-    def save_news(self, news: List[Dict]) -> bool:
+    def save_news(self, news: List[Dict], batch_size: Optional[int] = None) -> bool:
         """
         Save news data
         
+        Articles are upserted in bulk, news rows first and then their
+        sentiment rows, in one transaction per batch.
+        
         Args:
             news: List of news articles
+            batch_size: Articles per transaction (default: config
+                'insert_batch_size' or 5000)
             
         Returns:
             Success status
         """
+        batch_size = batch_size or self.config.get('insert_batch_size', 5000)
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                for article in news:
-                    # Insert news
-                    cursor.execute("""
-                    INSERT INTO news (symbol, title, content, source, url, published_at)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    """, (
-                        article['symbol'],
-                        article['title'],
-                        article.get('content'),
-                        article.get('source'),
-                        article.get('url'),
-                        article.get('published_at')
-                    ))
-                    
-                    # Get news ID
-                    news_id = cursor.lastrowid
-                    
-                    # Insert sentiment
-                    if 'sentiment' in article:
-                        cursor.execute("""
-                        INSERT INTO sentiment (news_id, compound, positive, neutral, negative)
-                        VALUES (?, ?, ?, ?, ?)
-                        """, (
-                            news_id,
-                            article['sentiment'].get('compound'),
-                            article['sentiment'].get('pos'),
-                            article['sentiment'].get('neu'),
-                            article['sentiment'].get('neg')
-                        ))
-                
-                conn.commit()
-                return True
+            self.backend.save_news(news, batch_size)
+            return True
                 
         except Exception as e:
             self.logger.error(f"Error saving news: {e}")
             return False
     
-    def query_news(self, symbol: str, days: Optional[int] = None) -> List[Dict]:
+    def query_news(self, symbol: str, days: Optional[int] = None,
+                   columns: Optional[Sequence[str]] = None) -> List[Dict]:
         """
         Query news data
         
+        Prefer query_news_frame for analysis: building one dict per row is
+        the dominant cost on large result sets.
+        
         Args:
             symbol: Stock symbol
             days: Number of days
+            columns: Columns to load (default: all)
             
         Returns:
             List of news articles
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                # Convert to DataFrame
-                query = """
-                SELECT n.*, s.compound, s.positive, s.neutral, s.negative
-                FROM news n
-                LEFT JOIN sentiment s ON n.id = s.news_id
-                WHERE n.symbol = ?
-                """
-                
-                params = [symbol]
+            return self.backend.query_news(symbol, days, columns).to_dict('records')
                 
-                if days:
-                    query += " AND n.published_at >= date('now', ?)"
-                    params.append(f'-{days} days')
+        except Exception as e:
+            self.logger.error(f"Error querying news: {e}")
+            return []
+    
+    def query_news_frame(self, symbol: str, days: Optional[int] = None,
+                         columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Query news data as a DataFrame
+        
+        Args:
+            symbol: Stock symbol
+            days: Number of days
+            columns: Columns to load (default: all). Leave out 'content'
+                when article bodies are not needed
+            
+        Returns:
+            DataFrame of news articles (empty on error)
+        """
+        try:
+            return self.backend.query_news(symbol, days, columns)
                 
-                df = pd.read_sql_query(
-                    query,
-                    conn,
-                    params=params,
-                    parse_dates=['published_at', 'created_at']
-                )
+        except Exception as e:
+            self.logger.error(f"Error querying news: {e}")
+            return pd.DataFrame()
+    
+    def iter_news_frames(self, symbol: str, days: Optional[int] = None,
+                         columns: Optional[Sequence[str]] = None,
+                         chunk_size: int = 10000) -> Iterator[pd.DataFrame]:
+        """
+        Query news data as a stream of DataFrames
+        
+        Unlike the other query methods, errors are raised rather than
+        logged, since a partial stream cannot be told apart from a complete
+        one.
+        
+        Args:
+            symbol: Stock symbol
+            days: Number of days
+            columns: Columns to load (default: all)
+            chunk_size: Rows per DataFrame
+            
+        Yields:
+            DataFrames of up to chunk_size articles
+        """
+        yield from self.backend.iter_news(symbol, days, columns, chunk_size)
+    
+    def query_news_arrow(self, symbol: str, days: Optional[int] = None,
+                         columns: Optional[Sequence[str]] = None):
+        """
+        Query news data as an Arrow table
+        
+        Args:
+            symbol: Stock symbol
+            days: Number of days
+            columns: Columns to load (default: all)
+            
+        Returns:
+            pyarrow.Table of news articles
+            
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError("query_news_arrow requires pyarrow (pip install pyarrow)") from e
+        
+        return pa.Table.from_pandas(self.query_news_frame(symbol, days, columns),
+                                    preserve_index=False)
+    
+    def search_news(self, query: str, symbol: Optional[str] = None, days: Optional[int] = None,
+                    limit: int = 50) -> pd.DataFrame:
+        """
+        Search news titles and content, best match first
+        
+        Args:
+            query: FTS5 query, e.g. 'merger AND "share buyback"'; use
+                fts_phrase to match user input literally
+            symbol: Only match this stock symbol
+            days: Only match articles from the last days
+            limit: Maximum number of results
+            
+        Returns:
+            DataFrame with id, symbol, title, source, url, published_at,
+            snippet and rank (lower is better; empty on error)
+        """
+        try:
+            return self.backend.search_news(query, symbol, days, limit)
                 
-                return df.to_dict('records')
+        except Exception as e:
+            self.logger.error(f"Error searching news: {e}")
+            return pd.DataFrame()
+    
+    def query_daily(self, symbol: str, days: Optional[int] = None,
+                    by_source: bool = False) -> pd.DataFrame:
+        """
+        Query daily sentiment statistics from the rollup table
+        
+        Reads one row per (day, source) rather than one per article.
+        
+        Args:
+            symbol: Stock symbol
+            days: Number of days
+            by_source: Break each day down by news source
+            
+        Returns:
+            DataFrame with day, source (if by_source), count, mean, std and
+            pos/neu/neg counts (empty on error)
+        """
+        try:
+            return self.backend.query_daily(symbol, days, by_source)
                 
         except Exception as e:
-            self.logger.error(f"Error querying news: {e}")
-            return []
+            self.logger.error(f"Error querying daily sentiment: {e}")
+            return pd.DataFrame()
+    
+    def sentiment_summary(self, symbol: str, days: Optional[int] = None) -> Dict:
+        """
+        Summarise stored sentiment over a window using the rollup table
+        
+        Args:
+            symbol: Stock symbol
+            days: Number of days
+            
+        Returns:
+            Dictionary with article_count, sentiment_score (mean compound),
+            sentiment_std and sentiment_distribution
+        """
+        daily = self.query_daily(symbol, days)
+        count = int(daily['count'].sum()) if not daily.empty else 0
+        if not count:
+            return {
+                'article_count': 0,
+                'sentiment_score': 0.0,
+                'sentiment_std': 0.0,
+                'sentiment_distribution': {'positive': 0, 'neutral': 0, 'negative': 0}
+            }
+        
+        mean = daily['score_sum'].sum() / count
+        variance = max(daily['score_sumsq'].sum() / count - mean ** 2, 0.0)
+        return {
+            'article_count': count,
+            'sentiment_score': float(mean),
+            'sentiment_std': float(variance ** 0.5),
+            'sentiment_distribution': {
+                'positive': int(daily['pos_count'].sum()),
+                'neutral': int(daily['neu_count'].sum()),
+                'negative': int(daily['neg_count'].sum())
+            }
+        }
+    
+    def close(self):
+        """Close database connections"""
+        self.backend.close()
     
-    def clean_data(self, days: int) -> bool:
+    def clean_data(self, days: int, archive_path: Optional[str] = None,
+                   chunk_size: Optional[int] = None) -> bool:
         """
         Clean old data
         
+        Expired rows are deleted in short chunked transactions, so this can
+        run while ingestion continues.
+        
         Args:
             days: Days to keep
+            archive_path: Parquet dataset directory to archive expired
+                rows to before deleting them, one new file per chunk
+                (requires pyarrow)
+            chunk_size: Articles deleted per transaction (default: config
+                'retention_chunk_size' or 5000)
             
         Returns:
             Success status
         """
+        chunk_size = chunk_size or self.config.get('retention_chunk_size', 5000)
+        archive = None
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Delete old data
-                cursor.execute("""
-                DELETE FROM sentiment
-                WHERE news_id IN (
-                    SELECT id FROM news
-                    WHERE published_at < date('now', ?)
-                )
-                """, (f'-{days} days',))
-                
-                cursor.execute("""
-                DELETE FROM news
-                WHERE published_at < date('now', ?)
-                """, (f'-{days} days',))
-                
-                conn.commit()
-                return True
+            if archive_path:
+                archive = ParquetDatasetArchive(archive_path)
+            self.backend.clean_data(days, chunk_size, archive)
+            return True
                 
         except Exception as e:
             self.logger.error(f"Error cleaning data: {e}")
             return False
+        
+        finally:
+            if archive is not None:
+                archive.close()
@@ -0,0 +1,579 @@
+"""
+SQLAlchemy Storage Backend Module
+Responsible for storing news in a shared PostgreSQL database
+"""
+
+from typing import List, Dict, Iterator, Optional, Sequence, Tuple
+from datetime import datetime, timedelta, timezone
+import io
+import logging
+import re
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import (BigInteger, Column, Date, DateTime, Float, ForeignKey, Index, MetaData,
+                        Table, Text, UniqueConstraint, create_engine, func, inspect, text)
+from sqlalchemy.engine import URL, make_url
+
+from .backend import StorageBackend
+from .migrations import ROLLUP_THRESHOLD
+from .watermarks import parse_timestamp
+from ..utils.config import get_db_config
+
+metadata = MetaData()
+
+news_table = Table(
+    'news', metadata,
+    Column('id', BigInteger, primary_key=True, autoincrement=True),
+    Column('symbol', Text, nullable=False),
+    Column('title', Text, nullable=False),
+    Column('content', Text),
+    Column('source', Text),
+    Column('url', Text),
+    Column('published_at', DateTime),
+    Column('created_at', DateTime, server_default=func.now()),
+    UniqueConstraint('symbol', 'url', name='uq_news_symbol_url'),
+    Index('idx_news_symbol_published', 'symbol', 'published_at'),
+    Index('idx_news_published', 'published_at'),
+)
+
+sentiment_table = Table(
+    'sentiment', metadata,
+    Column('id', BigInteger, primary_key=True, autoincrement=True),
+    Column('news_id', BigInteger, ForeignKey('news.id'), unique=True),
+    Column('compound', Float),
+    Column('positive', Float),
+    Column('neutral', Float),
+    Column('negative', Float),
+    Column('created_at', DateTime, server_default=func.now()),
+)
+
+sentiment_daily_table = Table(
+    'sentiment_daily', metadata,
+    Column('symbol', Text, primary_key=True),
+    Column('day', Date, primary_key=True),
+    Column('source', Text, primary_key=True),
+    Column('count', BigInteger, nullable=False, server_default='0'),
+    Column('score_sum', Float, nullable=False, server_default='0'),
+    Column('score_sumsq', Float, nullable=False, server_default='0'),
+    Column('pos_count', BigInteger, nullable=False, server_default='0'),
+    Column('neu_count', BigInteger, nullable=False, server_default='0'),
+    Column('neg_count', BigInteger, nullable=False, server_default='0'),
+)
+
+# Full-text document of a news row: title weighted A (1.0 in _SEARCH_WEIGHTS)
+# over content D (0.25), the same 4:1 ratio as SQLiteBackend's BM25 weights.
+# Also the expression of idx_news_search, so searches can use that index.
+_SEARCH_VECTOR = ("(setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+                  "setweight(to_tsvector('english', coalesce(content, '')), 'D'))")
+_SEARCH_WEIGHTS = "'{0.25, 0.0, 0.0, 1.0}'"
+
+# Column order shared by the staging table, COPY and the executemany fallback
+_STAGE_COLUMNS = ['pos', 'symbol', 'title', 'content', 'source', 'url', 'published_at',
+                  'has_sentiment', 'compound', 'positive', 'neutral', 'negative']
+
+
+class SQLAlchemyBackend(StorageBackend):
+    """SQLAlchemy Storage Backend Class
+
+    Uses a pooled SQLAlchemy engine against PostgreSQL so several crawler
+    nodes can write to one store. Each batch is streamed into a temporary
+    staging table with COPY and merged into news and sentiment with
+    set-based upserts.
+
+    sentiment_daily is maintained by taking scores out before they change
+    and adding them back after. That is only correct if no other
+    transaction changes the same articles in between, so every
+    transaction writing news takes a transaction-scoped advisory lock per
+    symbol first: writers of the same symbol queue up, others run in
+    parallel.
+    """
+
+    def __init__(self, config: Dict = None):
+        """
+        Initialize backend
+
+        Args:
+            config: Configuration dictionary. Recognised keys:
+                db_url: SQLAlchemy URL (default: built from DB_* environment
+                    variables via get_db_config)
+                pool_size: Persistent connections per process (default 5)
+                max_overflow: Extra connections under load (default 10)
+                pool_recycle: Seconds before a connection is recycled (default 1800)
+        """
+        self.config = config or {}
+        self.logger = logging.getLogger(__name__)
+        url = make_url(self.config.get('db_url') or self._default_url())
+        if url.get_backend_name() != 'postgresql':
+            raise ValueError(f"SQLAlchemyBackend requires PostgreSQL, not {url.get_backend_name()}")
+
+        self.engine = create_engine(
+            url,
+            pool_size=self.config.get('pool_size', 5),
+            max_overflow=self.config.get('max_overflow', 10),
+            pool_recycle=self.config.get('pool_recycle', 1800),
+            pool_pre_ping=True
+        )
+        backfill = not inspect(self.engine).has_table('sentiment_daily')
+        metadata.create_all(self.engine)
+        with self.engine.begin() as conn:
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS idx_news_search ON news USING gin ({_SEARCH_VECTOR})"))
+            if backfill:
+                self._update_rollup(conn, 1, 'TRUE')
+
+    @staticmethod
+    def _default_url() -> URL:
+        """Build a PostgreSQL URL from the environment"""
+        db = get_db_config()
+        return URL.create(
+            'postgresql+psycopg2',
+            username=db['user'] or None,
+            password=db['password'] or None,
+            host=db['host'],
+            port=db['port'],
+            database=db['database']
+        )
+
+    def save_news(self, news: List[Dict], batch_size: int):
+        """
+        Save news data, one transaction per batch
+
+        Args:
+            news: List of news articles
+            batch_size: Articles per transaction
+        """
+        for start in range(0, len(news), batch_size):
+            with self.engine.begin() as conn:
+                self._insert_batch(conn, news[start:start + batch_size])
+
+    def _stage_rows(self, batch: List[Dict]) -> List[list]:
+        """Convert articles to staging rows in _STAGE_COLUMNS order"""
+        rows = []
+        for pos, article in enumerate(batch):
+            sentiment = article.get('sentiment')
+            published = parse_timestamp(article.get('published_at'))
+            rows.append([
+                pos,
+                article['symbol'],
+                article['title'],
+                article.get('content'),
+                article.get('source'),
+                article.get('url') or None,
+                published.isoformat() if published else None,
+                sentiment is not None,
+                self._score(sentiment, 'compound'),
+                self._score(sentiment, 'pos'),
+                self._score(sentiment, 'neu'),
+                self._score(sentiment, 'neg'),
+            ])
+        return rows
+
+    @staticmethod
+    def _score(sentiment: Optional[Dict], key: str) -> Optional[float]:
+        """Get a score as a plain float; analyzers may return NumPy scalars"""
+        value = sentiment.get(key) if sentiment else None
+        return None if value is None else float(value)
+
+    @staticmethod
+    def _csv_field(value) -> str:
+        """Format a value for COPY CSV: bare empty field is NULL, strings are always quoted"""
+        if isinstance(value, np.generic):
+            value = value.item()
+        if value is None:
+            return ''
+        if isinstance(value, bool):
+            return 't' if value else 'f'
+        if isinstance(value, (int, float)):
+            return str(value)
+        return '"' + str(value).replace('"', '""') + '"'
+
+    def _copy_into_stage(self, conn, rows: List[list]):
+        """
+        Load staging rows with COPY, falling back to executemany
+
+        Args:
+            conn: SQLAlchemy connection inside the batch transaction
+            rows: Staging rows
+        """
+        columns = ', '.join(_STAGE_COLUMNS)
+        raw = conn.connection.driver_connection
+        cursor = raw.cursor()
+
+        if hasattr(cursor, 'copy_expert') or hasattr(cursor, 'copy'):
+            buffer = io.StringIO()
+            buffer.writelines(','.join(map(self._csv_field, row)) + '\n' for row in rows)
+            sql = f"COPY news_stage ({columns}) FROM STDIN WITH (FORMAT csv)"
+            if hasattr(cursor, 'copy_expert'):
+                buffer.seek(0)
+                cursor.copy_expert(sql, buffer)
+            else:
+                with cursor.copy(sql) as copy:
+                    copy.write(buffer.getvalue())
+            return
+
+        placeholders = ', '.join(f':{name}' for name in _STAGE_COLUMNS)
+        conn.execute(text(f"INSERT INTO news_stage ({columns}) VALUES ({placeholders})"),
+                     [dict(zip(_STAGE_COLUMNS, row)) for row in rows])
+
+    def _insert_batch(self, conn, batch: List[Dict]):
+        """
+        Upsert one batch of news and sentiment rows
+
+        Mirrors SQLiteBackend: articles with a URL are upserted on
+        (symbol, url), articles without one are inserted, and the latest
+        score per article wins. The batch's symbols are locked before any
+        article is read, so concurrent upserts of the same article from
+        other nodes cannot both take its old score out of the rollup.
+
+        Args:
+            conn: SQLAlchemy connection inside the batch transaction
+            batch: News articles
+        """
+        conn.exec_driver_sql("""
+        CREATE TEMP TABLE IF NOT EXISTS news_stage (
+            pos INTEGER,
+            symbol TEXT,
+            title TEXT,
+            content TEXT,
+            source TEXT,
+            url TEXT,
+            published_at TIMESTAMP,
+            has_sentiment BOOLEAN,
+            compound DOUBLE PRECISION,
+            positive DOUBLE PRECISION,
+            neutral DOUBLE PRECISION,
+            negative DOUBLE PRECISION,
+            news_id BIGINT
+        ) ON COMMIT DELETE ROWS
+        """)
+        self._copy_into_stage(conn, self._stage_rows(batch))
+        self._lock_symbols(conn, "SELECT symbol FROM news_stage")
+
+        # Take the current scores of re-crawled articles out of the rollup;
+        # they are added back below with their new values
+        self._update_rollup(conn, -1, """
+        (n.symbol, n.url) IN (SELECT symbol, url FROM news_stage WHERE url IS NOT NULL)
+        """)
+
+        conn.exec_driver_sql("""
+        INSERT INTO news (symbol, title, content, source, url, published_at)
+        SELECT DISTINCT ON (symbol, url) symbol, title, content, source, url, published_at
+        FROM news_stage
+        WHERE url IS NOT NULL
+        ORDER BY symbol, url, pos DESC
+        ON CONFLICT (symbol, url) DO UPDATE SET
+            title = excluded.title,
+            content = excluded.content,
+            source = excluded.source,
+            published_at = excluded.published_at
+        """)
+        conn.exec_driver_sql("""
+        UPDATE news_stage s SET news_id = n.id
+        FROM news n
+        WHERE s.url IS NOT NULL AND n.symbol = s.symbol AND n.url = s.url
+        """)
+
+        conn.exec_driver_sql("""
+        UPDATE news_stage SET news_id = nextval(pg_get_serial_sequence('news', 'id'))
+        WHERE url IS NULL
+        """)
+        conn.exec_driver_sql("""
+        INSERT INTO news (id, symbol, title, content, source, url, published_at)
+        SELECT news_id, symbol, title, content, source, url, published_at
+        FROM news_stage
+        WHERE url IS NULL
+        """)
+
+        conn.exec_driver_sql("""
+        INSERT INTO sentiment (news_id, compound, positive, neutral, negative)
+        SELECT DISTINCT ON (news_id) news_id, compound, positive, neutral, negative
+        FROM news_stage
+        WHERE has_sentiment
+        ORDER BY news_id, pos DESC
+        ON CONFLICT (news_id) DO UPDATE SET
+            compound = excluded.compound,
+            positive = excluded.positive,
+            neutral = excluded.neutral,
+            negative = excluded.negative
+        """)
+
+        self._update_rollup(conn, 1, "n.id IN (SELECT news_id FROM news_stage)")
+
+    @staticmethod
+    def _lock_symbols(conn, symbols: str, params: Optional[Dict] = None):
+        """
+        Serialize writers per symbol until the end of the transaction
+
+        Locks are taken in key order, so transactions locking overlapping
+        sets of symbols cannot deadlock.
+
+        Args:
+            conn: SQLAlchemy connection inside the transaction
+            symbols: Query returning a symbol column
+            params: Parameters of the query
+        """
+        conn.execute(text(f"""
+        SELECT pg_advisory_xact_lock(key) FROM (
+            SELECT DISTINCT hashtextextended('news:' || symbol, 0) AS key
+            FROM ({symbols}) AS symbols
+            ORDER BY key
+        ) AS keys
+        """), params or {})
+
+    @staticmethod
+    def _update_rollup(conn, sign: int, where: str, params: Optional[Dict] = None):
+        """
+        Add (sign=1) or remove (sign=-1) the scores of matching articles
+        in sentiment_daily
+
+        Args:
+            conn: SQLAlchemy connection inside the batch transaction
+            sign: 1 or -1
+            where: Condition on news n selecting the articles
+            params: Parameters of the condition
+        """
+        threshold = ROLLUP_THRESHOLD
+        conn.execute(text(f"""
+        INSERT INTO sentiment_daily AS d (symbol, day, source, count, score_sum, score_sumsq,
+                                          pos_count, neu_count, neg_count)
+        SELECT n.symbol, COALESCE(n.published_at, n.created_at)::date, COALESCE(n.source, ''),
+               {sign} * COUNT(*), {sign} * SUM(s.compound), {sign} * SUM(s.compound * s.compound),
+               {sign} * COUNT(*) FILTER (WHERE s.compound >= {threshold}),
+               {sign} * COUNT(*) FILTER (WHERE s.compound > -{threshold} AND s.compound < {threshold}),
+               {sign} * COUNT(*) FILTER (WHERE s.compound <= -{threshold})
+        FROM news n JOIN sentiment s ON s.news_id = n.id
+        WHERE s.compound IS NOT NULL AND {where}
+        GROUP BY 1, 2, 3
+        ON CONFLICT (symbol, day, source) DO UPDATE SET
+            count = d.count + excluded.count,
+            score_sum = d.score_sum + excluded.score_sum,
+            score_sumsq = d.score_sumsq + excluded.score_sumsq,
+            pos_count = d.pos_count + excluded.pos_count,
+            neu_count = d.neu_count + excluded.neu_count,
+            neg_count = d.neg_count + excluded.neg_count
+        """), params or {})
+
+    @staticmethod
+    def _cutoff(days: int) -> datetime:
+        """Start of the day 'days' days ago (UTC), matching SQLite's date('now', '-N days')"""
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return datetime.combine((now - timedelta(days=days)).date(), datetime.min.time())
+
+    def _news_query(self, symbol: str, days: Optional[int],
+                    columns: Optional[Sequence[str]]) -> Tuple[str, Dict, List[str]]:
+        """Build the SQL, parameters and date columns for a news query"""
+        select, needs_sentiment, parse_dates = self._projection(columns)
+        query = f"SELECT {select} FROM news n"
+        if needs_sentiment:
+            query += " LEFT JOIN sentiment s ON n.id = s.news_id"
+        query += " WHERE n.symbol = :symbol"
+        params = {'symbol': symbol}
+
+        if days:
+            query += " AND n.published_at >= :cutoff"
+            params['cutoff'] = self._cutoff(days)
+
+        return query, params, parse_dates
+
+    def query_news(self, symbol: str, days: Optional[int] = None,
+                   columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Query news data joined with sentiment
+
+        Args:
+            symbol: Stock symbol
+            days: Number of days
+            columns: Columns to load (default: all)
+
+        Returns:
+            DataFrame of news articles
+        """
+        query, params, parse_dates = self._news_query(symbol, days, columns)
+        with self.engine.connect() as conn:
+            return pd.read_sql_query(text(query), conn, params=params, parse_dates=parse_dates)
+
+    def iter_news(self, symbol: str, days: Optional[int] = None,
+                  columns: Optional[Sequence[str]] = None,
+                  chunk_size: int = 10000) -> Iterator[pd.DataFrame]:
+        """
+        Query news data in chunks, streamed with a server-side cursor
+
+        Args:
+            symbol: Stock symbol
+            days: Number of days
+            columns: Columns to load (default: all)
+            chunk_size: Rows per DataFrame
+
+        Yields:
+            DataFrames of up to chunk_size articles
+        """
+        query, params, parse_dates = self._news_query(symbol, days, columns)
+        with self.engine.connect() as conn:
+            conn = conn.execution_options(stream_results=True)
+            yield from pd.read_sql_query(text(query), conn, params=params,
+                                         parse_dates=parse_dates, chunksize=chunk_size)
+
+    def query_daily(self, symbol: str, days: Optional[int] = None,
+                    by_source: bool = False) -> pd.DataFrame:
+        """
+        Query the daily sentiment rollup
+
+        Args:
+            symbol: Stock symbol
+            days: Number of days
+            by_source: Keep one row per source instead of per day
+
+        Returns:
+            DataFrame of daily counts, sums and mean/std
+        """
+        keys = 'day, source' if by_source else 'day'
+        query = f"""
+        SELECT {keys}, SUM(count)::bigint AS count, SUM(score_sum) AS score_sum,
+               SUM(score_sumsq) AS score_sumsq, SUM(pos_count)::bigint AS pos_count,
+               SUM(neu_count)::bigint AS neu_count, SUM(neg_count)::bigint AS neg_count
+        FROM sentiment_daily
+        WHERE symbol = :symbol
+        """
+        params = {'symbol': symbol}
+
+        if days:
+            query += " AND day >= :cutoff"
+            params['cutoff'] = self._cutoff(days).date()
+        query += f" GROUP BY {keys} HAVING SUM(count) > 0 ORDER BY {keys}"
+
+        with self.engine.connect() as conn:
+            return self._daily_stats(pd.read_sql_query(text(query), conn, params=params))
+
+    @staticmethod
+    def _websearch(query: str) -> str:
+        """
+        Translate an FTS5 query into websearch_to_tsquery syntax
+
+        Quoted phrases, implicit AND, AND, OR and NOT carry over;
+        parentheses, prefix (*) and NEAR queries are matched as plain words.
+        """
+        terms = []
+        negate = False
+        for token in re.findall(r'"(?:[^"]|"")*"|[^\s"]+', query):
+            if token in ('AND', 'NOT'):
+                negate = token == 'NOT'
+                continue
+            if token == 'OR':
+                terms.append('or')
+            elif token.startswith('"'):
+                terms.append(('-' if negate else '') + '"' + token[1:-1].replace('""', ' ') + '"')
+            else:
+                word = token.strip('()*')
+                if word:
+                    terms.append(('-' if negate else '') + word)
+            negate = False
+        return ' '.join(terms)
+
+    def search_news(self, query: str, symbol: Optional[str] = None, days: Optional[int] = None,
+                    limit: int = 50) -> pd.DataFrame:
+        """
+        Full-text search over news titles and content, best match first
+
+        Uses the idx_news_search GIN index. The FTS5 query is translated
+        with _websearch, ranked with ts_rank_cd (negated, so lower is
+        better as with BM25) and snippets are cut with ts_headline for the
+        returned rows only.
+
+        Args:
+            query: FTS5 query
+            symbol: Only match this stock symbol
+            days: Only match articles from the last days
+            limit: Maximum number of results
+
+        Returns:
+            DataFrame of matching articles with rank and snippet columns
+        """
+        sql = f"""
+        SELECT n.id, n.symbol, n.title, n.source, n.url, n.published_at, n.content,
+               -ts_rank_cd({_SEARCH_WEIGHTS}, {_SEARCH_VECTOR}, q.query) AS rank, q.query
+        FROM news n, websearch_to_tsquery('english', :query) AS q(query)
+        WHERE {_SEARCH_VECTOR} @@ q.query
+        """
+        params = {'query': self._websearch(query)}
+
+        if symbol:
+            sql += " AND n.symbol = :symbol"
+            params['symbol'] = symbol
+        if days:
+            sql += " AND n.published_at >= :cutoff"
+            params['cutoff'] = self._cutoff(days)
+        sql += " ORDER BY rank LIMIT :limit"
+        params['limit'] = limit
+
+        sql = f"""
+        SELECT id, symbol, title, source, url, published_at,
+               ts_headline('english', coalesce(content, ''), query,
+                           'StartSel=[, StopSel=], MaxWords=16, MinWords=8') AS snippet,
+               rank
+        FROM ({sql}) AS matches
+        ORDER BY rank
+        """
+        with self.engine.connect() as conn:
+            return pd.read_sql_query(text(sql), conn, params=params, parse_dates=['published_at'])
+
+    def clean_data(self, days: int, chunk_size: int = 5000, archive=None) -> int:
+        """
+        Delete news and sentiment older than the given number of days
+
+        Each chunk of consecutive expired ids is archived, taken out of
+        the sentiment_daily rollup and deleted by primary-key range in its
+        own transaction, holding the same per-symbol locks as writers.
+        Space is reclaimed by autovacuum, which the short transactions let
+        keep up.
+
+        Args:
+            days: Days to keep
+            chunk_size: Expired articles deleted per transaction
+            archive: Optional ParquetArchive receiving each chunk before
+                it is deleted
+
+        Returns:
+            Number of news rows deleted
+        """
+        cutoff = self._cutoff(days)
+        select, _, _ = self._projection()
+        deleted = 0
+        last_id = 0
+        while True:
+            with self.engine.begin() as conn:
+                ids = conn.execute(text("""
+                SELECT id FROM news
+                WHERE id > :last_id AND published_at < :cutoff
+                ORDER BY id LIMIT :limit
+                """), {'last_id': last_id, 'cutoff': cutoff, 'limit': chunk_size}).scalars().all()
+                if not ids:
+                    break
+
+                bounds = {'first': ids[0], 'last': ids[-1], 'cutoff': cutoff}
+                expired = "n.id BETWEEN :first AND :last AND n.published_at < :cutoff"
+                self._lock_symbols(conn, f"SELECT symbol FROM news n WHERE {expired}", bounds)
+                self._update_rollup(conn, -1, expired, bounds)
+                if archive is not None:
+                    archive.write(pd.read_sql_query(text(f"""
+                    SELECT {select} FROM news n
+                    LEFT JOIN sentiment s ON n.id = s.news_id
+                    WHERE n.id BETWEEN :first AND :last AND n.published_at < :cutoff
+                    """), conn, params=bounds))
+
+                conn.execute(text("""
+                DELETE FROM sentiment s USING news n
+                WHERE s.news_id = n.id
+                  AND n.id BETWEEN :first AND :last AND n.published_at < :cutoff
+                """), bounds)
+                deleted += conn.execute(text("""
+                DELETE FROM news WHERE id BETWEEN :first AND :last AND published_at < :cutoff
+                """), bounds).rowcount
+            last_id = ids[-1]
+
+        self.logger.info(f"Deleted {deleted} news rows published before {cutoff}")
+        return deleted
+
+    def close(self):
+        """Dispose of the connection pool"""
+        self.engine.dispose()
@@ -0,0 +1,415 @@
+"""
+SQLite Storage Backend Module
+Responsible for storing news in a local SQLite file
+"""
+
+from typing import List, Dict, Iterator, Optional, Sequence, Tuple
+import json
+import sqlite3
+import time
+import pandas as pd
+import logging
+
+from .backend import StorageBackend, fts_phrase
+from .connection import ConnectionManager
+from .migrations import (FTS_INDEX_INSERTED, ROLLUP_ADD_ARTICLES, ROLLUP_INSERTED,
+                         ROLLUP_REMOVE_ARTICLES, ROLLUP_REMOVE_EXPIRED, migrate)
+
+# BM25 weights of the news_fts columns (symbol, title, content)
+FTS_WEIGHTS = '0.0, 4.0, 1.0'
+
+class SQLiteBackend(StorageBackend):
+    """SQLite Storage Backend Class"""
+    
+    def __init__(self, config: Dict = None):
+        """
+        Initialize backend
+        
+        Args:
+            config: Configuration dictionary ('db_path' plus the connection
+                tuning keys described in ConnectionManager). Retention keys:
+                retention_pause: Seconds to sleep between deleted chunks
+                    (default 0.01)
+                vacuum_pages: Pages freed per incremental vacuum step
+                    (default 2000)
+        """
+        self.config = config or {}
+        self.db_path = self.config.get('db_path', 'stock_news.db')
+        self.logger = logging.getLogger(__name__)
+        self.connections = ConnectionManager(self.db_path, self.config)
+        
+        with self.connections.writer() as conn:
+            migrate(conn)
+    
+    def save_news(self, news: List[Dict], batch_size: int):
+        """
+        Save news data, one write transaction per batch
+        
+        Args:
+            news: List of news articles
+            batch_size: Articles per transaction
+        """
+        for start in range(0, len(news), batch_size):
+            with self.connections.writer() as conn:
+                self._insert_batch(conn, news[start:start + batch_size])
+    
+    def _insert_batch(self, conn: sqlite3.Connection, batch: List[Dict]):
+        """
+        Upsert one batch of news and sentiment rows
+        
+        Articles with a URL are upserted on (symbol, url), so re-crawling
+        the same story refreshes it instead of adding a row. Articles
+        without a URL are plain inserts.
+        
+        Each group is written by a single executemany inside the open write
+        transaction, so with AUTOINCREMENT fresh rows receive consecutive
+        ids. When every keyed row turned out to be new (the common case)
+        its id follows from its position; otherwise the ids are resolved
+        through the unique index and the known articles are updated.
+        
+        New rows are added to the news_fts full-text index before any
+        update, so the update trigger always finds them there. The
+        sentiment_daily rollup is kept in step: scores of known
+        articles are taken out before they change and added back after,
+        and new scores are added in one grouped statement.
+        
+        Args:
+            conn: Open connection (the caller commits)
+            batch: News articles
+        """
+        cursor = conn.cursor()
+        news_ids = [None] * len(batch)
+        keyed = [i for i, article in enumerate(batch) if article.get('url')]
+        unkeyed = [i for i, article in enumerate(batch) if not article.get('url')]
+        known = []
+        
+        def news_row(article):
+            return (
+                article['symbol'],
+                article['title'],
+                article.get('content'),
+                article.get('source'),
+                article.get('url') or None,
+                article.get('published_at')
+            )
+        
+        if keyed:
+            sequence = cursor.execute(
+                "SELECT seq FROM sqlite_sequence WHERE name = 'news'").fetchone()
+            first_id = (sequence[0] if sequence else 0) + 1
+            
+            changes = conn.total_changes
+            cursor.executemany("""
+            INSERT INTO news (symbol, title, content, source, url, published_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (symbol, url) DO NOTHING
+            """, [news_row(batch[i]) for i in keyed])
+            # Counted before indexing: FTS5 shadow-table writes add to total_changes
+            inserted_count = conn.total_changes - changes
+            cursor.execute(FTS_INDEX_INSERTED, (first_id - 1,))
+            
+            if inserted_count == len(keyed):
+                for offset, i in enumerate(keyed):
+                    news_ids[i] = first_id + offset
+            else:
+                self._resolve_ids(cursor, batch, keyed, news_ids)
+                
+                # Rows not inserted at their own position: articles stored
+                # before this batch, and repeats within it
+                inserted = set()
+                updates = []
+                for i in keyed:
+                    if news_ids[i] < first_id or news_ids[i] in inserted:
+                        updates.append(i)
+                    else:
+                        inserted.add(news_ids[i])
+                known = sorted({news_ids[i] for i in updates if news_ids[i] < first_id})
+                
+                cursor.execute(ROLLUP_REMOVE_ARTICLES, (json.dumps(known),))
+                cursor.executemany("""
+                UPDATE news SET title = ?, content = ?, source = ?, published_at = ?
+                WHERE id = ?
+                """, [(
+                    batch[i]['title'],
+                    batch[i].get('content'),
+                    batch[i].get('source'),
+                    batch[i].get('published_at'),
+                    news_ids[i]
+                ) for i in updates])
+        
+        if unkeyed:
+            cursor.executemany("""
+            INSERT INTO news (symbol, title, content, source, url, published_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """, [news_row(batch[i]) for i in unkeyed])
+            
+            last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+            first_id = last_id - len(unkeyed) + 1
+            for offset, i in enumerate(unkeyed):
+                news_ids[i] = first_id + offset
+            cursor.execute(FTS_INDEX_INSERTED, (first_id - 1,))
+        
+        # Latest score per article
+        scored = {news_ids[i]: article for i, article in enumerate(batch) if 'sentiment' in article}
+        sequence = cursor.execute(
+            "SELECT seq FROM sqlite_sequence WHERE name = 'sentiment'").fetchone()
+        last_sentiment_id = sequence[0] if sequence else 0
+        cursor.executemany("""
+        INSERT INTO sentiment (news_id, compound, positive, neutral, negative)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT (news_id) DO UPDATE SET
+            compound = excluded.compound,
+            positive = excluded.positive,
+            neutral = excluded.neutral,
+            negative = excluded.negative
+        """, [(
+            news_id,
+            article['sentiment'].get('compound'),
+            article['sentiment'].get('pos'),
+            article['sentiment'].get('neu'),
+            article['sentiment'].get('neg')
+        ) for news_id, article in scored.items()])
+        
+        cursor.execute(ROLLUP_INSERTED, (last_sentiment_id,))
+        if known:
+            cursor.execute(ROLLUP_ADD_ARTICLES, (last_sentiment_id, json.dumps(known)))
+    
+    def _resolve_ids(self, cursor: sqlite3.Cursor, batch: List[Dict],
+                     positions: List[int], news_ids: List[Optional[int]]):
+        """
+        Look up news ids of upserted articles by (symbol, url)
+        
+        Args:
+            cursor: Cursor inside the write transaction
+            batch: News articles
+            positions: Positions in batch to resolve
+            news_ids: Id list filled in place
+        """
+        cursor.execute("""
+        CREATE TEMP TABLE IF NOT EXISTS batch_keys (
+            pos INTEGER PRIMARY KEY,
+            symbol TEXT,
+            url TEXT
+        )
+        """)
+        cursor.execute("DELETE FROM batch_keys")
+        cursor.executemany("INSERT INTO batch_keys (pos, symbol, url) VALUES (?, ?, ?)",
+                           [(i, batch[i]['symbol'], batch[i]['url']) for i in positions])
+        for pos, news_id in cursor.execute("""
+        SELECT k.pos, n.id FROM batch_keys k
+        JOIN news n ON n.symbol = k.symbol AND n.url = k.url
+        """).fetchall():
+            news_ids[pos] = news_id
+    
+    def _news_query(self, symbol: str, days: Optional[int],
+                    columns: Optional[Sequence[str]]) -> Tuple[str, list, List[str]]:
+        """Build the SQL, parameters and date columns for a news query"""
+        select, needs_sentiment, parse_dates = self._projection(columns)
+        query = f"SELECT {select} FROM news n"
+        if needs_sentiment:
+            query += " LEFT JOIN sentiment s ON n.id = s.news_id"
+        query += " WHERE n.symbol = ?"
+        
+        params = [symbol]
+        
+        if days:
+            query += " AND n.published_at >= date('now', ?)"
+            params.append(f'-{days} days')
+        
+        return query, params, parse_dates
+    
+    def query_news(self, symbol: str, days: Optional[int] = None,
+                   columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Query news data joined with sentiment
+        
+        Args:
+            symbol: Stock symbol
+            days: Number of days
+            columns: Columns to load (default: all)
+            
+        Returns:
+            DataFrame of news articles
+        """
+        query, params, parse_dates = self._news_query(symbol, days, columns)
+        with self.connections.reader() as conn:
+            return pd.read_sql_query(query, conn, params=params, parse_dates=parse_dates)
+    
+    def iter_news(self, symbol: str, days: Optional[int] = None,
+                  columns: Optional[Sequence[str]] = None,
+                  chunk_size: int = 10000) -> Iterator[pd.DataFrame]:
+        """
+        Query news data in chunks
+        
+        Args:
+            symbol: Stock symbol
+            days: Number of days
+            columns: Columns to load (default: all)
+            chunk_size: Rows per DataFrame
+            
+        Yields:
+            DataFrames of up to chunk_size articles
+        """
+        query, params, parse_dates = self._news_query(symbol, days, columns)
+        with self.connections.reader() as conn:
+            yield from pd.read_sql_query(query, conn, params=params,
+                                         parse_dates=parse_dates, chunksize=chunk_size)
+    
+    def query_daily(self, symbol: str, days: Optional[int] = None,
+                    by_source: bool = False) -> pd.DataFrame:
+        """
+        Query the daily sentiment rollup
+        
+        Args:
+            symbol: Stock symbol
+            days: Number of days
+            by_source: Keep one row per source instead of per day
+            
+        Returns:
+            DataFrame of daily counts, sums and mean/std
+        """
+        keys = 'day, source' if by_source else 'day'
+        query = f"""
+        SELECT {keys}, SUM(count) AS count, SUM(score_sum) AS score_sum,
+               SUM(score_sumsq) AS score_sumsq, SUM(pos_count) AS pos_count,
+               SUM(neu_count) AS neu_count, SUM(neg_count) AS neg_count
+        FROM sentiment_daily
+        WHERE symbol = ?
+        """
+        params = [symbol]
+        
+        if days:
+            query += " AND day >= date('now', ?)"
+            params.append(f'-{days} days')
+        query += f" GROUP BY {keys} HAVING SUM(count) > 0 ORDER BY {keys}"
+        
+        with self.connections.reader() as conn:
+            return self._daily_stats(pd.read_sql_query(query, conn, params=params))
+    
+    def search_news(self, query: str, symbol: Optional[str] = None, days: Optional[int] = None,
+                    limit: int = 50) -> pd.DataFrame:
+        """
+        Full-text search over news titles and content, best match first
+        
+        Ranked by BM25 with title matches weighted above content matches.
+        The symbol filter is part of the FTS5 match, so only articles of
+        that symbol are ever ranked.
+        
+        Args:
+            query: FTS5 query
+            symbol: Only match this stock symbol
+            days: Only match articles from the last days
+            limit: Maximum number of results
+            
+        Returns:
+            DataFrame of matching articles with rank and snippet columns
+        """
+        match = f"{{title content}} : ({query})"
+        if symbol:
+            match += f" AND symbol : {fts_phrase(symbol)}"
+        
+        sql = f"""
+        SELECT n.id, n.symbol, n.title, n.source, n.url, n.published_at,
+               snippet(news_fts, 2, '[', ']', '...', 16) AS snippet,
+               bm25(news_fts, {FTS_WEIGHTS}) AS rank
+        FROM news_fts
+        JOIN news n ON n.id = news_fts.rowid
+        WHERE news_fts MATCH ?
+        """
+        params = [match]
+        
+        if symbol:
+            sql += " AND n.symbol = ?"
+            params.append(symbol)
+        if days:
+            sql += " AND n.published_at >= date('now', ?)"
+            params.append(f'-{days} days')
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+        
+        with self.connections.reader() as conn:
+            return pd.read_sql_query(sql, conn, params=params, parse_dates=['published_at'])
+    
+    def clean_data(self, days: int, chunk_size: int = 5000, archive=None) -> int:
+        """
+        Delete news and sentiment older than the given number of days
+        
+        Expired ids are found on a read connection, so the scan never holds
+        the write lock. Each chunk of consecutive expired ids is then
+        archived, taken out of the sentiment_daily rollup and deleted by
+        primary-key range in its own short write transaction. Finally freed
+        pages are returned to the filesystem with an incremental vacuum.
+        
+        Args:
+            days: Days to keep
+            chunk_size: Expired articles deleted per transaction
+            archive: Optional ParquetArchive receiving each chunk before
+                it is deleted
+            
+        Returns:
+            Number of news rows deleted
+        """
+        pause = self.config.get('retention_pause', 0.01)
+        with self.connections.reader() as conn:
+            cutoff = conn.execute("SELECT date('now', ?)", (f'-{days} days',)).fetchone()[0]
+        
+        deleted = 0
+        last_id = 0
+        while True:
+            with self.connections.reader() as conn:
+                ids = [row[0] for row in conn.execute("""
+                SELECT id FROM news NOT INDEXED
+                WHERE id > ? AND published_at < ?
+                ORDER BY id LIMIT ?
+                """, (last_id, cutoff, chunk_size))]
+            if not ids:
+                break
+            
+            bounds = (ids[0], ids[-1], cutoff)
+            with self.connections.writer() as conn:
+                if archive is not None:
+                    select, _, _ = self._projection()
+                    archive.write(pd.read_sql_query(f"""
+                    SELECT {select} FROM news n
+                    LEFT JOIN sentiment s ON n.id = s.news_id
+                    WHERE n.id BETWEEN ? AND ? AND n.published_at < ?
+                    """, conn, params=bounds))
+                
+                conn.execute(ROLLUP_REMOVE_EXPIRED, bounds)
+                conn.execute("""
+                DELETE FROM sentiment WHERE news_id IN (
+                    SELECT id FROM news WHERE id BETWEEN ? AND ? AND published_at < ?
+                )
+                """, bounds)
+                deleted += conn.execute("""
+                DELETE FROM news WHERE id BETWEEN ? AND ? AND published_at < ?
+                """, bounds).rowcount
+            
+            last_id = ids[-1]
+            # Let waiting writers in between chunks
+            time.sleep(pause)
+        
+        self._incremental_vacuum()
+        self.logger.info(f"Deleted {deleted} news rows published before {cutoff}")
+        return deleted
+    
+    def _incremental_vacuum(self):
+        """Return free pages to the filesystem, a bounded number per transaction"""
+        pages = self.config.get('vacuum_pages', 2000)
+        with self.connections.reader() as conn:
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                self.logger.info("auto_vacuum is not INCREMENTAL; run VACUUM once to enable "
+                                 "incremental space reclamation")
+                return
+        
+        while True:
+            with self.connections.writer() as conn:
+                if conn.execute("PRAGMA freelist_count").fetchone()[0] == 0:
+                    return
+                # Each result row is one freed page; step through them all
+                conn.execute(f"PRAGMA incremental_vacuum({int(pages)})").fetchall()
+            time.sleep(0)
+    
+    def close(self):
+        """Close database connections"""
+        self.connections.close()
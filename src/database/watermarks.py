@@ -0,0 +1,251 @@
+"""
+Watermark Module
+Responsible for tracking the newest article fetched per symbol and source
+"""
+
+from typing import List, Dict, Optional
+from datetime import datetime, timezone
+import sqlite3
+import logging
+import threading
+
+
+def parse_timestamp(value) -> Optional[datetime]:
+    """
+    Parse an article timestamp into a naive UTC datetime
+
+    Args:
+        value: ISO 8601 string (e.g. '2024-01-31T14:05:00Z') or datetime
+
+    Returns:
+        Naive UTC datetime, or None if the value cannot be parsed
+    """
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value).strip().replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+class WatermarkStore:
+    """Watermark Store Class
+
+    Keeps a high-water mark (latest published_at and its URL) for every
+    (symbol, source) pair in the same SQLite file as Database, so crawlers
+    only need to request articles newer than the last run.
+    """
+
+    def __init__(self, config: Dict = None):
+        """
+        Initialize watermark store
+
+        Args:
+            config: Configuration dictionary (shares 'db_path' with Database)
+        """
+        self.config = config or {}
+        self.db_path = self.config.get('db_path', 'stock_news.db')
+        self.logger = logging.getLogger(__name__)
+        self._init_db()
+
+    def _init_db(self):
+        """Initialize watermark table"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+            CREATE TABLE IF NOT EXISTS fetch_watermarks (
+                symbol TEXT NOT NULL,
+                source TEXT NOT NULL,
+                published_at TEXT NOT NULL,
+                url TEXT,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (symbol, source)
+            )
+            """)
+
+    def get(self, symbol: str, source: str) -> Optional[Dict]:
+        """
+        Get the watermark for a symbol and source
+
+        Args:
+            symbol: Stock symbol
+            source: Source name
+
+        Returns:
+            Dict with 'published_at' (naive UTC datetime) and 'url', or None
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT published_at, url FROM fetch_watermarks WHERE symbol = ? AND source = ?",
+                (symbol, source)
+            ).fetchone()
+        if row is None:
+            return None
+        return {'published_at': parse_timestamp(row[0]), 'url': row[1]}
+
+    def since(self, symbol: str, source: str, earliest: datetime) -> datetime:
+        """
+        Get the start of the window still to be fetched
+
+        Args:
+            symbol: Stock symbol
+            source: Source name
+            earliest: Start of the full look-back window (naive UTC)
+
+        Returns:
+            The later of the watermark and earliest
+        """
+        mark = self.get(symbol, source)
+        if mark is None or mark['published_at'] is None:
+            return earliest
+        return max(earliest, mark['published_at'])
+
+    def filter_new(self, symbol: str, source: str, articles: List[Dict]) -> List[Dict]:
+        """
+        Drop articles at or before the watermark
+
+        Articles published at exactly the watermark time are kept unless
+        they are the watermark article itself. Articles without a parseable
+        timestamp are always kept.
+
+        Args:
+            symbol: Stock symbol
+            source: Source name
+            articles: Fetched articles
+
+        Returns:
+            Articles newer than the watermark
+        """
+        mark = self.get(symbol, source)
+        if mark is None or mark['published_at'] is None:
+            return articles
+
+        fresh = []
+        for article in articles:
+            published = parse_timestamp(article.get('published_at'))
+            if published is None or published > mark['published_at']:
+                fresh.append(article)
+            elif published == mark['published_at'] and article.get('url') != mark['url']:
+                fresh.append(article)
+        return fresh
+
+    def advance(self, symbol: str, source: str, articles: List[Dict]) -> bool:
+        """
+        Move the watermark forward to the newest of the given articles
+
+        The watermark never moves backwards, so concurrent or out-of-order
+        updates are safe.
+
+        Args:
+            symbol: Stock symbol
+            source: Source name
+            articles: Articles that were fetched
+
+        Returns:
+            Success status
+        """
+        newest = None
+        for article in articles:
+            published = parse_timestamp(article.get('published_at'))
+            if published is not None and (newest is None or published > newest[0]):
+                newest = (published, article.get('url'))
+        if newest is None:
+            return True
+
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("""
+                INSERT INTO fetch_watermarks (symbol, source, published_at, url)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (symbol, source) DO UPDATE SET
+                    published_at = excluded.published_at,
+                    url = excluded.url,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE excluded.published_at > fetch_watermarks.published_at
+                """, (symbol, source, newest[0].isoformat(), newest[1]))
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Error updating watermark for {symbol}/{source}: {e}")
+            return False
+
+
+class PendingWatermarks:
+    """Pending Watermarks Class
+
+    Holds watermark advances back until the fetched articles are stored.
+    Each fetch of a (symbol, source) pair is tracked with the articles it
+    returned, which are tagged with its 'fetch_id'. The watermark moves to
+    the newest of them once all have been committed. If any is released
+    instead (its save failed), the fetch is dropped and the watermark
+    stays, so the next crawl requests those articles again.
+    """
+
+    def __init__(self, store: WatermarkStore):
+        """
+        Initialize pending watermarks
+
+        Args:
+            store: Watermark store advanced on commit
+        """
+        self.store = store
+        self._fetches: Dict[int, Dict] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def track(self, symbol: str, source: str, articles: List[Dict],
+              skipped: Optional[List[Dict]] = None):
+        """
+        Register the articles returned by one fetch
+
+        Args:
+            symbol: Stock symbol
+            source: Source name
+            articles: Articles to be stored; tagged with 'fetch_id'
+            skipped: Fetched articles that will not be stored (e.g.
+                duplicates); the watermark moves past them too
+        """
+        fetched = list(articles) + list(skipped or [])
+        if not articles:
+            self.store.advance(symbol, source, fetched)
+            return
+        with self._lock:
+            self._next_id += 1
+            fetch_id = self._next_id
+            self._fetches[fetch_id] = {'symbol': symbol, 'source': source,
+                                       'articles': fetched, 'remaining': len(articles)}
+        for article in articles:
+            article['fetch_id'] = fetch_id
+
+    def commit(self, articles: List[Dict]):
+        """
+        Mark articles as stored, advancing watermarks of completed fetches
+
+        Args:
+            articles: Stored articles
+        """
+        completed = []
+        with self._lock:
+            for article in articles:
+                fetch = self._fetches.get(article.get('fetch_id'))
+                if fetch is None:
+                    continue
+                fetch['remaining'] -= 1
+                if fetch['remaining'] == 0:
+                    completed.append(self._fetches.pop(article['fetch_id']))
+        for fetch in completed:
+            self.store.advance(fetch['symbol'], fetch['source'], fetch['articles'])
+
+    def release(self, articles: List[Dict]):
+        """
+        Mark articles as not stored, keeping their fetches' watermarks where they are
+
+        Args:
+            articles: Articles whose save failed
+        """
+        with self._lock:
+            for article in articles:
+                self._fetches.pop(article.get('fetch_id'), None)
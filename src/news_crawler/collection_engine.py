@@ -0,0 +1,149 @@
+"""
+Collection Engine Module
+Responsible for fanning out news collection across sources and symbols
+"""
+
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+import logging
+import time
+
+# A source is any callable taking (symbol, days) and returning a list of articles
+Source = Callable[[str, int], Optional[List[Dict]]]
+
+
+class CollectionEngine:
+    """Collection Engine Class
+
+    Every source gets its own bounded thread pool, so a slow source can only
+    ever tie up its own workers. Each source also has a wall-clock budget per
+    batch; when it runs out, the source's outstanding requests are abandoned
+    and whatever has already arrived is returned (partial results).
+    """
+
+    def __init__(self, sources: Dict[str, Source], config: Dict = None):
+        """
+        Initialize engine
+
+        Args:
+            sources: Mapping of source name to collector callable
+            config: Configuration dictionary. Recognised keys:
+                source_concurrency: Dict of source name to max in-flight requests
+                source_timeouts: Dict of source name to time budget in seconds
+                default_concurrency: Concurrency for sources not listed (default 4)
+                default_timeout: Time budget for sources not listed (default 30)
+        """
+        self.sources = dict(sources)
+        self.config = config or {}
+        self.logger = logging.getLogger(__name__)
+        self.last_stats: Dict = {}
+
+    def _concurrency(self, name: str) -> int:
+        limits = self.config.get('source_concurrency', {})
+        return max(1, int(limits.get(name, self.config.get('default_concurrency', 4))))
+
+    def _timeout(self, name: str) -> float:
+        timeouts = self.config.get('source_timeouts', {})
+        return float(timeouts.get(name, self.config.get('default_timeout', 30.0)))
+
+    def iter_collect(self, symbols: List[str], days: int = 7) -> Iterator[Tuple[str, str, List[Dict]]]:
+        """
+        Collect news for every (source, symbol) pair, yielding as each completes
+
+        Args:
+            symbols: Stock symbols
+            days: Number of days
+
+        Yields:
+            Tuples of (symbol, source name, articles) in completion order
+        """
+        start = time.monotonic()
+        stats = {
+            'completed': 0,
+            'failed': 0,
+            'timed_out': 0,
+            'articles': 0,
+            'per_source': {name: {'completed': 0, 'failed': 0, 'timed_out': 0}
+                           for name in self.sources},
+        }
+        self.last_stats = stats
+
+        executors = {
+            name: ThreadPoolExecutor(max_workers=self._concurrency(name),
+                                     thread_name_prefix=f"collect-{name}")
+            for name in self.sources
+        }
+        deadlines = {name: start + self._timeout(name) for name in self.sources}
+        pending = {}
+
+        try:
+            for name, source in self.sources.items():
+                for symbol in symbols:
+                    future = executors[name].submit(source, symbol, days)
+                    pending[future] = (symbol, name)
+
+            while pending:
+                now = time.monotonic()
+
+                # Abandon work for sources whose budget has run out
+                for future, (symbol, name) in list(pending.items()):
+                    if now >= deadlines[name]:
+                        future.cancel()
+                        del pending[future]
+                        stats['timed_out'] += 1
+                        stats['per_source'][name]['timed_out'] += 1
+                        self.logger.warning(f"Timed out collecting {symbol} from {name}")
+
+                if not pending:
+                    break
+
+                next_deadline = min(deadlines[name] for _, name in pending.values())
+                done, _ = wait(list(pending), timeout=max(0.0, next_deadline - now),
+                               return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    symbol, name = pending.pop(future)
+                    try:
+                        articles = future.result() or []
+                    except Exception as e:
+                        stats['failed'] += 1
+                        stats['per_source'][name]['failed'] += 1
+                        self.logger.error(f"Error collecting {symbol} from {name}: {e}")
+                        continue
+
+                    for article in articles:
+                        article.setdefault('symbol', symbol)
+                    stats['completed'] += 1
+                    stats['articles'] += len(articles)
+                    stats['per_source'][name]['completed'] += 1
+                    yield symbol, name, articles
+
+        finally:
+            # Queued calls are cancelled; running ones finish in the background
+            for future in pending:
+                future.cancel()
+            for executor in executors.values():
+                executor.shutdown(wait=False)
+            stats['elapsed'] = time.monotonic() - start
+
+    def collect(self, symbols: List[str], days: int = 7) -> Dict[str, List[Dict]]:
+        """
+        Collect news for every (source, symbol) pair concurrently
+
+        Args:
+            symbols: Stock symbols
+            days: Number of days
+
+        Returns:
+            Mapping of symbol to collected articles (possibly partial)
+        """
+        results = {symbol: [] for symbol in symbols}
+        for symbol, _, articles in self.iter_collect(symbols, days):
+            results[symbol].extend(articles)
+
+        self.logger.info(
+            f"Collected {self.last_stats['articles']} articles for {len(symbols)} symbols "
+            f"in {self.last_stats['elapsed']:.2f}s "
+            f"({self.last_stats['failed']} failed, {self.last_stats['timed_out']} timed out)"
+        )
+        return results
@@ -0,0 +1,261 @@
+"""
+Near-Duplicate Detection Module
+Responsible for recognising syndicated copies of the same story
+"""
+
+from typing import Dict, List, Optional, Set, Tuple
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import zlib
+
+import numpy as np
+
+# Largest Mersenne prime below 2**64, used by the MinHash permutations
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+class NearDuplicateIndex:
+    """Near-Duplicate Index Class
+
+    MinHash signatures over word shingles of the normalized title and
+    content, indexed with LSH banding in SQLite. A lookup only touches the
+    documents that share at least one band bucket, so it stays sub-linear
+    in the size of the index, and with a dedup_path the index persists
+    across runs.
+
+    Documents are scoped by symbol: the same story filed under two tickers
+    is a duplicate for neither.
+
+    New articles are held in memory as pending until commit() writes them
+    to the index, which callers do once the articles are stored. Pending
+    articles already count as seen, so copies arriving from other sources
+    in the meantime are still caught; release() forgets articles whose
+    save failed, so they are not duplicates when crawled again.
+    """
+
+    def __init__(self, config: Dict = None):
+        """
+        Initialize index
+
+        Args:
+            config: Configuration dictionary. Recognised keys:
+                dedup_path: SQLite file for the index, kept across runs
+                    (default ':memory:', a per-process index)
+                dedup_num_perm: Number of MinHash permutations (default 64)
+                dedup_bands: Number of LSH bands (default 16)
+                dedup_shingle_size: Words per shingle (default 3)
+                dedup_threshold: Estimated Jaccard similarity at or above
+                    which two articles are duplicates (default 0.8)
+        """
+        self.config = config or {}
+        self.logger = logging.getLogger(__name__)
+        self.path = self.config.get('dedup_path') or ':memory:'
+        self.num_perm = self.config.get('dedup_num_perm', 64)
+        self.bands = self.config.get('dedup_bands', 16)
+        self.shingle_size = self.config.get('dedup_shingle_size', 3)
+        self.threshold = self.config.get('dedup_threshold', 0.8)
+
+        if self.num_perm % self.bands:
+            raise ValueError("dedup_num_perm must be a multiple of dedup_bands")
+
+        # Fixed seed: persisted signatures are only comparable under the same permutations
+        rng = np.random.RandomState(1)
+        self._a = rng.randint(1, int(_MERSENNE_PRIME), size=self.num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, int(_MERSENNE_PRIME), size=self.num_perm, dtype=np.uint64)
+
+        self._lock = threading.Lock()
+        # Articles seen but not yet committed: key -> (symbol, url, signature, buckets)
+        self._pending: Dict[Tuple[str, str], Tuple] = {}
+        self._pending_buckets: Dict[int, Set[Tuple[str, str]]] = {}
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._init_db()
+
+    def _init_db(self):
+        """Initialize index tables"""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS dedup_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )
+        """)
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS dedup_docs (
+            id INTEGER PRIMARY KEY,
+            symbol TEXT,
+            url TEXT,
+            signature BLOB
+        )
+        """)
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS dedup_buckets (
+            bucket INTEGER NOT NULL,
+            doc_id INTEGER NOT NULL
+        )
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_dedup_buckets ON dedup_buckets (bucket)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_dedup_docs_url ON dedup_docs (symbol, url)")
+
+        params = f"{self.num_perm}/{self.bands}/{self.shingle_size}"
+        cursor.execute("INSERT OR IGNORE INTO dedup_meta (key, value) VALUES ('params', ?)", (params,))
+        stored = cursor.execute("SELECT value FROM dedup_meta WHERE key = 'params'").fetchone()[0]
+        if stored != params:
+            raise ValueError(f"Dedup index {self.path} was built with {stored}, not {params}")
+        self.conn.commit()
+
+    def _shingles(self, text: str) -> List[str]:
+        """Normalize text and split it into overlapping word shingles"""
+        words = re.sub(r'[^a-z0-9\s]', ' ', text.lower()).split()
+        if len(words) <= self.shingle_size:
+            return [' '.join(words)] if words else []
+        return [' '.join(words[i:i + self.shingle_size])
+                for i in range(len(words) - self.shingle_size + 1)]
+
+    def signature(self, article: Dict) -> Optional[np.ndarray]:
+        """
+        Compute the MinHash signature of an article
+
+        Args:
+            article: News article
+
+        Returns:
+            uint32 signature of length num_perm, or None if there is no text
+        """
+        text = f"{article.get('title') or ''} {article.get('content') or ''}"
+        shingles = self._shingles(text)
+        if not shingles:
+            return None
+
+        hashes = np.fromiter((zlib.crc32(s.encode('utf-8')) for s in set(shingles)),
+                             dtype=np.uint64)
+        permuted = (np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME & _MAX_HASH
+        return permuted.min(axis=0).astype(np.uint32)
+
+    def _buckets(self, symbol: str, signature: np.ndarray) -> List[int]:
+        """Hash each band of a signature into a signed 64-bit bucket id"""
+        buckets = []
+        for band, rows in enumerate(np.split(signature, self.bands)):
+            digest = hashlib.blake2b(f"{symbol}:{band}:".encode('utf-8') + rows.tobytes(),
+                                     digest_size=8).digest()
+            buckets.append(int.from_bytes(digest, 'little', signed=True))
+        return buckets
+
+    def _key(self, article: Dict, signature: Optional[np.ndarray]) -> Optional[Tuple[str, str]]:
+        """Identify an article among the pending ones, by URL or else by text"""
+        symbol = article.get('symbol', '')
+        if article.get('url'):
+            return symbol, article['url']
+        if signature is not None:
+            return symbol, signature.tobytes().hex()
+        return None
+
+    def is_duplicate(self, article: Dict) -> bool:
+        """
+        Check an article against the index, holding it as pending if it is new
+
+        Args:
+            article: News article
+
+        Returns:
+            True if the same URL or a near-duplicate text was seen for this symbol
+        """
+        symbol = article.get('symbol', '')
+        url = article.get('url')
+        signature = self.signature(article)
+        key = self._key(article, signature)
+
+        with self._lock:
+            if url and key in self._pending:
+                return True
+            cursor = self.conn.cursor()
+            if url and cursor.execute("SELECT 1 FROM dedup_docs WHERE symbol = ? AND url = ?",
+                                      (symbol, url)).fetchone():
+                return True
+
+            buckets = self._buckets(symbol, signature) if signature is not None else []
+            if buckets and (self._find_pending(buckets, signature)
+                            or self._find(cursor, buckets, signature)):
+                return True
+
+            if key is not None:
+                self._pending[key] = (symbol, url, signature, buckets)
+                for bucket in buckets:
+                    self._pending_buckets.setdefault(bucket, set()).add(key)
+            return False
+
+    def _find_pending(self, buckets: List[int], signature: np.ndarray) -> bool:
+        """Look for a pending document sharing a bucket and similar enough"""
+        candidates = set()
+        for bucket in buckets:
+            candidates.update(self._pending_buckets.get(bucket, ()))
+        return any(np.mean(self._pending[key][2] == signature) >= self.threshold
+                   for key in candidates)
+
+    def _pop_pending(self, article: Dict) -> Optional[Tuple]:
+        """Remove an article from the pending documents"""
+        signature = None if article.get('url') else self.signature(article)
+        key = self._key(article, signature)
+        entry = self._pending.pop(key, None)
+        if entry is not None:
+            for bucket in entry[3]:
+                keys = self._pending_buckets[bucket]
+                keys.discard(key)
+                if not keys:
+                    del self._pending_buckets[bucket]
+        return entry
+
+    def _find(self, cursor: sqlite3.Cursor, buckets: List[int], signature: np.ndarray) -> bool:
+        """Look for an indexed document sharing a bucket and similar enough"""
+        placeholders = ','.join('?' * len(buckets))
+        rows = cursor.execute(f"""
+        SELECT d.signature FROM dedup_docs d
+        WHERE d.id IN (SELECT doc_id FROM dedup_buckets WHERE bucket IN ({placeholders}))
+        """, buckets).fetchall()
+
+        for (blob,) in rows:
+            candidate = np.frombuffer(blob, dtype=np.uint32)
+            if np.mean(candidate == signature) >= self.threshold:
+                return True
+        return False
+
+    def commit(self, articles: List[Dict]):
+        """
+        Add stored articles to the index
+
+        Args:
+            articles: Articles that passed is_duplicate and were stored
+        """
+        with self._lock:
+            cursor = self.conn.cursor()
+            for article in articles:
+                entry = self._pop_pending(article)
+                if entry is None:
+                    continue
+                symbol, url, signature, buckets = entry
+                cursor.execute("INSERT INTO dedup_docs (symbol, url, signature) VALUES (?, ?, ?)",
+                               (symbol, url, signature.tobytes() if signature is not None else None))
+                doc_id = cursor.lastrowid
+                cursor.executemany("INSERT INTO dedup_buckets (bucket, doc_id) VALUES (?, ?)",
+                                   [(bucket, doc_id) for bucket in buckets])
+            self.conn.commit()
+
+    def release(self, articles: List[Dict]):
+        """
+        Forget pending articles that were not stored
+
+        Args:
+            articles: Articles whose save failed
+        """
+        with self._lock:
+            for article in articles:
+                self._pop_pending(article)
+
+    def close(self):
+        """Close the index"""
+        with self._lock:
+            self.conn.commit()
+            self.conn.close()
@@ -5,10 +5,15 @@ Responsible for collecting news from major financial websites
 
 import requests
 from bs4 import BeautifulSoup
-from typing import List, Dict
-from datetime import datetime
+from typing import List, Dict, Callable, Iterator, Tuple
+from datetime import datetime, timedelta, timezone
 import logging
 
+from .collection_engine import CollectionEngine
+from .dedup import NearDuplicateIndex
+from ..database.watermarks import PendingWatermarks
+from ..utils.http import get_http_client
+
 class NewsCrawler:
     """News Crawler Class"""
     
@@ -21,6 +26,50 @@ class NewsCrawler:
         """
         self.config = config or {}
         self.logger = logging.getLogger(__name__)
+        self.http = self.config.get('http_client') or get_http_client()
+        # Optional WatermarkStore for incremental collection; advanced by commit()
+        self.watermarks = self.config.get('watermarks')
+        self.pending = PendingWatermarks(self.watermarks) if self.watermarks else None
+        self.dedup = NearDuplicateIndex(self.config)
+        
+    def _sources(self) -> Dict:
+        """Get collector callables keyed by source name"""
+        sources = {
+            'yahoo_finance': self._yahoo_finance,
+            'reuters': self._reuters,
+            'bloomberg': self._bloomberg
+        }
+        if self.watermarks:
+            sources = {name: self._incremental(name, source) for name, source in sources.items()}
+        return sources
+        
+    def _incremental(self, name: str, source: Callable) -> Callable:
+        """
+        Wrap a source so it only fetches and returns articles newer than its watermark
+        
+        Sources take a whole number of days, so the look-back is shortened to
+        the days since the watermark and older articles are filtered out.
+        The watermark itself only moves once the articles are committed.
+        
+        Args:
+            name: Source name
+            source: Collector callable
+            
+        Returns:
+            Incremental collector callable
+        """
+        def collect(symbol: str, days: int) -> List[Dict]:
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            since = self.watermarks.since(symbol, name, now - timedelta(days=days))
+            delta_days = max(1, min(days, (now - since).days + 1))
+            
+            return self.watermarks.filter_new(symbol, name, source(symbol, delta_days) or [])
+            
+        return collect
+        
+    def _engine(self) -> CollectionEngine:
+        """Build a collection engine over all sources"""
+        return CollectionEngine(self._sources(), self.config)
         
     def collect_news(self, symbol: str, days: int = 7) -> List[Dict]:
         """
@@ -33,20 +82,76 @@ class NewsCrawler:
         Returns:
             List of news articles
         """
-        news = []
-        sources = [
-            self._yahoo_finance,
-            self._reuters,
-            self._bloomberg
-        ]
-        
-        for source in sources:
-            try:
-                news.extend(source(symbol, days))
-            except Exception as e:
-                self.logger.error(f"Error collecting from {source.__name__}: {e}")
-                
-        return self._remove_duplicates(news)
+        return self.collect_news_batch([symbol], days)[symbol]
+    
+    def collect_news_batch(self, symbols: List[str], days: int = 7) -> Dict[str, List[Dict]]:
+        """
+        Collect news for many stocks, querying all sources concurrently
+        
+        Sources that fail or exceed their time budget are skipped, so the
+        result may be partial. Pass the articles to commit() once stored.
+        
+        Args:
+            symbols: Stock symbols
+            days: Number of days
+            
+        Returns:
+            Mapping of symbol to list of news articles
+        """
+        results = {symbol: [] for symbol in symbols}
+        for symbol, news in self._iter_unique(symbols, days):
+            results[symbol].extend(news)
+        return results
+    
+    def iter_news(self, symbols: List[str], days: int = 7) -> Iterator[Dict]:
+        """
+        Collect news for many stocks, yielding articles as each source returns
+        
+        Args:
+            symbols: Stock symbols
+            days: Number of days
+            
+        Yields:
+            Unique news articles, each tagged with 'symbol'
+        """
+        for _, news in self._iter_unique(symbols, days):
+            yield from news
+    
+    def commit(self, articles: List[Dict]):
+        """
+        Record articles as stored
+        
+        Watermarks and the duplicate index only take articles in once they
+        are committed, so articles that are never stored are returned again
+        by the next crawl.
+        
+        Args:
+            articles: Articles saved by the sink
+        """
+        self.dedup.commit(articles)
+        if self.pending:
+            self.pending.commit(articles)
+    
+    def release(self, articles: List[Dict]):
+        """
+        Record articles as not stored, so later crawls return them again
+        
+        Args:
+            articles: Articles whose save failed
+        """
+        self.dedup.release(articles)
+        if self.pending:
+            self.pending.release(articles)
+    
+    def _iter_unique(self, symbols: List[str], days: int) -> Iterator[Tuple[str, List[Dict]]]:
+        """Collect from all sources, yielding each fetch without duplicates"""
+        for symbol, name, news in self._engine().iter_collect(symbols, days):
+            unique = self._remove_duplicates(news)
+            if self.pending:
+                kept = {id(article) for article in unique}
+                self.pending.track(symbol, name, unique,
+                                   [article for article in news if id(article) not in kept])
+            yield symbol, unique
     
     def _yahoo_finance(self, symbol: str, days: int) -> List[Dict]:
         """Collect from Yahoo Finance"""
@@ -64,6 +169,21 @@ class NewsCrawler:
         pass
     
     def _remove_duplicates(self, news: List[Dict]) -> List[Dict]:
-        """Remove duplicate news"""
-        # Implementation details
-        pass
+        """
+        Remove duplicate news
+        
+        Drops repeated URLs and near-duplicate texts (e.g. the same wire story
+        syndicated across sources), including ones committed in earlier runs
+        and ones collected but not yet committed or released.
+        
+        Args:
+            news: List of news articles
+            
+        Returns:
+            List of unique news articles
+        """
+        unique = [article for article in news if not self.dedup.is_duplicate(article)]
+        
+        if len(unique) < len(news):
+            self.logger.info(f"Removed {len(news) - len(unique)} duplicate articles")
+        return unique
@@ -0,0 +1,232 @@
+"""
+Pipeline Module
+Responsible for streaming articles from crawl through scoring to storage
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+import logging
+import queue
+import threading
+import time
+
+# Marks the end of a stage's output
+_DONE = object()
+
+
+class PipelineError(RuntimeError):
+    """Raised when a pipeline stage fails"""
+
+
+def save_with_retry(database, articles: List[Dict], retries: int = 3, backoff: float = 1.0,
+                    stop: Optional[threading.Event] = None) -> bool:
+    """
+    Save articles, retrying failed attempts with exponential backoff
+
+    Args:
+        database: database.Database (anything with save_news returning success)
+        articles: News articles
+        retries: Attempts after the first
+        backoff: Seconds before the first retry, doubled after each
+        stop: Event that cancels the remaining retries when set
+
+    Returns:
+        Success status
+    """
+    for attempt in range(retries + 1):
+        if database.save_news(articles):
+            return True
+        if attempt == retries:
+            break
+        delay = backoff * 2 ** attempt
+        logging.getLogger(__name__).warning(
+            f"Saving {len(articles)} articles failed, retrying in {delay:.1f}s "
+            f"({attempt + 1}/{retries})")
+        if stop is not None:
+            if stop.wait(delay):
+                break
+        else:
+            time.sleep(delay)
+    return False
+
+
+class StreamingPipeline:
+    """Streaming Pipeline Class
+
+    Runs crawl, score and store as concurrent stages joined by bounded
+    queues. Articles move on as soon as they are collected, are scored and
+    committed in micro-batches, and a full queue blocks the stage feeding
+    it, so memory use is bounded by the queue sizes rather than by the
+    size of the run.
+    """
+
+    def __init__(self, crawler, analyzer, database, config: Dict = None, aggregator=None):
+        """
+        Initialize pipeline
+
+        Args:
+            crawler: news_crawler.NewsCrawler (anything with iter_news;
+                commit() and release(), if present, are told which
+                articles were stored)
+            analyzer: sentiment_analyzer.SentimentAnalyzer
+            database: database.Database
+            config: Configuration dictionary. Recognised keys:
+                queue_size: Capacity of each inter-stage queue (default 1000)
+                score_batch_size: Articles scored per call (default 64)
+                commit_batch_size: Articles saved per commit (default 256)
+                commit_retries: Retries of a failed commit (default 3);
+                    articles of a batch that still fails are released, so
+                    the next crawl fetches them again
+                retry_backoff: Seconds before the first retry, doubled
+                    after each (default 1.0)
+                flush_interval: Seconds a partial batch may wait for more
+                    articles before being processed anyway (default 0.5)
+            aggregator: Optional analysis.streaming.StreamingSentimentAggregator
+                fed with every scored article
+        """
+        self.crawler = crawler
+        self.analyzer = analyzer
+        self.database = database
+        self.aggregator = aggregator
+        self.config = config or {}
+        self.logger = logging.getLogger(__name__)
+        self.queue_size = self.config.get('queue_size', 1000)
+        self.score_batch_size = self.config.get('score_batch_size', 64)
+        self.commit_batch_size = self.config.get('commit_batch_size', 256)
+        self.commit_retries = self.config.get('commit_retries', 3)
+        self.retry_backoff = self.config.get('retry_backoff', 1.0)
+        self.flush_interval = self.config.get('flush_interval', 0.5)
+
+    def run(self, symbols: List[str], days: int = 7) -> Dict[str, Any]:
+        """
+        Crawl, score and store news for the given symbols
+
+        Args:
+            symbols: Stock symbols
+            days: Number of days
+
+        Returns:
+            Run statistics
+
+        Raises:
+            PipelineError: If any stage failed
+        """
+        scored = queue.Queue(maxsize=self.queue_size)
+        crawled = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        errors = []
+        start = time.monotonic()
+        stats = {
+            'crawled': 0,
+            'scored': 0,
+            'stored': 0,
+            'failed_commits': 0,
+            'commits': 0,
+            'time_to_first_commit': None,
+        }
+
+        def crawl():
+            for article in self.crawler.iter_news(symbols, days):
+                if not self._put(crawled, article, stop):
+                    return
+                stats['crawled'] += 1
+
+        def score():
+            for batch in self._batches(crawled, self.score_batch_size, stop):
+                for article in self.analyzer.analyze_sentiment(batch):
+                    if self.aggregator is not None:
+                        self.aggregator.update_article(article)
+                    if not self._put(scored, article, stop):
+                        return
+                stats['scored'] += len(batch)
+
+        def store():
+            for batch in self._batches(scored, self.commit_batch_size, stop):
+                stored = save_with_retry(self.database, batch, self.commit_retries,
+                                         self.retry_backoff, stop)
+                self._settle(batch, stored)
+                if stored:
+                    stats['stored'] += len(batch)
+                    stats['commits'] += 1
+                    if stats['time_to_first_commit'] is None:
+                        stats['time_to_first_commit'] = time.monotonic() - start
+                else:
+                    stats['failed_commits'] += 1
+
+        threads = [
+            self._stage('crawl', crawl, None, crawled, stop, errors),
+            self._stage('score', score, crawled, scored, stop, errors),
+            self._stage('store', store, scored, None, stop, errors),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats['elapsed'] = time.monotonic() - start
+        if errors:
+            raise PipelineError(f"Pipeline failed: {errors[0]}") from errors[0]
+
+        self.logger.info(
+            f"Pipeline stored {stats['stored']} of {stats['crawled']} articles "
+            f"in {stats['commits']} commits ({stats['elapsed']:.2f}s)"
+        )
+        return stats
+
+    def _stage(self, name: str, body: Callable, inbox: queue.Queue, outbox: queue.Queue,
+               stop: threading.Event, errors: List[Exception]) -> threading.Thread:
+        """Wrap a stage body with end-of-stream and failure handling"""
+        def target():
+            try:
+                body()
+            except Exception as e:
+                self.logger.error(f"Error in {name} stage: {e}")
+                errors.append(e)
+                stop.set()
+            finally:
+                if outbox is not None:
+                    self._put(outbox, _DONE, stop)
+
+        return threading.Thread(target=target, name=f"pipeline-{name}", daemon=True)
+
+    def _settle(self, batch: List[Dict], stored: bool):
+        """Tell the crawler whether a batch was stored"""
+        settle = getattr(self.crawler, 'commit' if stored else 'release', None)
+        if settle is not None:
+            settle(batch)
+
+    def _put(self, q: queue.Queue, item: Any, stop: threading.Event) -> bool:
+        """Put an item, giving up if the pipeline is stopping"""
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _batches(self, q: queue.Queue, size: int, stop: threading.Event):
+        """
+        Group queued items into batches of up to size
+
+        A partial batch is released once no new item arrives within
+        flush_interval, so slow trickles still make progress.
+        """
+        batch = []
+        while not stop.is_set():
+            try:
+                item = q.get(timeout=self.flush_interval)
+            except queue.Empty:
+                if batch:
+                    yield batch
+                    batch = []
+                continue
+
+            if item is _DONE:
+                break
+            batch.append(item)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+
+        if batch and not stop.is_set():
+            yield batch
@@ -0,0 +1,353 @@
+"""
+Scheduler Module
+Responsible for polling tickers continuously on adaptive per-ticker intervals
+"""
+
+from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+import heapq
+import logging
+import math
+import random
+import threading
+import time
+
+from ..pipeline.pipeline import save_with_retry
+
+
+class _Ticker:
+    """Polling state of one ticker"""
+
+    __slots__ = ('symbol', 'rate', 'interval', 'due', 'last_poll', 'running',
+                 'pending', 'polls', 'articles', 'failures')
+
+    def __init__(self, symbol: str, rate: float, interval: float, due: float):
+        self.symbol = symbol
+        # Smoothed new articles per second
+        self.rate = rate
+        self.interval = interval
+        self.due = due
+        self.last_poll = None
+        self.running = False
+        # A poll was requested while one was running
+        self.pending = False
+        self.polls = 0
+        self.articles = 0
+        self.failures = 0
+
+
+class NewsScheduler:
+    """News Scheduler Class
+
+    Long-running service that crawls, scores, stores and alerts on each
+    ticker on its own interval. The crawler, analyzer, database and alert
+    system are created once and reused by every poll.
+
+    Intervals follow each ticker's smoothed rate of new articles: a ticker
+    publishing at rate r is polled every c / sqrt(r) seconds, which
+    minimises the average delay before an article is picked up for a given
+    number of polls. c is chosen so the total poll rate equals polling every
+    ticker every base_interval seconds, so hot names get fresher coverage
+    at the expense of quiet ones without raising request volume (before
+    clamping to [min_interval, max_interval]).
+
+    A ticker is never polled twice at once: it is rescheduled only when its
+    poll finishes, and poll_now() during a poll queues a single follow-up.
+    At most max_concurrency polls run at a time; due tickers wait in
+    deadline order.
+    """
+
+    def __init__(self, crawler, analyzer, database, alert_system=None, config: Dict = None):
+        """
+        Initialize scheduler
+
+        Args:
+            crawler: news_crawler.NewsCrawler (anything with collect_news;
+                commit() and release(), if present, are told whether the
+                articles were stored)
+            analyzer: sentiment_analyzer.SentimentAnalyzer
+            database: database.Database
+            alert_system: Optional alert_system.AlertSystem checked after
+                every poll
+            config: Configuration dictionary. Recognised keys:
+                base_interval: Seconds between polls of a ticker if all were
+                    polled alike; sets the request budget (default 900)
+                min_interval: Shortest interval in seconds (default 60)
+                max_interval: Longest interval in seconds (default 6 hours)
+                max_concurrency: Polls running at once (default 8)
+                lookback_days: Days passed to collect_news (default 1)
+                commit_retries: Retries of a failed save (default 3); if
+                    it still fails the articles are released and the poll
+                    counts as failed
+                retry_backoff: Seconds before the first retry, doubled
+                    after each (default 1.0)
+                rate_smoothing: Weight of the latest observed article rate
+                    (default 0.3)
+                min_rate: Articles per second assumed for tickers with no
+                    recent news (default one per week)
+        """
+        self.crawler = crawler
+        self.analyzer = analyzer
+        self.database = database
+        self.alert_system = alert_system
+        self.config = config or {}
+        self.logger = logging.getLogger(__name__)
+        self.base_interval = self.config.get('base_interval', 900.0)
+        self.min_interval = self.config.get('min_interval', 60.0)
+        self.max_interval = self.config.get('max_interval', 6 * 3600.0)
+        self.max_concurrency = self.config.get('max_concurrency', 8)
+        self.lookback_days = self.config.get('lookback_days', 1)
+        self.commit_retries = self.config.get('commit_retries', 3)
+        self.retry_backoff = self.config.get('retry_backoff', 1.0)
+        self.rate_smoothing = self.config.get('rate_smoothing', 0.3)
+        self.min_rate = self.config.get('min_rate', 1.0 / (7 * 24 * 3600))
+
+        self._clock = time.monotonic
+        self._cond = threading.Condition()
+        self._tickers: Dict[str, _Ticker] = {}
+        self._heap: List = []
+        self._sequence = 0
+        # Sum of sqrt(rate) over all tickers
+        self._rate_norm = 0.0
+        self._running = 0
+        self._stopping = False
+        self._started = None
+
+    def add_symbols(self, symbols: List[str]):
+        """
+        Start polling tickers; known tickers are left as they are
+
+        New tickers start at base_interval and get their first poll within
+        min_interval, spread out to avoid a burst.
+
+        Args:
+            symbols: Stock symbols
+        """
+        with self._cond:
+            now = self._clock()
+            rate = 1.0 / self.base_interval
+            for symbol in symbols:
+                if symbol in self._tickers:
+                    continue
+                ticker = _Ticker(symbol, rate, self.base_interval,
+                                 now + random.uniform(0, self.min_interval))
+                self._tickers[symbol] = ticker
+                self._rate_norm += math.sqrt(rate)
+                self._push(ticker)
+            self._cond.notify_all()
+
+    def remove_symbol(self, symbol: str):
+        """
+        Stop polling a ticker; a poll already running is allowed to finish
+
+        Args:
+            symbol: Stock symbol
+        """
+        with self._cond:
+            ticker = self._tickers.pop(symbol, None)
+            if ticker is not None:
+                self._rate_norm -= math.sqrt(ticker.rate)
+
+    def poll_now(self, symbol: str):
+        """
+        Poll a ticker as soon as a slot is free
+
+        If the ticker is being polled, one follow-up poll runs after it;
+        repeated requests coalesce into that one.
+
+        Args:
+            symbol: Stock symbol
+        """
+        with self._cond:
+            ticker = self._tickers.get(symbol)
+            if ticker is None:
+                return
+            if ticker.running:
+                ticker.pending = True
+            else:
+                ticker.due = self._clock()
+                self._push(ticker)
+            self._cond.notify_all()
+
+    def run(self, symbols: Optional[List[str]] = None, duration: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Poll tickers until stop() is called or duration has passed
+
+        Args:
+            symbols: Stock symbols to add before starting
+            duration: Seconds to run (default: until stop())
+
+        Returns:
+            Run statistics
+        """
+        if symbols:
+            self.add_symbols(symbols)
+        self._started = self._clock()
+        deadline = self._started + duration if duration is not None else None
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                thread_name_prefix='scheduler-poll') as executor:
+            with self._cond:
+                self._stopping = False
+                while not self._stopping:
+                    now = self._clock()
+                    if deadline is not None and now >= deadline:
+                        break
+
+                    while (self._heap and self._heap[0][0] <= now
+                           and self._running < self.max_concurrency):
+                        due, _, symbol = heapq.heappop(self._heap)
+                        ticker = self._tickers.get(symbol)
+                        # Skip entries superseded by a reschedule or removal
+                        if ticker is None or ticker.due != due or ticker.running:
+                            continue
+                        ticker.running = True
+                        self._running += 1
+                        executor.submit(self._poll, ticker)
+
+                    wake = deadline
+                    if self._heap and self._running < self.max_concurrency:
+                        wake = self._heap[0][0] if wake is None else min(wake, self._heap[0][0])
+                    self._cond.wait(None if wake is None else max(0.0, wake - now))
+
+                self._stopping = True
+                self._cond.notify_all()
+
+        stats = self.stats()
+        self.logger.info(
+            f"Scheduler ran {stats['polls']} polls for {stats['tickers']} tickers, "
+            f"{stats['articles']} new articles ({stats['polls_per_hour']:.1f} polls/h)"
+        )
+        return stats
+
+    def stop(self):
+        """Stop run() once the polls in progress have finished"""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+
+    def intervals(self) -> Dict[str, float]:
+        """
+        Get the current polling interval per ticker
+
+        Returns:
+            Mapping of symbol to interval in seconds
+        """
+        with self._cond:
+            return {symbol: ticker.interval for symbol, ticker in self._tickers.items()}
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get scheduler statistics
+
+        Returns:
+            Ticker count, totals of polls, new articles and failures, polls
+            per hour since run() started, and per-ticker details
+        """
+        with self._cond:
+            tickers = {
+                symbol: {'interval': ticker.interval,
+                         'articles_per_hour': ticker.rate * 3600,
+                         'polls': ticker.polls,
+                         'articles': ticker.articles,
+                         'failures': ticker.failures}
+                for symbol, ticker in self._tickers.items()
+            }
+            elapsed = self._clock() - self._started if self._started is not None else 0.0
+
+        polls = sum(ticker['polls'] for ticker in tickers.values())
+        return {
+            'tickers': len(tickers),
+            'polls': polls,
+            'articles': sum(ticker['articles'] for ticker in tickers.values()),
+            'failures': sum(ticker['failures'] for ticker in tickers.values()),
+            'polls_per_hour': polls * 3600 / elapsed if elapsed else 0.0,
+            'per_ticker': tickers,
+        }
+
+    def _push(self, ticker: _Ticker):
+        """Queue a ticker at its due time"""
+        self._sequence += 1
+        heapq.heappush(self._heap, (ticker.due, self._sequence, ticker.symbol))
+
+    def _poll(self, ticker: _Ticker):
+        """Run one poll and reschedule the ticker"""
+        try:
+            count = self._process(ticker.symbol)
+        except Exception as e:
+            self.logger.error(f"Error polling {ticker.symbol}: {e}")
+            count = None
+
+        with self._cond:
+            now = self._clock()
+            if count is None:
+                ticker.failures += 1
+            else:
+                ticker.articles += count
+                # Not if the symbol was removed (and maybe re-added) meanwhile
+                if self._tickers.get(ticker.symbol) is ticker:
+                    self._observe(ticker, count, now)
+            ticker.polls += 1
+            ticker.last_poll = now
+            ticker.running = False
+            self._running -= 1
+
+            ticker.due = now if ticker.pending else now + ticker.interval
+            ticker.pending = False
+            if self._tickers.get(ticker.symbol) is ticker:
+                self._push(ticker)
+            self._cond.notify_all()
+
+    def _process(self, symbol: str) -> int:
+        """
+        Crawl, score, store and check alerts for one ticker
+
+        Returns:
+            Number of new articles
+        """
+        articles = self.crawler.collect_news(symbol, self.lookback_days) or []
+        if articles:
+            try:
+                self.analyzer.analyze_sentiment(articles)
+                if not save_with_retry(self.database, articles, self.commit_retries,
+                                       self.retry_backoff):
+                    raise RuntimeError(f"Could not save {len(articles)} articles")
+            except Exception:
+                # Let the next poll fetch them again
+                release = getattr(self.crawler, 'release', None)
+                if release is not None:
+                    release(articles)
+                raise
+            commit = getattr(self.crawler, 'commit', None)
+            if commit is not None:
+                commit(articles)
+
+        if self.alert_system is not None:
+            scores = [article['sentiment']['compound'] for article in articles
+                      if article.get('sentiment')]
+            alerts = self.alert_system.check_alerts({
+                'symbol': symbol,
+                'news': articles,
+                'sentiment_score': sum(scores) / len(scores) if scores else None,
+            })
+            if alerts:
+                self.alert_system.send_notifications(alerts)
+
+        return len(articles)
+
+    def _observe(self, ticker: _Ticker, count: int, now: float):
+        """Update a ticker's article rate and interval after a poll"""
+        if ticker.last_poll is None:
+            # The first poll sees the whole look-back window
+            elapsed = self.lookback_days * 24 * 3600
+        else:
+            elapsed = max(now - ticker.last_poll, 1.0)
+
+        rate = ticker.rate + self.rate_smoothing * (count / elapsed - ticker.rate)
+        rate = max(rate, self.min_rate)
+        self._rate_norm += math.sqrt(rate) - math.sqrt(ticker.rate)
+        ticker.rate = rate
+
+        budget = len(self._tickers) / self.base_interval
+        interval = self._rate_norm / (budget * math.sqrt(rate))
+        ticker.interval = min(self.max_interval, max(self.min_interval, interval))
@@ -3,24 +3,40 @@ Sentiment Analysis Module
 Responsible for analyzing sentiment in news text
 """
 
-from typing import List, Dict
+from typing import List, Dict, Iterable, Iterator
+from importlib import metadata
 import nltk
+import numpy as np
+import pandas as pd
 from textblob import TextBlob
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 import logging
 
+from ..utils.parallel import iter_process_map
+
+try:
+    VADER_VERSION = metadata.version('vaderSentiment')
+except metadata.PackageNotFoundError:
+    VADER_VERSION = 'unknown'
+
 class SentimentAnalyzer:
     """Sentiment Analyzer Class"""
     
+    # Weight of each text part in the combined compound score
+    TITLE_WEIGHT = 0.3
+    CONTENT_WEIGHT = 0.5
+    COMMENTS_WEIGHT = 0.2
+    
     def __init__(self, config: Dict = None):
         """
         Initialize analyzer
         
         Args:
-            config: Configuration dictionary
+            config: Configuration dictionary ('cache' may hold a SentimentCache)
         """
         self.config = config or {}
         self.vader = SentimentIntensityAnalyzer()
+        self.cache = self.config.get('cache')
         self.logger = logging.getLogger(__name__)
         
     def analyze_sentiment(self, news: List[Dict]) -> List[Dict]:
@@ -34,18 +50,105 @@ class SentimentAnalyzer:
             News list with sentiment scores
         """
         for article in news:
-            try:
-                article['sentiment'] = self._analyze_text(
-                    title=article.get('title', ''),
-                    content=article.get('content', ''),
-                    comments=article.get('comments', [])
-                )
-            except Exception as e:
-                self.logger.error(f"Error analyzing article {article.get('id')}: {e}")
-                article['sentiment'] = {'compound': 0.0}
+            article['sentiment'] = self._score_article(article)
                 
         return news
     
+    def iter_analyze_parallel(self, news: Iterable[Dict], workers: int = None,
+                              chunk_size: int = 500) -> Iterator[Dict]:
+        """
+        Analyze news sentiment on a pool of worker processes
+        
+        Each worker builds its own analyzer (and VADER lexicon) once;
+        articles are shipped in chunks and yielded back in input order as
+        soon as their chunk is done, so large backfills can be streamed.
+        
+        Args:
+            news: Iterable of news articles
+            workers: Number of processes (default: CPU count)
+            chunk_size: Articles per task
+            
+        Yields:
+            News articles with sentiment scores
+        """
+        if self.cache is not None:
+            # Release the write lock before workers share the cache file
+            self.cache.flush()
+        for article, sentiment in iter_process_map(
+                SentimentAnalyzer, '_score_article', news, workers, chunk_size,
+                factory_kwargs={'config': self.config}):
+            article['sentiment'] = sentiment
+            yield article
+    
+    def _score_article(self, article: Dict) -> Dict:
+        """
+        Score a single article
+        
+        Args:
+            article: News article
+            
+        Returns:
+            Sentiment scores
+        """
+        try:
+            return self._analyze_text(
+                title=article.get('title', ''),
+                content=article.get('content', ''),
+                comments=article.get('comments', [])
+            )
+        except Exception as e:
+            self.logger.error(f"Error analyzing article {article.get('id')}: {e}")
+            return {'compound': 0.0}
+    
+    def analyze_batch(self, news: List[Dict]) -> pd.DataFrame:
+        """
+        Analyze sentiment of a batch of news without modifying it
+        
+        Titles, contents and comments of the whole batch are flattened into
+        one list, each distinct text is scored once, and the weighted
+        combination is computed over arrays.
+        
+        Args:
+            news: List of news articles
+            
+        Returns:
+            DataFrame with one row per article (same order) and columns
+            compound, title_compound, content_compound, comments_compound
+            and comment_count
+        """
+        count = len(news)
+        titles = [article.get('title') or '' for article in news]
+        contents = [article.get('content') or '' for article in news]
+        comments = [article.get('comments') or [] for article in news]
+        
+        comment_counts = np.fromiter((len(c) for c in comments), dtype=np.int64, count=count)
+        owners = np.repeat(np.arange(count), comment_counts)
+        texts = titles + contents + [comment for c in comments for comment in c]
+        
+        # Syndicated headlines and boilerplate repeat a lot within a batch
+        scores = {}
+        for text in texts:
+            if text not in scores:
+                scores[text] = self._get_vader_sentiment(text)['compound']
+        compound = np.fromiter((scores[text] for text in texts), dtype=np.float64,
+                               count=len(texts))
+        
+        title_compound = compound[:count]
+        content_compound = compound[count:2 * count]
+        comment_sums = np.bincount(owners, weights=compound[2 * count:], minlength=count)
+        comments_compound = np.divide(comment_sums, comment_counts,
+                                      out=np.zeros(count), where=comment_counts > 0)
+        
+        return pd.DataFrame({
+            'compound': (title_compound * self.TITLE_WEIGHT +
+                         content_compound * self.CONTENT_WEIGHT +
+                         comments_compound * self.COMMENTS_WEIGHT),
+            'title_compound': title_compound,
+            'content_compound': content_compound,
+            'comments_compound': comments_compound,
+            'comment_count': comment_counts
+        })
+    
     def _analyze_text(self, title: str, content: str, comments: List[str]) -> Dict:
         """
         Analyze text sentiment
@@ -58,11 +161,6 @@ class SentimentAnalyzer:
         Returns:
             Sentiment scores
         """
-        # Calculate weights for each part
-        title_weight = 0.3
-        content_weight = 0.5
-        comments_weight = 0.2
-        
         # Analyze each part
         title_sentiment = self._get_vader_sentiment(title)
         content_sentiment = self._get_vader_sentiment(content)
@@ -70,9 +168,9 @@ class SentimentAnalyzer:
         
         # Calculate weighted average
         compound = (
-            title_sentiment['compound'] * title_weight +
-            content_sentiment['compound'] * content_weight +
-            comments_sentiment['compound'] * comments_weight
+            title_sentiment['compound'] * self.TITLE_WEIGHT +
+            content_sentiment['compound'] * self.CONTENT_WEIGHT +
+            comments_sentiment['compound'] * self.COMMENTS_WEIGHT
         )
         
         return {
@@ -84,6 +182,9 @@ class SentimentAnalyzer:
     
     def _get_vader_sentiment(self, text: str) -> Dict:
         """Analyze sentiment using VADER"""
+        if self.cache is not None:
+            return self.cache.get_or_compute(text, 'vader', VADER_VERSION,
+                                             self.vader.polarity_scores)
         return self.vader.polarity_scores(text)
     
     def _analyze_comments(self, comments: List[str]) -> Dict:
@@ -59,6 +59,59 @@ def get_app_config() -> Dict[str, Any]:
         'port': int(os.getenv('PORT', 8000))
     }
 
+def get_http_config() -> Dict[str, Any]:
+    """
+    Get HTTP transport configuration from environment variables.
+    
+    Returns:
+        Dict[str, Any]: HTTP transport parameters
+    """
+    return {
+        'connect_timeout': float(os.getenv('HTTP_CONNECT_TIMEOUT', 5)),
+        'read_timeout': float(os.getenv('HTTP_READ_TIMEOUT', 30)),
+        'max_retries': int(os.getenv('HTTP_MAX_RETRIES', 3)),
+        'backoff_factor': float(os.getenv('HTTP_BACKOFF_FACTOR', 0.5)),
+        'pool_maxsize': int(os.getenv('HTTP_POOL_MAXSIZE', 10)),
+        'pool_connections': int(os.getenv('HTTP_POOL_CONNECTIONS', 10))
+    }
+
+def get_nlp_config() -> Dict[str, Any]:
+    """
+    Get NLP resource configuration from environment variables.
+    
+    Returns:
+        Dict[str, Any]: NLP resource parameters
+    """
+    return {
+        'data_dir': os.getenv('NLP_DATA_DIR', os.path.join(os.path.expanduser('~'), 'nltk_data')),
+        'offline': os.getenv('NLP_OFFLINE', 'False').lower() == 'true',
+        'deepl_auth_key': os.getenv('DEEPL_AUTH_KEY', ''),
+        'opencc_config': os.getenv('OPENCC_CONFIG', 's2hk')
+    }
+
+def get_api_config() -> Dict[str, Any]:
+    """
+    Get REST API configuration from environment variables.
+    
+    API_KEYS lists the accepted keys with their plans, as
+    'key1:free,key2:pro,key3:enterprise'.
+    
+    Returns:
+        Dict[str, Any]: REST API parameters
+    """
+    api_keys = {}
+    for entry in os.getenv('API_KEYS', '').split(','):
+        key, _, plan = entry.strip().partition(':')
+        if key:
+            api_keys[key] = plan or 'free'
+    return {
+        'api_keys': api_keys,
+        'db_path': os.getenv('DB_PATH', 'stock_news.db'),
+        'db_workers': int(os.getenv('API_DB_WORKERS', 16)),
+        'cache_ttl': float(os.getenv('API_CACHE_TTL', 30)),
+        'max_batch_symbols': int(os.getenv('API_MAX_BATCH_SYMBOLS', 100))
+    }
+
 def get_smtp_config() -> Dict[str, str]:
     """
     Get SMTP configuration for email alerts.
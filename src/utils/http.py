@@ -0,0 +1,191 @@
+"""
+Shared HTTP transport module.
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import get_http_config
+
+logger = logging.getLogger(__name__)
+
+# Status codes that are worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+_shared_client = None
+_shared_lock = threading.Lock()
+
+
+class HttpClient:
+    """Pooled, keep-alive HTTP client with timeouts and jittered retries."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the HTTP client.
+
+        Args:
+            config (Dict[str, Any], optional): Overrides for get_http_config().
+                'host_pool_sizes' maps a host name to its own pool size and
+                'headers' sets default request headers.
+        """
+        self.config = get_http_config()
+        self.config.update(config or {})
+        self.timeout = (self.config['connect_timeout'], self.config['read_timeout'])
+        self.max_retries = self.config['max_retries']
+        self.backoff_factor = self.config['backoff_factor']
+        self.max_backoff = self.config.get('max_backoff', 30.0)
+
+        self.session = requests.Session()
+        self.session.headers.update(self.config.get('headers', {}))
+        self._adapters = []
+        self._mount('http://', self.config['pool_maxsize'], self.config['pool_connections'])
+        self._mount('https://', self.config['pool_maxsize'], self.config['pool_connections'])
+        for host, size in self.config.get('host_pool_sizes', {}).items():
+            self._mount(f'http://{host}', size)
+            self._mount(f'https://{host}', size)
+
+        self._lock = threading.Lock()
+        self._counters = {'requests': 0, 'retries': 0, 'failures': 0}
+
+    def _mount(self, prefix: str, pool_size: int, hosts: int = 1):
+        """
+        Mount a connection-pooling adapter for a URL prefix.
+
+        Args:
+            prefix (str): URL prefix, e.g. 'https://newsapi.org'
+            pool_size (int): Connections kept alive per host
+            hosts (int): Per-host pools kept before the least recently
+                used is closed (1 for a single-host prefix)
+        """
+        adapter = HTTPAdapter(pool_connections=hosts, pool_maxsize=pool_size,
+                              max_retries=0)
+        self.session.mount(prefix, adapter)
+        self._adapters.append(adapter)
+
+    def _backoff(self, attempt: int, response: Optional[requests.Response]) -> float:
+        """
+        Compute the delay before the next attempt.
+
+        Honours a numeric Retry-After header, otherwise uses exponential
+        backoff with full jitter.
+
+        Args:
+            attempt (int): Zero-based attempt number that just failed
+            response (requests.Response, optional): Failed response, if any
+
+        Returns:
+            float: Seconds to sleep
+        """
+        if response is not None:
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                return min(float(retry_after), self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * 2 ** attempt))
+
+    def _count(self, name: str):
+        with self._lock:
+            self._counters[name] += 1
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request, retrying on 429/5xx responses and connection errors.
+
+        Args:
+            method (str): HTTP method
+            url (str): Request URL
+            **kwargs: Passed through to requests.Session.request
+
+        Returns:
+            requests.Response: Final response (callers should raise_for_status)
+
+        Raises:
+            requests.exceptions.RequestException: If every attempt failed to connect
+        """
+        kwargs.setdefault('timeout', self.timeout)
+
+        for attempt in range(self.max_retries + 1):
+            self._count('requests')
+            response = None
+            try:
+                response = self.session.request(method, url, **kwargs)
+                if response.status_code not in RETRY_STATUSES:
+                    return response
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt == self.max_retries:
+                    self._count('failures')
+                    raise
+
+            if attempt == self.max_retries:
+                self._count('failures')
+                return response
+
+            delay = self._backoff(attempt, response)
+            status = response.status_code if response is not None else 'connection error'
+            logger.warning(f"Retrying {method} {url} after {status} in {delay:.2f}s")
+            self._count('retries')
+            if response is not None:
+                response.close()
+            time.sleep(delay)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """
+        Send a GET request.
+
+        Args:
+            url (str): Request URL
+            **kwargs: Passed through to request()
+
+        Returns:
+            requests.Response: Final response
+        """
+        return self.request('GET', url, **kwargs)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get transport counters.
+
+        'handshakes' is the number of new connections opened and 'pool_hits'
+        the number of requests served over an already open connection.
+
+        Returns:
+            Dict[str, int]: Transport counters
+        """
+        handshakes = 0
+        pooled_requests = 0
+        for adapter in self._adapters:
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is not None:
+                    handshakes += pool.num_connections
+                    pooled_requests += pool.num_requests
+
+        with self._lock:
+            counters = dict(self._counters)
+        counters['handshakes'] = handshakes
+        counters['pool_hits'] = max(0, pooled_requests - handshakes)
+        return counters
+
+    def close(self):
+        """Close all pooled connections."""
+        self.session.close()
+
+
+def get_http_client() -> HttpClient:
+    """
+    Get the process-wide shared HTTP client.
+
+    Returns:
+        HttpClient: Shared client
+    """
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = HttpClient()
+        return _shared_client
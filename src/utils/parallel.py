@@ -0,0 +1,83 @@
+"""
+Process pool helpers for CPU-bound batch work.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Object built once per worker process by _init_worker
+_worker = None
+
+
+def _init_worker(factory: Callable, kwargs: Dict[str, Any]):
+    """
+    Build the per-process worker object.
+
+    Args:
+        factory (Callable): Picklable callable returning the worker object
+        kwargs (Dict[str, Any]): Keyword arguments for the factory
+    """
+    global _worker
+    _worker = factory(**kwargs)
+
+
+def _run_chunk(method: str, chunk: List[Any]) -> List[Any]:
+    """
+    Apply a worker method to every item of a chunk.
+
+    Args:
+        method (str): Name of the worker method
+        chunk (List[Any]): Items to process
+
+    Returns:
+        List[Any]: Results in input order
+    """
+    function = getattr(_worker, method)
+    return [function(item) for item in chunk]
+
+
+def iter_process_map(factory: Callable, method: str, items: Iterable[Any],
+                     workers: Optional[int] = None, chunk_size: int = 500,
+                     factory_kwargs: Optional[Dict[str, Any]] = None) -> Iterator[Tuple[Any, Any]]:
+    """
+    Stream items through a method of a per-process worker object.
+
+    Each worker process calls factory(**factory_kwargs) once at start-up,
+    so expensive state such as lexicons is loaded once per process rather
+    than once per item. Items are shipped in chunks, and at most two chunks
+    per worker are in flight, so arbitrarily long iterables can be
+    streamed without being materialised.
+
+    Args:
+        factory (Callable): Picklable callable returning the worker object
+        method (str): Name of the worker method applied to each item
+        items (Iterable[Any]): Picklable input items
+        workers (int, optional): Number of processes, defaults to CPU count
+        chunk_size (int): Items per task
+        factory_kwargs (Dict[str, Any], optional): Keyword arguments for factory
+
+    Yields:
+        Tuple[Any, Any]: (item, result) pairs in input order
+    """
+    workers = workers or os.cpu_count() or 1
+    iterator = iter(items)
+    pending = deque()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(factory, factory_kwargs or {})) as executor:
+        try:
+            while True:
+                chunk = list(islice(iterator, chunk_size))
+                if chunk:
+                    pending.append((chunk, executor.submit(_run_chunk, method, chunk)))
+                if pending and (not chunk or len(pending) >= 2 * workers):
+                    done_chunk, future = pending.popleft()
+                    yield from zip(done_chunk, future.result())
+                if not chunk and not pending:
+                    break
+        finally:
+            for _, future in pending:
+                future.cancel()
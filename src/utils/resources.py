@@ -0,0 +1,201 @@
+"""
+Lazy, once-per-process loading of NLP resources.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from .config import get_nlp_config
+
+logger = logging.getLogger(__name__)
+
+_shared_manager = None
+_shared_pid = None
+_shared_lock = threading.Lock()
+
+
+class ResourceManager:
+    """
+    Registry of expensive resources (lexicons, tokenizers, translators)
+    that are loaded on first use and then reused.
+
+    NLTK data is looked up in the configured data directory and NLTK's
+    standard locations before anything is downloaded, and downloads go to
+    the data directory so later runs start offline. Load time and origin
+    are recorded per resource.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the manager with the built-in resources registered.
+
+        Args:
+            config (Dict[str, Any], optional): Overrides for get_nlp_config():
+                'data_dir' (NLTK data directory checked first and used for
+                downloads), 'offline' (never download), 'deepl_auth_key'
+                and 'opencc_config'
+        """
+        self.config = get_nlp_config()
+        self.config.update(config or {})
+        self.data_dir = self.config['data_dir']
+        self.offline = self.config['offline']
+
+        self._loaders: Dict[str, Callable[['ResourceManager'], Any]] = {}
+        self._resources: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._timings: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        # Origin of the resource being loaded by the current thread
+        self._loading = threading.local()
+
+        self.register('punkt', lambda manager: manager.nltk_data('tokenizers/punkt', 'punkt'))
+        self.register('vader', _load_vader)
+        self.register('deepl', _load_deepl)
+        self.register('opencc', _load_opencc)
+
+    def register(self, name: str, loader: Callable[['ResourceManager'], Any]):
+        """
+        Register a resource loader.
+
+        Args:
+            name (str): Resource name
+            loader (Callable): Called with the manager on first get(name)
+        """
+        with self._lock:
+            self._loaders[name] = loader
+            self._locks.setdefault(name, threading.Lock())
+            self._resources.pop(name, None)
+
+    def get(self, name: str) -> Any:
+        """
+        Get a resource, loading it on first use.
+
+        Concurrent first calls load the resource once.
+
+        Args:
+            name (str): Resource name
+
+        Returns:
+            Any: Loaded resource
+
+        Raises:
+            KeyError: If no loader is registered under name
+        """
+        if name in self._resources:
+            return self._resources[name]
+        with self._lock:
+            loader = self._loaders[name]
+            lock = self._locks[name]
+
+        with lock:
+            if name not in self._resources:
+                start = time.perf_counter()
+                self._loading.origin = 'local'
+                resource = loader(self)
+                self._timings[name] = {'seconds': time.perf_counter() - start,
+                                       'origin': self._loading.origin}
+                self._resources[name] = resource
+                logger.info(f"Loaded {name} ({self._loading.origin}) in "
+                            f"{self._timings[name]['seconds']:.3f}s")
+        return self._resources[name]
+
+    def nltk_data(self, path: str, package: str) -> str:
+        """
+        Locate NLTK data, downloading it into the data directory if absent.
+
+        Args:
+            path (str): Resource path for nltk.data.find, e.g. 'tokenizers/punkt'
+            package (str): Package name for nltk.download
+
+        Returns:
+            str: Location of the resource
+
+        Raises:
+            LookupError: If the resource is absent and the manager is offline
+                or the download failed
+        """
+        import nltk
+
+        if self.data_dir and self.data_dir not in nltk.data.path:
+            nltk.data.path.insert(0, self.data_dir)
+        try:
+            return str(nltk.data.find(path))
+        except LookupError:
+            if self.offline:
+                raise
+
+        logger.info(f"Downloading NLTK package {package} to {self.data_dir}")
+        self._loading.origin = 'download'
+        os.makedirs(self.data_dir, exist_ok=True)
+        if not nltk.download(package, download_dir=self.data_dir, quiet=True):
+            raise LookupError(f"Could not download NLTK package {package}")
+        return str(nltk.data.find(path))
+
+    def timings(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get load timing per loaded resource.
+
+        Returns:
+            Dict[str, Dict]: Seconds spent loading and origin ('local' or
+            'download') per resource, in load order
+        """
+        return {name: dict(timing) for name, timing in self._timings.items()}
+
+    def report(self) -> str:
+        """
+        Format the startup timing of the loaded resources.
+
+        Returns:
+            str: One line per resource and a total
+        """
+        lines = [f"{name:10s} {timing['seconds'] * 1000:8.1f}ms  {timing['origin']}"
+                 for name, timing in self._timings.items()]
+        total = sum(timing['seconds'] for timing in self._timings.values())
+        lines.append(f"{'total':10s} {total * 1000:8.1f}ms")
+        return '\n'.join(lines)
+
+
+def _load_vader(manager: ResourceManager) -> Any:
+    """Load NLTK's VADER analyzer, making sure its lexicon is available."""
+    manager.nltk_data('sentiment/vader_lexicon.zip', 'vader_lexicon')
+    from nltk.sentiment.vader import SentimentIntensityAnalyzer
+    return SentimentIntensityAnalyzer()
+
+
+def _load_deepl(manager: ResourceManager) -> Any:
+    """Create the DeepL translator."""
+    import deepl
+    auth_key = manager.config['deepl_auth_key']
+    if not auth_key:
+        raise ValueError("Missing DeepL auth key (set DEEPL_AUTH_KEY or deepl_auth_key)")
+    return deepl.Translator(auth_key)
+
+
+def _load_opencc(manager: ResourceManager) -> Any:
+    """Create the OpenCC converter."""
+    from opencc import OpenCC
+    return OpenCC(manager.config['opencc_config'])
+
+
+def get_resources(config: Optional[Dict[str, Any]] = None) -> ResourceManager:
+    """
+    Get the manager shared by this process.
+
+    A forked child gets a fresh manager rather than sharing its parent's
+    loaded objects. config only applies when the manager is created.
+
+    Args:
+        config (Dict[str, Any], optional): Overrides for get_nlp_config()
+
+    Returns:
+        ResourceManager: Shared manager
+    """
+    global _shared_manager, _shared_pid
+    with _shared_lock:
+        if _shared_manager is None or _shared_pid != os.getpid():
+            _shared_manager = ResourceManager(config)
+            _shared_pid = os.getpid()
+        return _shared_manager
@@ -65,6 +65,54 @@ def plot_sentiment_trend(results: Dict[str, Any], stock_symbol: str) -> str:
         logger.error(f"Error creating sentiment trend plot: {str(e)}")
         return ""
 
+def plot_daily_sentiment(daily: pd.DataFrame, stock_symbol: str) -> str:
+    """
+    Plot daily mean sentiment with a one standard deviation band.
+    
+    Reads pre-aggregated rows, so the cost depends on the number of days
+    rather than the number of articles.
+    
+    Args:
+        daily (pd.DataFrame): Output of Database.query_daily
+        stock_symbol (str): Stock symbol
+        
+    Returns:
+        str: Path to saved plot
+    """
+    try:
+        df = daily.sort_values('day')
+        
+        # Create figure
+        plt.figure(figsize=(12, 6))
+        
+        # Plot daily mean and spread
+        plt.plot(df['day'], df['mean'], marker='o', linestyle='-', linewidth=2)
+        plt.fill_between(df['day'], df['mean'] - df['std'], df['mean'] + df['std'], alpha=0.2)
+        
+        # Customize plot
+        plt.title(f'Daily Sentiment for {stock_symbol}')
+        plt.xlabel('Date')
+        plt.ylabel('Mean Compound Score')
+        plt.grid(True, linestyle='--', alpha=0.7)
+        plt.xticks(rotation=45)
+        plt.axhline(y=0, color='gray', linestyle='-', alpha=0.3)
+        
+        # Adjust layout
+        plt.tight_layout()
+        
+        # Save plot
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        plot_path = f'data/plots/{stock_symbol}_daily_{timestamp}.png'
+        plt.savefig(plot_path)
+        plt.close()
+        
+        logger.info(f"Daily sentiment plot saved to {plot_path}")
+        return plot_path
+        
+    except Exception as e:
+        logger.error(f"Error creating daily sentiment plot: {str(e)}")
+        return ""
+
 def plot_sentiment_distribution(results: Dict[str, Any], stock_symbol: str) -> str:
     """
     Plot distribution of sentiment categories.
@@ -0,0 +1,3 @@
+"""
+Stock News Sentiment Analyzer command-line entry points.
+"""
@@ -0,0 +1,191 @@
+"""
+Batch command line for collecting, scoring and storing news for many tickers.
+
+Runs headless: tickers come from a file (or config.my_tickers), every
+ticker goes through one shared StreamingPipeline, and results are written
+to the database or to a new Parquet file in a dataset directory, one file
+per run. Suitable for cron.
+
+Usage:
+    stock-news-analyzer [--tickers FILE] [--days 7] [--output db|parquet]
+    python -m stock_news_analyzer --symbol AAPL
+    stock-news-analyzer --schedule [--base-interval 900]
+"""
+
+import argparse
+import json
+import logging
+import os
+import signal
+import sys
+import uuid
+from datetime import datetime
+from typing import Iterable, List, Optional
+
+from src import config as cfg
+from src.alert_system.alert_system import AlertSystem
+from src.database.archive import ParquetArchive
+from src.database.database import Database
+from src.news_crawler.news_crawler import NewsCrawler
+from src.pipeline.pipeline import PipelineError, StreamingPipeline
+from src.scheduler.scheduler import NewsScheduler
+from src.sentiment_analyzer.sentiment_analyzer import SentimentAnalyzer
+from src.utils.config import setup_logging
+
+logger = logging.getLogger(__name__)
+
+
+def read_tickers(lines: Iterable[str]) -> List[str]:
+    """
+    Parse tickers separated by whitespace, commas or newlines.
+
+    Text after '#' is a comment. Tickers are upper-cased and repeats dropped.
+
+    Args:
+        lines (Iterable[str]): Lines of a ticker file
+
+    Returns:
+        List[str]: Tickers in first-seen order
+    """
+    tickers = []
+    for line in lines:
+        for ticker in line.split('#', 1)[0].replace(',', ' ').split():
+            tickers.append(ticker.upper())
+    return list(dict.fromkeys(tickers))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='stock-news-analyzer',
+        description='Collect, score and store news for a list of tickers.')
+    parser.add_argument('symbols', nargs='*',
+                        help='Tickers to process (overrides --tickers)')
+    parser.add_argument('--symbol', action='append', default=[],
+                        help='Ticker to process; may be repeated')
+    parser.add_argument('--tickers', metavar='FILE',
+                        help="Ticker file, '-' for stdin (default: config.my_tickers)")
+    parser.add_argument('--days', type=int, default=7, help='Days of news to collect (per poll with --schedule)')
+    parser.add_argument('--output', choices=('db', 'parquet'), default='db',
+                        help='Where to write results')
+    parser.add_argument('--db-path', default='stock_news.db', help='SQLite database file')
+    parser.add_argument('--db-url', help='SQLAlchemy URL; selects the PostgreSQL backend')
+    parser.add_argument('--parquet', metavar='DIR', default='stock_news_parquet',
+                        help='Directory receiving one Parquet file per run for --output parquet '
+                             '(read the whole dataset with pandas.read_parquet(DIR))')
+    parser.add_argument('--dedup-index', metavar='FILE',
+                        help='SQLite file keeping the near-duplicate index across runs '
+                             '(default: in memory, this run only)')
+    parser.add_argument('--queue-size', type=int, default=1000)
+    parser.add_argument('--score-batch-size', type=int, default=64)
+    parser.add_argument('--commit-batch-size', type=int, default=256)
+    parser.add_argument('--schedule', action='store_true',
+                        help='Keep running, polling each ticker on its own adaptive interval')
+    parser.add_argument('--base-interval', type=float, default=900.0,
+                        help='Seconds between polls per ticker on average (sets the request budget)')
+    parser.add_argument('--min-interval', type=float, default=60.0)
+    parser.add_argument('--max-interval', type=float, default=6 * 3600.0)
+    parser.add_argument('--max-concurrency', type=int, default=8,
+                        help='Tickers polled at once')
+    return parser
+
+
+def load_symbols(args: argparse.Namespace) -> List[str]:
+    """Resolve the tickers to process from the arguments."""
+    if args.symbols or args.symbol:
+        return read_tickers(args.symbols + args.symbol)
+    if args.tickers == '-':
+        return read_tickers(sys.stdin)
+    if args.tickers:
+        with open(args.tickers, 'r', encoding='utf-8') as fh:
+            return read_tickers(fh)
+    return read_tickers(cfg.my_tickers)
+
+
+def parquet_path(directory: str) -> str:
+    """Get a new file name in a Parquet dataset directory, creating it."""
+    os.makedirs(directory, exist_ok=True)
+    stamp = datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')
+    return os.path.join(directory, f"news-{stamp}-{uuid.uuid4().hex[:8]}.parquet")
+
+
+def run_scheduler(args: argparse.Namespace, symbols: List[str], sink) -> int:
+    """Poll the tickers until SIGINT or SIGTERM."""
+    scheduler = NewsScheduler(
+        NewsCrawler({'dedup_path': args.dedup_index}), SentimentAnalyzer(), sink,
+        AlertSystem({'database': sink}) if isinstance(sink, Database) else None,
+        {'base_interval': args.base_interval,
+         'min_interval': args.min_interval,
+         'max_interval': args.max_interval,
+         'max_concurrency': args.max_concurrency,
+         'lookback_days': args.days})
+
+    def shutdown(signum, frame):
+        logger.info(f"Received signal {signum}, stopping after running polls")
+        scheduler.stop()
+
+    signal.signal(signal.SIGINT, shutdown)
+    signal.signal(signal.SIGTERM, shutdown)
+
+    logger.info(f"Scheduling {len(symbols)} tickers, output={args.output}")
+    try:
+        stats = scheduler.run(symbols)
+    finally:
+        sink.close()
+
+    stats.pop('per_ticker')
+    print(json.dumps(stats))
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the batch pipeline.
+
+    Args:
+        argv (List[str], optional): Arguments, defaults to sys.argv[1:]
+
+    Returns:
+        int: Exit status, 0 on success and 1 if the pipeline failed
+    """
+    # Never open a window, whatever gets imported along the way
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+    args = build_parser().parse_args(argv)
+    setup_logging()
+
+    symbols = load_symbols(args)
+    if not symbols:
+        logger.error("No tickers to process")
+        return 1
+
+    if args.output == 'parquet':
+        sink = ParquetArchive(parquet_path(args.parquet), keep_empty=True)
+    elif args.db_url:
+        sink = Database({'backend': 'sqlalchemy', 'db_url': args.db_url})
+    else:
+        sink = Database({'db_path': args.db_path})
+
+    if args.schedule:
+        return run_scheduler(args, symbols, sink)
+
+    pipeline = StreamingPipeline(
+        NewsCrawler({'dedup_path': args.dedup_index}), SentimentAnalyzer(), sink,
+        {'queue_size': args.queue_size,
+         'score_batch_size': args.score_batch_size,
+         'commit_batch_size': args.commit_batch_size})
+
+    logger.info(f"Processing {len(symbols)} tickers, {args.days} days, output={args.output}")
+    try:
+        stats = pipeline.run(symbols, args.days)
+    except PipelineError as e:
+        logger.error(str(e))
+        return 1
+    finally:
+        sink.close()
+
+    stats['symbols'] = len(symbols)
+    print(json.dumps(stats))
+    return 0 if not stats['failed_commits'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
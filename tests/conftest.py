@@ -0,0 +1,50 @@
+"""
+Shared fixtures. The database fixture runs a test against SQLite and, when
+TEST_POSTGRES_URL points at a server (e.g.
+postgresql+psycopg2://postgres@localhost/postgres), against a scratch
+database created on it for each test.
+"""
+
+import os
+import sys
+import uuid
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.database.database import Database  # noqa: E402
+
+POSTGRES_URL = os.environ.get('TEST_POSTGRES_URL')
+
+
+@pytest.fixture(params=['sqlite', 'postgresql'])
+def database(request, tmp_path):
+    if request.param == 'sqlite':
+        db = Database({'db_path': str(tmp_path / 'news.db')})
+        db.node_config = {'db_path': str(tmp_path / 'news.db')}
+        yield db
+        db.close()
+        return
+
+    if not POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    sqlalchemy = pytest.importorskip('sqlalchemy')
+    admin = sqlalchemy.create_engine(POSTGRES_URL, isolation_level='AUTOCOMMIT')
+    name = f"test_{uuid.uuid4().hex[:12]}"
+    try:
+        with admin.connect() as conn:
+            conn.exec_driver_sql(f"CREATE DATABASE {name}")
+    except sqlalchemy.exc.OperationalError as e:
+        pytest.skip(f"PostgreSQL is unavailable: {e}")
+
+    url = sqlalchemy.engine.make_url(POSTGRES_URL).set(database=name)
+    db = Database({'backend': 'sqlalchemy', 'db_url': url})
+    db.node_config = {'backend': 'sqlalchemy', 'db_url': url}
+    try:
+        yield db
+    finally:
+        db.close()
+        with admin.connect() as conn:
+            conn.exec_driver_sql(f"DROP DATABASE {name}")
+        admin.dispose()
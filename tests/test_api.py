@@ -0,0 +1,74 @@
+"""
+API server tests
+"""
+
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip('fastapi')
+pytest.importorskip('httpx')
+from fastapi.testclient import TestClient  # noqa: E402
+
+from src.api.server import ResponseCache, create_app  # noqa: E402
+
+
+@pytest.fixture
+def client(database):
+    now = datetime.now(timezone.utc)
+    database.save_news([{'symbol': 'AAPL', 'title': f'Apple headline {i}', 'content': 'Story',
+                         'source': 'Reuters', 'url': f'https://example.com/{i}',
+                         'published_at': (now - timedelta(days=i)).strftime('%Y-%m-%dT%H:%M:%SZ'),
+                         'sentiment': {'compound': 0.5, 'pos': 0.3, 'neu': 0.7, 'neg': 0.0}}
+                        for i in range(5)])
+    app = create_app({'database': database, 'api_keys': {'key': 'enterprise'}})
+    with TestClient(app, headers={'Authorization': 'Bearer key'}) as client:
+        yield client
+
+
+def test_report_date_filter(client):
+    response = client.get('/api/v1/reports/AAPL')
+    assert response.status_code == 200
+    assert len(response.text.splitlines()) == 6
+
+    start = (date.today() - timedelta(days=2)).isoformat()
+    end = (date.today() - timedelta(days=1)).isoformat()
+    response = client.get('/api/v1/reports/AAPL', params={'start_date': start, 'end_date': end})
+    assert response.status_code == 200
+    lines = response.text.splitlines()
+    assert len(lines) == 3
+    assert {line.split(',')[1] for line in lines[1:]} == {'Apple headline 1', 'Apple headline 2'}
+
+
+def test_response_cache_cancelled_computation():
+    cache = ResponseCache(ttl=60)
+    calls = []
+
+    async def compute() -> bytes:
+        calls.append(1)
+        if len(calls) == 1:
+            await asyncio.sleep(60)
+        return b'body'
+
+    async def run():
+        first = asyncio.ensure_future(cache.get('key', compute))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(cache.get('key', compute))
+        await asyncio.sleep(0)
+        first.cancel()
+        body, _ = await asyncio.wait_for(second, 5)
+        assert first.cancelled()
+        return body
+
+    assert asyncio.run(run()) == b'body'
+    assert len(calls) == 2
+
+
+def test_create_alert(client):
+    response = client.post('/api/v1/alerts', json={'stock_symbol': 'aapl',
+                                                    'conditions': {'keywords': ['probe']}})
+    assert response.status_code == 200
+    record = response.json()['data']
+    assert record['stock_symbol'] == 'AAPL'
+    assert datetime.strptime(record['created_at'], '%Y-%m-%dT%H:%M:%SZ')
@@ -0,0 +1,183 @@
+"""
+Storage backend tests, run against each backend of the database fixture
+"""
+
+import random
+import threading
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.database.database import Database
+
+
+def article(i: int, compound: float = 0.5, days_ago: float = 0, symbol: str = 'AAPL') -> dict:
+    published = datetime.utcnow() - timedelta(days=days_ago, minutes=i)
+    return {'symbol': symbol, 'title': f'Apple headline {i}', 'content': f'Story "{i}", with commas',
+            'source': 'Reuters', 'url': f'https://example.com/{symbol}/{i}',
+            'published_at': published.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'sentiment': {'compound': compound, 'pos': 0.3, 'neu': 0.7, 'neg': 0.0}}
+
+
+def test_save_and_query(database):
+    assert database.save_news([article(i) for i in range(5)])
+
+    frame = database.query_news_frame('AAPL', 7)
+    assert len(frame) == 5
+    assert set(frame['compound']) == {0.5}
+    assert frame.loc[frame['url'].str.endswith('/0'), 'content'].item() == 'Story "0", with commas'
+
+
+def test_numpy_scores(database):
+    news = [article(0)]
+    news[0]['sentiment'] = {key: np.float64(value) for key, value in news[0]['sentiment'].items()}
+    assert database.save_news(news)
+    assert database.query_news_frame('AAPL')['compound'].tolist() == [0.5]
+
+
+def test_upsert_replaces_score(database):
+    assert database.save_news([article(0, 0.5), article(1, 0.5)])
+    assert database.save_news([article(0, -0.5)])
+
+    frame = database.query_news_frame('AAPL').sort_values('url')
+    assert frame['compound'].tolist() == [-0.5, 0.5]
+    summary = database.sentiment_summary('AAPL')
+    assert summary['article_count'] == 2
+    assert summary['sentiment_score'] == pytest.approx(0.0)
+
+
+def test_upsert_mixed_batch(database):
+    assert database.save_news([article(i, 0.1) for i in range(10)])
+    batch = [dict(article(i, 0.2), title=f'Updated {i}') for i in range(6)] + [article(10, 0.2)]
+    assert database.save_news(batch)
+
+    frame = database.query_news_frame('AAPL').set_index('url')
+    assert len(frame) == 11
+    for i in range(6):
+        row = frame.loc[article(i)['url']]
+        assert row['compound'] == pytest.approx(0.2)
+        assert row['title'] == f'Updated {i}'
+    assert frame.loc[article(10)['url'], 'compound'] == pytest.approx(0.2)
+    summary = database.sentiment_summary('AAPL')
+    assert summary['article_count'] == 11
+    assert summary['sentiment_score'] == pytest.approx(frame['compound'].mean())
+
+
+def test_clean_data(database):
+    assert database.save_news([article(0), article(1, days_ago=30)])
+    assert database.clean_data(7)
+    assert database.query_news_frame('AAPL')['url'].tolist() == [article(0)['url']]
+
+
+def test_clean_data_updates_rollup(database):
+    old = article(1, days_ago=30)
+    assert database.save_news([article(0), dict(old)])
+    assert database.clean_data(7)
+    assert database.sentiment_summary('AAPL')['article_count'] == 1
+
+    # Crawled again after being purged: counted once
+    assert database.save_news([dict(old)])
+    assert database.sentiment_summary('AAPL')['article_count'] == 2
+
+
+def test_concurrent_upserts_keep_rollup_exact(database):
+    """Several nodes re-scoring the same articles at once"""
+    errors = []
+
+    def node(seed: int):
+        db = Database(database.node_config)
+        rng = random.Random(seed)
+        try:
+            for _ in range(10):
+                news = [article(i, rng.uniform(-1, 1)) for i in rng.sample(range(20), 10)]
+                if not db.save_news(news):
+                    errors.append(seed)
+        finally:
+            db.close()
+
+    threads = [threading.Thread(target=node, args=(seed,)) for seed in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    scores = database.query_news_frame('AAPL')['compound']
+    summary = database.sentiment_summary('AAPL')
+    assert summary['article_count'] == len(scores)
+    assert summary['sentiment_score'] == pytest.approx(scores.mean())
+
+
+def test_search_news(database):
+    news = [dict(article(0), title='Apple announces share buyback', content='A large buyback'),
+            dict(article(1), title='Apple faces antitrust probe', content='Regulators look at fees'),
+            dict(article(2, symbol='MSFT'), title='Microsoft share buyback', content='Also a buyback')]
+    assert database.save_news(news)
+
+    found = database.search_news('"share buyback"', 'AAPL')
+    assert list(found['url']) == [news[0]['url']]
+
+    found = database.search_news('buyback')
+    assert len(found) == 2
+    assert '[buyback]' in found['snippet'][0]
+    assert len(database.search_news('buyback OR antitrust', 'AAPL')) == 2
+    assert list(database.search_news('apple NOT buyback')['url']) == [news[1]['url']]
+    assert database.search_news('merger', 'AAPL').empty
+
+
+def test_keyword_alert_searches_database(database):
+    from src.alert_system.alert_system import AlertSystem
+
+    assert database.save_news([dict(article(0), title='Apple faces antitrust probe')])
+    alerts = AlertSystem({'database': database})
+    alerts.set_alert({'keywords': ['antitrust probe']})
+    assert alerts._check_keywords({'symbol': 'AAPL'})
+    alerts.set_alert({'keywords': ['share buyback']})
+    assert not alerts._check_keywords({'symbol': 'AAPL'})
+
+
+def test_clean_data_archives_each_run(database, tmp_path):
+    archive = str(tmp_path / 'archive')
+    assert database.save_news([article(0), article(1, days_ago=30), article(2, days_ago=30)])
+    assert database.clean_data(7, archive_path=archive, chunk_size=1)
+    assert database.save_news([article(3, days_ago=30)])
+    assert database.clean_data(7, archive_path=archive)
+
+    archived = pd.read_parquet(archive)
+    assert sorted(archived['url']) == sorted(article(i)['url'] for i in (1, 2, 3))
+
+
+def test_clean_data_keeps_chunks_that_failed_to_archive(database, tmp_path, monkeypatch):
+    from src.database.archive import ParquetDatasetArchive
+
+    archive = str(tmp_path / 'archive')
+    write = ParquetDatasetArchive.write
+    calls = []
+
+    def failing_write(self, frame):
+        calls.append(1)
+        if len(calls) == 2:
+            raise OSError("disk full")
+        write(self, frame)
+
+    monkeypatch.setattr(ParquetDatasetArchive, 'write', failing_write)
+    assert database.save_news([article(1, days_ago=30), article(2, days_ago=30)])
+    assert not database.clean_data(7, archive_path=archive, chunk_size=1)
+
+    archived = pd.read_parquet(archive)
+    remaining = database.query_news_frame('AAPL')
+    assert len(archived) == 1
+    assert len(remaining) == 1
+    assert set(archived['url']) | set(remaining['url']) == {article(1)['url'], article(2)['url']}
+
+
+def test_parquet_archive_refuses_to_overwrite(tmp_path):
+    from src.database.archive import ParquetArchive
+
+    path = tmp_path / 'news.parquet'
+    path.write_bytes(b'previous archive')
+    with pytest.raises(FileExistsError):
+        ParquetArchive(str(path))
+    assert path.read_bytes() == b'previous archive'
@@ -0,0 +1,46 @@
+import sqlite3
+
+from src.analysis.cache import SentimentCache
+from src.sentiment_analyzer.sentiment_analyzer import SentimentAnalyzer
+
+
+def test_returns_copies(tmp_path):
+    cache = SentimentCache(db_path=str(tmp_path / 'cache.db'))
+    value = {'compound': 0.5}
+    cache.put('key', value)
+    value['compound'] = 1.0
+    cache.get('key')['compound'] = -1.0
+    assert cache.get('key') == {'compound': 0.5}
+    cache.close()
+
+
+def test_close_persists_pending_writes(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    cache = SentimentCache(db_path=path)
+    cache.put('key', {'compound': 0.5})
+    cache.close()
+    assert SentimentCache(db_path=path).get('key') == {'compound': 0.5}
+
+
+def test_disk_errors_are_misses(tmp_path):
+    cache = SentimentCache(db_path=str(tmp_path / 'cache.db'))
+    cache._conn.execute("DROP TABLE sentiment_cache")
+    cache.put('key', {'compound': 0.5})
+    assert cache.get('key') == {'compound': 0.5}
+    assert cache.get('other') is None
+
+
+def test_shared_by_pool_workers(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    cache = SentimentCache(db_path=path)
+    analyzer = SentimentAnalyzer({'cache': cache})
+    articles = [{'title': f'Shares surge {i}', 'content': f'Record growth {i}', 'comments': []}
+                for i in range(1000)]
+
+    scored = list(analyzer.iter_analyze_parallel(articles, workers=4, chunk_size=50))
+    cache.close()
+
+    # Articles that fail to score fall back to a bare compound of 0.0
+    assert all('title' in article['sentiment'] for article in scored)
+    rows = sqlite3.connect(path).execute("SELECT COUNT(*) FROM sentiment_cache").fetchone()[0]
+    assert rows == 2000
@@ -0,0 +1,70 @@
+import os
+import shutil
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+
+from stock_news_analyzer import cli
+
+
+class FakeCrawler:
+    runs = 0
+
+    def __init__(self, config=None):
+        FakeCrawler.runs += 1
+        self.run = FakeCrawler.runs
+
+    def iter_news(self, symbols, days):
+        for symbol in symbols:
+            yield {'symbol': symbol, 'title': f'{symbol} shares rally', 'content': 'Strong growth',
+                   'source': 'Reuters', 'url': f'https://example.com/{symbol}/{self.run}',
+                   'published_at': '2024-01-31T14:05:00Z'}
+
+
+def test_read_tickers():
+    assert cli.read_tickers(['aapl, msft  # comment', 'AAPL\tgoog', '# only a comment']) == \
+        ['AAPL', 'MSFT', 'GOOG']
+
+
+def test_parquet_runs_append_to_dataset(tmp_path, monkeypatch):
+    monkeypatch.setattr(cli, 'NewsCrawler', FakeCrawler)
+    dataset = str(tmp_path / 'news')
+
+    assert cli.main(['AAPL', '--output', 'parquet', '--parquet', dataset]) == 0
+    assert cli.main(['AAPL', 'MSFT', '--output', 'parquet', '--parquet', dataset]) == 0
+
+    frame = pd.read_parquet(dataset)
+    assert sorted(frame['symbol']) == ['AAPL', 'AAPL', 'MSFT']
+
+
+def test_parquet_run_without_news_writes_empty_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(cli, 'NewsCrawler', FakeCrawler)
+    monkeypatch.setattr(FakeCrawler, 'iter_news', lambda self, symbols, days: iter(()))
+    dataset = tmp_path / 'news'
+
+    assert cli.main(['AAPL', '--output', 'parquet', '--parquet', str(dataset)]) == 0
+    files = list(dataset.iterdir())
+    assert len(files) == 1 and pd.read_parquet(files[0]).empty
+
+
+def test_installed_entry_point_runs_outside_checkout(tmp_path):
+    """The console script must not rely on the checkout being the working directory"""
+    root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+    source = tmp_path / 'source'
+    shutil.copytree(root, source, ignore=shutil.ignore_patterns(
+        '.git', 'tests', 'build', '*.egg-info', '__pycache__', '*.db', '*.parquet'))
+    target = tmp_path / 'installed'
+    build = subprocess.run([sys.executable, '-m', 'pip', 'install', '--quiet', '--no-deps',
+                            '--target', str(target), str(source)],
+                           capture_output=True, text=True)
+    if 'No matching distribution found' in build.stderr:
+        pytest.skip("Build requirements are not available")
+    assert build.returncode == 0, build.stderr
+
+    env = dict(os.environ, PYTHONPATH=str(target))
+    run = subprocess.run([sys.executable, str(target / 'bin' / 'stock-news-analyzer'), '--help'],
+                         cwd=tmp_path, env=env, capture_output=True, text=True)
+    assert run.returncode == 0, run.stderr
+    assert 'usage: stock-news-analyzer' in run.stdout
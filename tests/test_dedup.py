@@ -0,0 +1,44 @@
+from src.news_crawler.dedup import NearDuplicateIndex
+
+STORY = ('Apple shares rose sharply on Thursday after the company reported record '
+         'quarterly revenue driven by strong iPhone sales in China and Europe')
+
+
+def article(url: str, content: str = STORY, symbol: str = 'AAPL') -> dict:
+    return {'symbol': symbol, 'title': 'Apple beats estimates', 'content': content, 'url': url}
+
+
+def test_pending_articles_are_duplicates():
+    index = NearDuplicateIndex()
+    assert not index.is_duplicate(article('https://a.example/1'))
+    assert index.is_duplicate(article('https://a.example/1'))
+    assert index.is_duplicate(article('https://b.example/syndicated'))
+    assert not index.is_duplicate(article('https://b.example/1', symbol='MSFT'))
+
+
+def test_released_articles_are_new_again():
+    index = NearDuplicateIndex()
+    first = article('https://a.example/1')
+    assert not index.is_duplicate(first)
+    index.release([first])
+    assert not index.is_duplicate(article('https://a.example/1'))
+
+
+def test_committed_articles_persist(tmp_path):
+    path = str(tmp_path / 'dedup.db')
+    index = NearDuplicateIndex({'dedup_path': path})
+    stored, failed = article('https://a.example/1'), article('https://a.example/2', 'Unrelated text about a recall')
+    assert not index.is_duplicate(stored)
+    assert not index.is_duplicate(failed)
+    index.commit([stored])
+    index.close()
+
+    index = NearDuplicateIndex({'dedup_path': path})
+    assert index.is_duplicate(article('https://b.example/syndicated'))
+    assert not index.is_duplicate(article('https://a.example/2', 'Unrelated text about a recall'))
+
+
+def test_default_index_creates_no_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    NearDuplicateIndex().close()
+    assert list(tmp_path.iterdir()) == []
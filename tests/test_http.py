@@ -0,0 +1,18 @@
+"""
+HTTP transport tests
+"""
+
+from src.utils.http import HttpClient
+
+
+def test_pool_sizing():
+    client = HttpClient({'pool_maxsize': 20, 'pool_connections': 50,
+                         'host_pool_sizes': {'newsapi.org': 4}})
+    default = client.session.get_adapter('https://example.com/a')
+    assert default._pool_connections == 50
+    assert default._pool_maxsize == 20
+
+    host = client.session.get_adapter('https://newsapi.org/v2/everything')
+    assert host._pool_connections == 1
+    assert host._pool_maxsize == 4
+    client.close()
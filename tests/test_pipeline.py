@@ -0,0 +1,113 @@
+import pytest
+
+from src.pipeline.pipeline import StreamingPipeline
+from src.scheduler.scheduler import NewsScheduler
+
+
+class FakeCrawler:
+    def __init__(self, count: int):
+        self.news = [{'symbol': 'AAPL', 'title': f'Headline {i}', 'url': f'https://example.com/{i}'}
+                     for i in range(count)]
+        self.committed = []
+        self.released = []
+
+    def iter_news(self, symbols, days):
+        yield from self.news
+
+    def collect_news(self, symbol, days):
+        return list(self.news)
+
+    def commit(self, articles):
+        self.committed.extend(articles)
+
+    def release(self, articles):
+        self.released.extend(articles)
+
+
+class FakeAnalyzer:
+    def analyze_sentiment(self, news):
+        for article in news:
+            article['sentiment'] = {'compound': 0.5}
+        return news
+
+
+class BrokenAnalyzer:
+    def analyze_sentiment(self, news):
+        raise ValueError("model failed to load")
+
+
+class FlakyDatabase:
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.saved = []
+
+    def save_news(self, news):
+        if self.failures:
+            self.failures -= 1
+            return False
+        self.saved.extend(news)
+        return True
+
+
+def pipeline(crawler, database):
+    return StreamingPipeline(crawler, FakeAnalyzer(), database,
+                             {'commit_batch_size': 10, 'flush_interval': 0.05,
+                              'retry_backoff': 0.01})
+
+
+def test_retries_failed_commits():
+    crawler, database = FakeCrawler(25), FlakyDatabase(failures=2)
+    stats = pipeline(crawler, database).run(['AAPL'])
+
+    assert stats['stored'] == 25
+    assert stats['failed_commits'] == 0
+    assert len(crawler.committed) == 25 and not crawler.released
+
+
+def test_releases_articles_that_cannot_be_saved():
+    crawler, database = FakeCrawler(5), FlakyDatabase(failures=100)
+    stats = pipeline(crawler, database).run(['AAPL'])
+
+    assert stats['stored'] == 0
+    assert stats['failed_commits'] == 1
+    assert len(crawler.released) == 5 and not crawler.committed
+
+
+def test_scheduler_releases_articles_that_cannot_be_saved():
+    crawler, database = FakeCrawler(3), FlakyDatabase(failures=100)
+    scheduler = NewsScheduler(crawler, FakeAnalyzer(), database,
+                              config={'commit_retries': 1, 'retry_backoff': 0.01})
+
+    with pytest.raises(RuntimeError):
+        scheduler._process('AAPL')
+    assert len(crawler.released) == 3 and not crawler.committed
+
+    # Scoring fails before anything is saved
+    crawler, database = FakeCrawler(3), FlakyDatabase(failures=0)
+    scheduler = NewsScheduler(crawler, BrokenAnalyzer(), database)
+
+    with pytest.raises(ValueError):
+        scheduler._process('AAPL')
+    assert len(crawler.released) == 3 and not crawler.committed
+    assert not database.saved
+
+
+def test_scheduler_ignores_poll_of_removed_ticker():
+    crawler = FakeCrawler(3)
+    scheduler = NewsScheduler(crawler, FakeAnalyzer(), FlakyDatabase(failures=0))
+    scheduler.add_symbols(['AAPL'])
+    old = scheduler._tickers['AAPL']
+    old.running = True
+    scheduler._running = 1
+    norm = scheduler._rate_norm
+
+    # Removed and re-added while its poll is running
+    scheduler.remove_symbol('AAPL')
+    scheduler.add_symbols(['AAPL'])
+    new = scheduler._tickers['AAPL']
+    heap = list(scheduler._heap)
+    scheduler._poll(old)
+
+    assert scheduler._tickers['AAPL'] is new
+    assert scheduler._rate_norm == pytest.approx(norm)
+    assert scheduler._heap == heap
@@ -0,0 +1,115 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.analysis.streaming import StreamingSentimentAggregator
+
+WINDOWS = {'5m': 300, '30m': 1800, '2h': 7200}
+RESOLUTION = 60
+HALF_LIFE = 3600
+
+
+def brute_force(events, clock):
+    """Recompute a symbol's snapshot from all of its (score, seconds) events"""
+    head = int(clock // RESOLUTION)
+    scores = np.array([score for score, _ in events])
+    times = np.array([seconds for _, seconds in events])
+    buckets = (times // RESOLUTION).astype(int)
+
+    windows = {}
+    for name, length in WINDOWS.items():
+        inside = scores[head - buckets < length // RESOLUTION]
+        windows[name] = (len(inside), inside.mean() if len(inside) else 0.0,
+                         inside.std() if len(inside) else 0.0)
+
+    weights = 0.5 ** ((times.max() - times) / HALF_LIFE)
+    return {'count': len(scores), 'mean': scores.mean(), 'std': scores.std(),
+            'decayed_score': (scores * weights).sum() / weights.sum(), 'windows': windows}
+
+
+def assert_matches(snapshot, expected):
+    assert snapshot['count'] == expected['count']
+    assert snapshot['mean'] == pytest.approx(expected['mean'])
+    assert snapshot['std'] == pytest.approx(expected['std'])
+    assert snapshot['decayed_score'] == pytest.approx(expected['decayed_score'])
+    for name, (count, mean, std) in expected['windows'].items():
+        window = snapshot['windows'][name]
+        assert window['count'] == count, name
+        assert window['mean'] == pytest.approx(mean, abs=1e-9), name
+        assert window['std'] == pytest.approx(std, abs=1e-6), name
+
+
+def test_matches_brute_force_with_out_of_order_arrivals():
+    rng = random.Random(7)
+    aggregator = StreamingSentimentAggregator(WINDOWS, half_life=HALF_LIFE, resolution=RESOLUTION)
+    start = 1_700_000_000
+    # Eight hours of articles, arriving shuffled within a 3h delay, some
+    # of them older than the longest window when they arrive
+    events = [(rng.choice(['AAPL', 'MSFT']), rng.uniform(-1, 1),
+               start + rng.uniform(0, 8 * 3600)) for _ in range(3000)]
+    events.sort(key=lambda event: event[2] + rng.uniform(0, 3 * 3600))
+
+    seen = {'AAPL': [], 'MSFT': []}
+    for i, (symbol, score, seconds) in enumerate(events):
+        aggregator.update(symbol, score, seconds)
+        seen[symbol].append((score, seconds))
+        if i % 250 == 249:
+            clock = max(t for items in seen.values() for _, t in items)
+            for name, items in seen.items():
+                assert_matches(aggregator.snapshot(name), brute_force(items, clock))
+
+
+def test_windows_expire_across_bucket_boundaries():
+    aggregator = StreamingSentimentAggregator(WINDOWS, half_life=HALF_LIFE, resolution=RESOLUTION)
+    aggregator.update('AAPL', 1.0, 59.0)  # last second of bucket 0
+    aggregator.update('AAPL', -1.0, 60.0)  # first second of bucket 1
+
+    # A quiet symbol's windows move with the clock set by others
+    aggregator.update('MSFT', 0.0, 59.0 + 300)
+    assert aggregator.snapshot('AAPL')['windows']['5m']['count'] == 1
+    assert aggregator.snapshot('AAPL')['windows']['5m']['mean'] == -1.0
+    aggregator.update('MSFT', 0.0, 60.0 + 300)
+    assert aggregator.snapshot('AAPL')['windows']['5m']['count'] == 0
+    assert aggregator.snapshot('AAPL')['windows']['30m']['count'] == 2
+
+    # Far beyond the longest window everything has expired
+    aggregator.update('MSFT', 0.0, 60.0 + 10 * 7200)
+    snapshot = aggregator.snapshot('AAPL')
+    assert all(window['count'] == 0 for window in snapshot['windows'].values())
+    assert snapshot['count'] == 2
+
+
+def test_late_article_counts_only_in_windows_covering_it():
+    aggregator = StreamingSentimentAggregator(WINDOWS, half_life=HALF_LIFE, resolution=RESOLUTION)
+    aggregator.update('AAPL', 0.5, 10_000.0)
+    snapshot = aggregator.update('AAPL', -0.5, 10_000.0 - 1200)  # 20 minutes late
+    assert snapshot['windows']['5m']['count'] == 1
+    assert snapshot['windows']['30m']['count'] == 2
+
+    snapshot = aggregator.update('AAPL', 1.0, 10_000.0 - 3 * 3600)  # older than every window
+    assert [window['count'] for window in snapshot['windows'].values()] == [1, 2, 2]
+    assert snapshot['count'] == 3
+    assert snapshot['mean'] == pytest.approx(np.mean([0.5, -0.5, 1.0]))
+    assert snapshot['std'] == pytest.approx(np.std([0.5, -0.5, 1.0]))
+
+
+def test_decayed_score_halves_weight_per_half_life():
+    aggregator = StreamingSentimentAggregator(WINDOWS, half_life=HALF_LIFE, resolution=RESOLUTION)
+    aggregator.update('AAPL', 1.0, 0.0)
+    snapshot = aggregator.update('AAPL', -1.0, float(HALF_LIFE))
+    # Weights 0.5 and 1
+    assert snapshot['decayed_score'] == pytest.approx((0.5 - 1.0) / 1.5)
+
+    # A late article gets the weight it would have had if it arrived in order
+    snapshot = aggregator.update('AAPL', 1.0, 0.0)
+    assert snapshot['decayed_score'] == pytest.approx((0.5 + 0.5 - 1.0) / 2.0)
+
+
+def test_update_article_skips_unscored():
+    aggregator = StreamingSentimentAggregator()
+    article = {'symbol': 'AAPL', 'published_at': '2024-01-31T14:05:00Z'}
+    assert aggregator.update_article(article) is None
+    snapshot = aggregator.update_article(dict(article, sentiment={'compound': 0.4}))
+    assert snapshot['count'] == 1
+    assert snapshot['windows']['1h'] == {'count': 1, 'mean': 0.4, 'std': 0.0, 'zscore': 0.0}
@@ -0,0 +1,82 @@
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+from src.analysis.cache import TranslationCache
+from src.analysis.translation import SummaryTranslator, TranslationStage
+
+
+class FakeTranslator:
+    """deepl.Translator stand-in recording each request"""
+
+    def __init__(self, fail: bool = False):
+        self.requests = []
+        self.fail = fail
+
+    def translate_text(self, texts, target_lang):
+        self.requests.append(list(texts))
+        if self.fail:
+            raise RuntimeError("quota exceeded")
+        return [SimpleNamespace(text=f'{target_lang}:{text}') for text in texts]
+
+
+def test_batches_requests():
+    fake = FakeTranslator()
+    translator = SummaryTranslator(fake)
+    texts = [f'summary {i}' for i in range(120)]
+
+    assert translator.translate_batch(texts) == [f'ZH:{text}' for text in texts]
+    assert [len(request) for request in fake.requests] == [50, 50, 20]
+
+
+def test_skips_repeated_and_empty_texts():
+    fake = FakeTranslator()
+    translator = SummaryTranslator(fake, cache=TranslationCache())
+
+    assert translator.translate_batch(['a', 'b', 'a', '', '  ']) == ['ZH:a', 'ZH:b', 'ZH:a', '', '']
+    assert translator.translate_batch(['b', 'c']) == ['ZH:b', 'ZH:c']
+    assert fake.requests == [['a', 'b'], ['c']]
+
+
+def test_cache_persists_across_runs(tmp_path):
+    path = str(tmp_path / 'translations.db')
+    cache = TranslationCache(db_path=path)
+    SummaryTranslator(FakeTranslator(), cache=cache).translate_batch(['a', 'b'])
+    cache.close()
+
+    rows = sqlite3.connect(path).execute("SELECT COUNT(*) FROM translation_cache").fetchone()[0]
+    assert rows == 2
+
+    fake = FakeTranslator()
+    translator = SummaryTranslator(fake, cache=TranslationCache(db_path=path))
+    assert translator.translate_batch(['a', 'b']) == ['ZH:a', 'ZH:b']
+    assert fake.requests == []
+
+
+def test_cache_key_includes_language_and_conversion():
+    cache = TranslationCache()
+    fake = FakeTranslator()
+    SummaryTranslator(fake, 'ZH', cache=cache).translate('a')
+    SummaryTranslator(fake, 'JA', cache=cache).translate('a')
+    converted = SummaryTranslator(fake, 'ZH', cache=cache, convert=str.upper, convert_name='upper')
+
+    assert converted.translate('a') == 'ZH:A'
+    assert len(fake.requests) == 3
+
+
+def test_stage_resolves_futures_in_order():
+    fake = FakeTranslator()
+    with TranslationStage(SummaryTranslator(fake)) as stage:
+        futures = [stage.submit(f'summary {i}') for i in range(75)]
+
+    assert [future.result() for future in futures] == [f'ZH:summary {i}' for i in range(75)]
+    assert all(len(request) <= 50 for request in fake.requests)
+
+
+def test_stage_propagates_errors():
+    with TranslationStage(SummaryTranslator(FakeTranslator(fail=True))) as stage:
+        future = stage.submit('a')
+
+    with pytest.raises(RuntimeError):
+        future.result()
@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta
+
+from src.database.watermarks import PendingWatermarks, WatermarkStore
+from src.news_crawler.news_crawler import NewsCrawler
+
+
+def article(i: int, symbol: str = 'AAPL') -> dict:
+    published = datetime(2024, 1, 1) + timedelta(hours=i)
+    return {'symbol': symbol, 'title': f'Headline number {i} about earnings',
+            'content': f'Story {i} ' + 'words ' * i, 'url': f'https://example.com/{symbol}/{i}',
+            'published_at': published.strftime('%Y-%m-%dT%H:%M:%SZ')}
+
+
+def test_advances_only_when_all_articles_commit(tmp_path):
+    store = WatermarkStore({'db_path': str(tmp_path / 'news.db')})
+    pending = PendingWatermarks(store)
+    articles = [article(1), article(2)]
+    pending.track('AAPL', 'reuters', articles)
+
+    pending.commit(articles[1:])
+    assert store.get('AAPL', 'reuters') is None
+    pending.commit(articles[:1])
+    assert store.get('AAPL', 'reuters')['url'] == articles[1]['url']
+
+
+def test_release_keeps_watermark(tmp_path):
+    store = WatermarkStore({'db_path': str(tmp_path / 'news.db')})
+    pending = PendingWatermarks(store)
+    articles = [article(1), article(2)]
+    pending.track('AAPL', 'reuters', articles)
+
+    pending.commit(articles[:1])
+    pending.release(articles[1:])
+    pending.commit(articles[1:])
+    assert store.get('AAPL', 'reuters') is None
+
+
+class FakeCrawler(NewsCrawler):
+    def __init__(self, config):
+        super().__init__(config)
+        self.news = [article(i) for i in range(3)]
+
+    def _reuters(self, symbol, days):
+        return [dict(item) for item in self.news]
+
+    def _yahoo_finance(self, symbol, days):
+        return []
+
+    def _bloomberg(self, symbol, days):
+        return []
+
+
+def test_crawler_advances_on_commit(tmp_path):
+    store = WatermarkStore({'db_path': str(tmp_path / 'news.db')})
+    first = FakeCrawler({'watermarks': store}).collect_news('AAPL')
+    assert len(first) == 3
+    assert store.get('AAPL', 'reuters') is None
+
+    crawler = FakeCrawler({'watermarks': store})
+    second = crawler.collect_news('AAPL')
+    assert len(second) == 3
+    crawler.commit(second)
+    assert store.get('AAPL', 'reuters')['url'] == first[-1]['url']
+    assert crawler.collect_news('AAPL') == []
+
+
+def test_crawler_returns_released_articles_again(tmp_path):
+    store = WatermarkStore({'db_path': str(tmp_path / 'news.db')})
+    crawler = FakeCrawler({'watermarks': store})
+
+    first = crawler.collect_news('AAPL')
+    crawler.release(first)
+    second = crawler.collect_news('AAPL')
+    assert [item['url'] for item in second] == [item['url'] for item in first]
+
+    crawler.commit(second)
+    crawler.news.append(article(3))
+    assert [item['url'] for item in crawler.collect_news('AAPL')] == [article(3)['url']]